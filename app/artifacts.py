@@ -0,0 +1,127 @@
+import hashlib
+import os
+import stat
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+import anyio
+from fastapi import HTTPException, Request, status
+from fastapi.responses import FileResponse, Response
+
+from app.config import settings
+
+# Job outputs are written once under a fresh job directory and never modified,
+# so a URL always names the same bytes and can be cached for good.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ETagCache:
+    """
+    Strong ETags (sha256 of the content) for output files.
+
+    A file is hashed the first time it is served; the tag is kept for as long
+    as the file's size and mtime are unchanged.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._tags: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, stat_result: os.stat_result) -> str:
+        key = (str(path), stat_result.st_size, stat_result.st_mtime_ns)
+        with self._lock:
+            tag = self._tags.get(key)
+            if tag is not None:
+                self._tags.move_to_end(key)
+                return tag
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(settings.artifact_chunk_size):
+                digest.update(chunk)
+        tag = f'"{digest.hexdigest()}"'
+
+        with self._lock:
+            self._tags[key] = tag
+            while len(self._tags) > self.max_entries:
+                self._tags.popitem(last=False)
+        return tag
+
+
+etag_cache = ETagCache()
+
+
+class ArtifactResponse(FileResponse):
+    """FileResponse with a strong ETag, used for If-Range as well"""
+
+    chunk_size = settings.artifact_chunk_size
+
+    def _should_use_range(self, http_if_range: str, stat_result: os.stat_result) -> bool:
+        # If-Range requires a strong comparison; our ETag is the content hash
+        return http_if_range == self.headers["etag"] or (
+            http_if_range == formatdate(stat_result.st_mtime, usegmt=True)
+        )
+
+
+def resolve_artifact(path: str) -> tuple[Path, os.stat_result]:
+    """Map a URL path under /outputs to a regular file inside the output directory"""
+    root = Path(settings.output_dir).resolve()
+    target = (root / path).resolve()
+    if root not in target.parents:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    try:
+        stat_result = target.stat()
+    except OSError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return target, stat_result
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so W/ prefixes are ignored"""
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def not_modified_since(if_modified_since: str, stat_result: os.stat_result) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(stat_result.st_mtime) <= since
+
+
+async def serve_artifact(path: str, request: Request) -> Response:
+    """
+    Serve a job output file.
+
+    Responses carry a strong ETag and an immutable Cache-Control header.
+    If-None-Match (or, without it, If-Modified-Since) answers 304; Range
+    requests get 206 partial content, honouring If-Range, so clients can
+    seek in and resume downloads of large stems.
+    """
+    target, stat_result = resolve_artifact(path)
+    etag = await anyio.to_thread.run_sync(etag_cache.get, target, stat_result)
+    headers = {
+        "etag": etag,
+        "cache-control": IMMUTABLE_CACHE_CONTROL,
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+    }
+
+    if_none_match: Optional[str] = request.headers.get("if-none-match")
+    if_modified_since: Optional[str] = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = etag_matches(if_none_match, etag)
+    else:
+        not_modified = if_modified_since is not None and not_modified_since(if_modified_since, stat_result)
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return ArtifactResponse(target, headers=headers, stat_result=stat_result)
@@ -1,11 +1,12 @@
 from celery import Celery
 from app.config import settings
+import app.progress  # noqa: F401  registers progress publishing signal handlers
 
 celery_app = Celery(
     "hiserver",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=["app.tasks.audio_tasks", "app.tasks.chord_tasks"]
+    include=["app.tasks.audio_tasks", "app.tasks.chord_tasks", "app.tasks.e2e_tasks"]
 )
 
 celery_app.conf.update(
@@ -17,4 +18,12 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=3600,  # 1 hour max
     task_soft_time_limit=3300,  # 55 minutes soft limit
+    # Heavy separation and light analysis stages go to separate worker pools;
+    # everything else stays on the default "celery" queue
+    task_routes={
+        "app.tasks.audio_tasks.audio_separation_task": {"queue": "separation"},
+        "app.tasks.e2e_tasks.e2e_separation_stage": {"queue": "separation"},
+        "app.tasks.e2e_tasks.e2e_transcription_stage": {"queue": "analysis"},
+        "app.tasks.e2e_tasks.e2e_chord_stage": {"queue": "analysis"},
+    },
 )
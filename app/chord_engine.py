@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+# Add halmoni to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../halmoni'))
+
+from halmoni import Chord, ChordSuggestionEngine, Key, Note
+
+# The API process keeps one suggestion engine for its lifetime. It is built
+# and warmed up at startup; /ready reports when warmup has finished.
+_engine: Optional[ChordSuggestionEngine] = None
+_warmup_seconds: Optional[float] = None
+
+
+def get_suggestion_engine() -> ChordSuggestionEngine:
+    """Return the process-wide chord suggestion engine"""
+    global _engine
+    if _engine is None:
+        _engine = ChordSuggestionEngine()
+    return _engine
+
+
+def warm_up_suggestion_engine() -> float:
+    """Build the engine and precompute its per-key tables; returns the time taken"""
+    global _warmup_seconds
+    start = time.perf_counter()
+    get_suggestion_engine().warmup()
+    _warmup_seconds = time.perf_counter() - start
+    print(f"Chord suggestion engine warmed up in {_warmup_seconds:.2f}s")
+    return _warmup_seconds
+
+
+def suggestion_engine_ready() -> bool:
+    """Whether the engine has finished warming up"""
+    return _engine is not None and _engine.warmed_up
+
+
+def warmup_seconds() -> Optional[float]:
+    return _warmup_seconds
+
+
+def parse_key_string(key_str: Optional[str]) -> Key:
+    """Parse a key string like 'G# Major' into a Key (C major if missing or malformed)"""
+    if key_str:
+        parts = key_str.strip().split()
+        if len(parts) == 2:
+            tonic_str, mode_str = parts
+            return Key(Note(tonic_str, 4), mode_str.lower())
+    return Key(Note('C', 4), 'major')
+
+
+def parse_chord_file(filename: str, text_content: str) -> tuple[Key, list[str]]:
+    """
+    Read the key and chord symbols from an uploaded chord progression.
+
+    JSON files carry 'key' and 'chords' [{'symbol': ...}]; text files have an
+    optional 'Key: ...' line and chords separated by '-'.
+    """
+    if filename.endswith('.json'):
+        data = json.loads(text_content)
+        key = parse_key_string(data.get('key'))
+        chord_symbols = [c['symbol'] for c in data['chords']]
+    else:
+        lines = text_content.split('\n')
+        key = parse_key_string(None)
+        for line in lines:
+            if line.startswith('Key:'):
+                key_str = line.replace('Key:', '').strip()
+                key = parse_key_string(key_str)
+                break
+        chord_line = [l for l in lines if '-' in l][0] if any('-' in l for l in lines) else ''
+        chord_symbols = [c.strip() for c in chord_line.split('-')]
+    return key, chord_symbols
+
+
+def parse_chord_symbol(symbol: str) -> Chord:
+    """Chord for a symbol; halmoni caches parses and interns the chords"""
+    return Chord.from_symbol(symbol)
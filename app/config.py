@@ -11,16 +11,54 @@ class Settings(BaseSettings):
     # Celery settings
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
+    redis_url: str = "redis://localhost:6379/0"
 
     # File storage settings
     upload_dir: str = "./uploads"
     output_dir: str = "./outputs"
+    # Bytes per read when hashing and streaming output files
+    artifact_chunk_size: int = 1024 * 1024
 
     # Task settings
     max_file_size: int = 100 * 1024 * 1024  # 100MB
+    upload_chunk_size: int = 1024 * 1024  # 1MB streamed per read
     supported_audio_formats: list[str] = [
         "mp3", "wav", "ogg", "flac", "m4a", "aac", "wma"
     ]
+    # Reuse finished jobs for identical input and parameters
+    job_dedup_enabled: bool = True
+    # Seconds between keepalive comments on idle progress streams
+    progress_stream_keepalive: float = 15.0
+
+    # Separation model settings
+    separation_model: str = "htdemucs"
+    separation_model_memory_budget_mb: int = 2048  # 0 = unlimited
+    separation_preload_models: list[str] = ["htdemucs"]
+    # Long recordings are separated in overlapping segments to bound memory
+    separation_segment_seconds: float = 60.0  # 0 = whole track at once
+    separation_overlap_seconds: float = 1.0
+
+    # Separated stem cache (all stems, keyed by audio hash + model + version)
+    stem_cache_dir: str = "./cache/stems"
+    stem_cache_max_mb: int = 10240  # 0 = unlimited
+
+    # Separated stem output encoding
+    stem_output_format: str = "opus"  # opus, flac or wav
+    opus_bitrate_kbps: int = 160
+    flac_compression_level: int = 5  # 0-8
+    stem_encoder_workers: int = 4
+
+    # Basic Pitch ONNX Runtime settings
+    onnx_intra_op_num_threads: int = 0  # 0 = onnxruntime default
+    onnx_inter_op_num_threads: int = 0
+    onnx_graph_optimization_level: str = "all"  # disable, basic, extended, all
+    onnx_enable_cpu_mem_arena: bool = True
+    onnx_enable_mem_pattern: bool = True
+    basic_pitch_batch_size: int = 0  # windows per inference call, 0 = from available memory
+
+    # Alternative-chord suggestion sessions (kept in the API process)
+    suggestion_session_ttl: float = 3600.0  # seconds idle before a session expires
+    suggestion_session_max: int = 1000
 
     class Config:
         env_file = ".env"
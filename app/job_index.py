@@ -0,0 +1,84 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+import redis.asyncio as redis
+from celery.result import AsyncResult
+
+from app.config import settings
+from app.celery_app import celery_app
+
+_redis: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Shared async Redis client for the API process"""
+    global _redis
+    if _redis is None:
+        _redis = redis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+def job_key(kind: str, sha256: str, params: dict[str, Any]) -> str:
+    """Index key for a task kind run on given input content with given parameters"""
+    params_hash = hashlib.sha256(
+        json.dumps(params, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"hiserver:jobs:{kind}:{sha256}:{params_hash}"
+
+
+def _output_urls(value: Any):
+    """Yield every /outputs/ URL in a task result"""
+    if isinstance(value, str):
+        if value.startswith("/outputs/"):
+            yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _output_urls(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _output_urls(v)
+
+
+def outputs_exist(result: Any) -> bool:
+    """Whether every output file referenced by a task result is still on disk"""
+    output_dir = Path(settings.output_dir)
+    for url in _output_urls(result):
+        if not (output_dir / url[len("/outputs/"):]).is_file():
+            return False
+    return True
+
+
+async def find_completed_job(kind: str, sha256: str, params: dict[str, Any]) -> Optional[str]:
+    """
+    Return the ID of an earlier successful job for the same input and parameters.
+
+    Only jobs whose outputs are still on disk are reused; stale entries are dropped.
+    """
+    if not settings.job_dedup_enabled:
+        return None
+
+    key = job_key(kind, sha256, params)
+    job_id = await get_redis().get(key)
+    if not job_id:
+        return None
+
+    result = AsyncResult(job_id, app=celery_app)
+    if result.state == 'SUCCESS' and outputs_exist(result.result):
+        return job_id
+
+    if result.state in ['FAILURE', 'SUCCESS']:
+        await get_redis().delete(key)
+    return None
+
+
+async def remember_job(kind: str, sha256: str, params: dict[str, Any], job_id: str) -> None:
+    """Record a newly enqueued job for later deduplication"""
+    if not settings.job_dedup_enabled:
+        return
+
+    # Don't let index entries outlive the task results they point to
+    expires = celery_app.conf.result_expires
+    ttl = int(expires.total_seconds()) if hasattr(expires, "total_seconds") else expires
+    await get_redis().set(job_key(kind, sha256, params), job_id, ex=ttl or None)
@@ -1,27 +1,49 @@
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, status
-from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from typing import Any, Optional
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, status
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from celery.result import AsyncResult
 
 from app.config import settings
 from app.celery_app import celery_app
+from app.upload_store import save_upload
+from app.job_index import find_completed_job, remember_job
+from app.progress import progress_broker, TERMINAL_STATES
+from app.artifacts import serve_artifact
+from app.chord_engine import (
+    get_suggestion_engine, warm_up_suggestion_engine, suggestion_engine_ready, warmup_seconds,
+    parse_chord_file, parse_chord_symbol
+)
+from app.suggestion_sessions import suggestion_sessions
 from app.schemas import (
     Error, JobEnqueueResponse, JobStatusResponse, JobStatus,
     AudioSeparationResult, AudioTranscriptionResult, ChordRecognitionResult,
     E2EBaseResult, EasierChordResult, ChordComplexificationResult,
     AlternativeChordRequest, AlternativeChordResponse, AlternativeChord,
+    SuggestionSessionResponse, ChordEditRequest,
     ChartFormat
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the chord suggestion engine without delaying startup"""
+    warmup = asyncio.create_task(asyncio.to_thread(warm_up_suggestion_engine))
+    yield
+    warmup.cancel()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_title,
     version=settings.app_version,
     description=settings.app_description,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -37,23 +59,25 @@ app.add_middleware(
 Path(settings.upload_dir).mkdir(parents=True, exist_ok=True)
 Path(settings.output_dir).mkdir(parents=True, exist_ok=True)
 
-# Mount static files for outputs
-app.mount("/outputs", StaticFiles(directory=settings.output_dir), name="outputs")
 
+@app.api_route("/outputs/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def get_output_artifact(path: str, request: Request):
+    """Serve job outputs with strong ETags, conditional GET and Range support"""
+    return await serve_artifact(path, request)
 
-def get_job_status_from_celery(task_id: str) -> JobStatusResponse:
-    """Convert Celery task state to JobStatusResponse"""
-    result = AsyncResult(task_id, app=celery_app)
 
+def job_status_response(task_id: str, state: str, info: Any = None) -> JobStatusResponse:
+    """Convert a Celery task state and its info/meta to JobStatusResponse"""
     status_map = {
         'PENDING': JobStatus.QUEUED,
         'STARTED': JobStatus.PROCESSING,
         'PROGRESS': JobStatus.PROCESSING,
         'SUCCESS': JobStatus.COMPLETED,
         'FAILURE': JobStatus.FAILED,
+        'REVOKED': JobStatus.FAILED,
     }
 
-    job_status = status_map.get(result.state, JobStatus.QUEUED)
+    job_status = status_map.get(state, JobStatus.QUEUED)
 
     response = JobStatusResponse(
         jobId=task_id,
@@ -61,23 +85,48 @@ def get_job_status_from_celery(task_id: str) -> JobStatusResponse:
         updatedAt=datetime.utcnow()
     )
 
-    if result.state == 'PROGRESS':
-        meta = result.info or {}
+    if state == 'PROGRESS':
+        meta = info or {}
         response.progressPercent = meta.get('percent', 0)
 
-    if result.state == 'SUCCESS':
+    if state == 'SUCCESS':
         response.completedAt = datetime.utcnow()
         response.progressPercent = 100
 
-    if result.state == 'FAILURE':
+    if state == 'FAILURE':
         response.error = Error(
             code="TASK_FAILED",
-            message=str(result.info) if result.info else "Task failed"
+            message=str(info) if info else "Task failed"
         )
 
+    if state == 'REVOKED':
+        response.error = Error(code="TASK_REVOKED", message="Task was revoked")
+
     return response
 
 
+def get_job_status_from_celery(task_id: str) -> JobStatusResponse:
+    """Convert Celery task state to JobStatusResponse"""
+    result = AsyncResult(task_id, app=celery_app)
+    return job_status_response(task_id, result.state, result.info)
+
+
+def job_status_from_event(event: dict[str, Any]) -> JobStatusResponse:
+    """Convert a published progress event to JobStatusResponse"""
+    meta = event.get('meta') or {}
+    info = meta.get('error') if event['state'] == 'FAILURE' else meta
+    return job_status_response(event['jobId'], event['state'], info)
+
+
+def completed_job_response(job_id: str) -> JobEnqueueResponse:
+    """Enqueue response pointing at an earlier job with the same input and parameters"""
+    return JobEnqueueResponse(
+        jobId=job_id,
+        status=JobStatus.COMPLETED,
+        queuedAt=datetime.utcnow()
+    )
+
+
 # ============================================
 # Audio Separation Endpoints
 # ============================================
@@ -100,16 +149,20 @@ async def enqueue_audio_separation(
         raise HTTPException(status_code=400, detail="No file provided")
 
     # Save uploaded file
-    file_path = Path(settings.upload_dir) / audio_file.filename
-    with open(file_path, "wb") as f:
-        content = await audio_file.read()
-        f.write(content)
+    upload = await save_upload(audio_file)
 
     # Parse instruments
     instruments_list = [i.strip() for i in instruments.split(',')]
 
+    # Reuse an earlier job for the same audio and instruments
+    params = {'instruments': instruments_list}
+    existing_job_id = await find_completed_job('audio-separation', upload.sha256, params)
+    if existing_job_id:
+        return completed_job_response(existing_job_id)
+
     # Enqueue task
-    task = audio_separation_task.apply_async(args=[str(file_path), instruments_list])
+    task = audio_separation_task.apply_async(args=[str(upload.path), instruments_list])
+    await remember_job('audio-separation', upload.sha256, params, task.id)
 
     return JobEnqueueResponse(
         jobId=task.id,
@@ -164,13 +217,17 @@ async def enqueue_audio_transcription(
     from app.tasks.audio_tasks import audio_transcription_task
 
     # Save uploaded file
-    file_path = Path(settings.upload_dir) / audio_file.filename
-    with open(file_path, "wb") as f:
-        content = await audio_file.read()
-        f.write(content)
+    upload = await save_upload(audio_file)
+
+    # Reuse an earlier job for the same input and parameters
+    params = {'instrument': instrument, 'engine': engine}
+    existing_job_id = await find_completed_job('audio-transcription', upload.sha256, params)
+    if existing_job_id:
+        return completed_job_response(existing_job_id)
 
     # Enqueue task
-    task = audio_transcription_task.apply_async(args=[str(file_path), instrument, engine])
+    task = audio_transcription_task.apply_async(args=[str(upload.path), instrument, engine])
+    await remember_job('audio-transcription', upload.sha256, params, task.id)
 
     return JobEnqueueResponse(
         jobId=task.id,
@@ -224,13 +281,17 @@ async def enqueue_chord_recognition(
     from app.tasks.chord_tasks import chord_recognition_task
 
     # Save uploaded file
-    file_path = Path(settings.upload_dir) / midi_file.filename
-    with open(file_path, "wb") as f:
-        content = await midi_file.read()
-        f.write(content)
+    upload = await save_upload(midi_file)
+
+    # Reuse an earlier job for the same input and parameters
+    params = {'format': format.value}
+    existing_job_id = await find_completed_job('chord-recognition', upload.sha256, params)
+    if existing_job_id:
+        return completed_job_response(existing_job_id)
 
     # Enqueue task
-    task = chord_recognition_task.apply_async(args=[str(file_path), format.value])
+    task = chord_recognition_task.apply_async(args=[str(upload.path), format.value])
+    await remember_job('chord-recognition', upload.sha256, params, task.id)
 
     return JobEnqueueResponse(
         jobId=task.id,
@@ -281,19 +342,23 @@ async def enqueue_e2e_base_ready(
     instrument: str = Form(...)
 ):
     """Enqueue E2E base ready for reharmonization task"""
-    from app.tasks.chord_tasks import e2e_base_ready_task
+    from app.tasks.e2e_tasks import start_e2e_pipeline
 
     # Save uploaded file
-    file_path = Path(settings.upload_dir) / audio_file.filename
-    with open(file_path, "wb") as f:
-        content = await audio_file.read()
-        f.write(content)
+    upload = await save_upload(audio_file)
 
-    # Enqueue task
-    task = e2e_base_ready_task.apply_async(args=[str(file_path), instrument])
+    # Reuse an earlier job for the same input and parameters
+    params = {'instrument': instrument}
+    existing_job_id = await find_completed_job('e2e-base-ready', upload.sha256, params)
+    if existing_job_id:
+        return completed_job_response(existing_job_id)
+
+    # Enqueue the separation -> transcription -> chord recognition pipeline
+    job_id = start_e2e_pipeline(str(upload.path), instrument)
+    await remember_job('e2e-base-ready', upload.sha256, params, job_id)
 
     return JobEnqueueResponse(
-        jobId=task.id,
+        jobId=job_id,
         status=JobStatus.QUEUED,
         queuedAt=datetime.utcnow()
     )
@@ -345,15 +410,19 @@ async def enqueue_easier_chord_recommendation(
     from app.tasks.chord_tasks import easier_chord_recommendation_task
 
     # Save uploaded file
-    file_path = Path(settings.upload_dir) / chord_file.filename
-    with open(file_path, "wb") as f:
-        content = await chord_file.read()
-        f.write(content)
+    upload = await save_upload(chord_file)
+
+    # Reuse an earlier job for the same input and parameters
+    params = {'target_instrument': target_instrument, 'format': format.value}
+    existing_job_id = await find_completed_job('easier-chord-recommendation', upload.sha256, params)
+    if existing_job_id:
+        return completed_job_response(existing_job_id)
 
     # Enqueue task
     task = easier_chord_recommendation_task.apply_async(
-        args=[str(file_path), target_instrument, format.value]
+        args=[str(upload.path), target_instrument, format.value]
     )
+    await remember_job('easier-chord-recommendation', upload.sha256, params, task.id)
 
     return JobEnqueueResponse(
         jobId=task.id,
@@ -393,6 +462,38 @@ async def get_easier_chord_recommendation_result(jobId: str):
 # Alternative Chord Recommendation (Operation)
 # ============================================
 
+async def read_chord_progression(chord_file: UploadFile):
+    """Parse an uploaded chord progression into its key, symbols and ChordProgression"""
+    from halmoni import ChordProgression
+
+    content = await chord_file.read()
+    key, chord_symbols = parse_chord_file(chord_file.filename or "", content.decode('utf-8'))
+
+    try:
+        chords = [parse_chord_symbol(sym) for sym in chord_symbols]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid chord symbol: {e}")
+
+    return key, chord_symbols, ChordProgression(chords=chords, key=key)
+
+
+def alternative_chord_response(original_chord: str, suggestions) -> AlternativeChordResponse:
+    """Format the top 5 suggestions for a position"""
+    alternatives = [
+        AlternativeChord(
+            chord=str(sug.chord),
+            confidence=sug.confidence,
+            reasoning=sug.reasoning
+        )
+        for sug in suggestions[:5]  # Top 5 alternatives
+    ]
+
+    return AlternativeChordResponse(
+        originalChord=original_chord,
+        alternatives=alternatives
+    )
+
+
 @app.post(
     "/operations/alternative-chord-recommendation",
     response_model=AlternativeChordResponse,
@@ -403,56 +504,109 @@ async def alternative_chord_recommendation(
     chord_index: int = Form(...)
 ):
     """Get alternative chord recommendations (synchronous operation)"""
-    from halmoni import ChordProgression, Key, Chord, ChordSuggestionEngine
-    import json
-
-    # Read uploaded file
-    content = await chord_file.read()
-    text_content = content.decode('utf-8')
-
-    # Parse chord progression
-    if chord_file.filename.endswith('.json'):
-        data = json.loads(text_content)
-        key_str = data.get('key')
-        key = Key.from_string(key_str) if key_str else Key('C', 'major')
-        chord_symbols = [c['symbol'] for c in data['chords']]
-    else:
-        lines = text_content.split('\n')
-        key = Key('C', 'major')
-        for line in lines:
-            if line.startswith('Key:'):
-                key_str = line.replace('Key:', '').strip()
-                key = Key.from_string(key_str)
-                break
-        chord_line = [l for l in lines if '-' in l][0] if any('-' in l for l in lines) else ''
-        chord_symbols = [c.strip() for c in chord_line.split('-')]
+    key, chord_symbols, progression = await read_chord_progression(chord_file)
 
     if chord_index < 0 or chord_index >= len(chord_symbols):
         raise HTTPException(status_code=400, detail="Invalid chord index")
 
-    chords = [Chord.from_symbol(sym) for sym in chord_symbols]
-    progression = ChordProgression(chords=chords, key=key)
-
     # Get suggestions for the specified position
-    engine = ChordSuggestionEngine()
+    engine = get_suggestion_engine()
     suggestions = engine.get_suggestions_for_position(progression, chord_index, key)
 
-    # Format alternatives
-    alternatives = [
-        AlternativeChord(
-            chord=str(sug.chord),
-            confidence=sug.confidence,
-            reasoning=sug.reasoning
-        )
-        for sug in suggestions[:5]  # Top 5 alternatives
-    ]
+    return alternative_chord_response(chord_symbols[chord_index], suggestions)
 
-    return AlternativeChordResponse(
-        originalChord=chord_symbols[chord_index],
-        alternatives=alternatives
+
+# ============================================
+# Suggestion Sessions (Operation)
+# ============================================
+
+def suggestion_session_response(session_id: str, session, invalidated: Optional[list[int]] = None):
+    """Describe a suggestion session's current progression"""
+    return SuggestionSessionResponse(
+        sessionId=session_id,
+        key=str(session.key) if session.key else None,
+        chords=session.progression.chord_symbols,
+        invalidatedPositions=invalidated or [],
     )
 
 
+def get_suggestion_session(session_id: str):
+    session = suggestion_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Suggestion session not found")
+    return session
+
+
+@app.post(
+    "/operations/suggestion-sessions",
+    response_model=SuggestionSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["operations"]
+)
+async def create_suggestion_session(chord_file: UploadFile = File(...)):
+    """Open a session for an edited progression; suggestions are cached per position"""
+    key, _, progression = await read_chord_progression(chord_file)
+    session_id = suggestion_sessions.create(progression, key)
+    return suggestion_session_response(session_id, get_suggestion_session(session_id))
+
+
+@app.get(
+    "/operations/suggestion-sessions/{sessionId}",
+    response_model=SuggestionSessionResponse,
+    tags=["operations"]
+)
+async def get_suggestion_session_state(sessionId: str):
+    """Get the current progression of a suggestion session"""
+    return suggestion_session_response(sessionId, get_suggestion_session(sessionId))
+
+
+@app.put(
+    "/operations/suggestion-sessions/{sessionId}/chords/{chordIndex}",
+    response_model=SuggestionSessionResponse,
+    tags=["operations"]
+)
+async def edit_suggestion_session_chord(sessionId: str, chordIndex: int, edit: ChordEditRequest):
+    """Replace one chord; only positions whose context includes it are recomputed"""
+    session = get_suggestion_session(sessionId)
+
+    if chordIndex < 0 or chordIndex >= len(session.progression):
+        raise HTTPException(status_code=400, detail="Invalid chord index")
+    try:
+        chord = parse_chord_symbol(edit.symbol)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid chord symbol: {e}")
+
+    invalidated = session.substitute_chord(chordIndex, chord)
+    return suggestion_session_response(sessionId, session, invalidated)
+
+
+@app.get(
+    "/operations/suggestion-sessions/{sessionId}/alternatives/{chordIndex}",
+    response_model=AlternativeChordResponse,
+    tags=["operations"]
+)
+async def get_suggestion_session_alternatives(sessionId: str, chordIndex: int):
+    """Get alternative chord recommendations for a position of the session's progression"""
+    session = get_suggestion_session(sessionId)
+
+    if chordIndex < 0 or chordIndex >= len(session.progression):
+        raise HTTPException(status_code=400, detail="Invalid chord index")
+
+    suggestions = session.get_suggestions_for_position(chordIndex)
+    return alternative_chord_response(session.progression.chord_symbols[chordIndex], suggestions)
+
+
+@app.delete(
+    "/operations/suggestion-sessions/{sessionId}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    tags=["operations"]
+)
+async def delete_suggestion_session(sessionId: str):
+    """Close a suggestion session"""
+    if not suggestion_sessions.delete(sessionId):
+        raise HTTPException(status_code=404, detail="Suggestion session not found")
+
+
 # ============================================
 # Chord Complexification Endpoints
 # ============================================
@@ -472,14 +626,11 @@ async def enqueue_chord_complexification(
     from app.tasks.chord_tasks import chord_complexification_task
 
     # Save uploaded file
-    file_path = Path(settings.upload_dir) / chord_file.filename
-    with open(file_path, "wb") as f:
-        content = await chord_file.read()
-        f.write(content)
+    upload = await save_upload(chord_file)
 
     # Enqueue task
     task = chord_complexification_task.apply_async(
-        args=[str(file_path), target_style, format.value]
+        args=[str(upload.path), target_style, format.value]
     )
 
     return JobEnqueueResponse(
@@ -516,12 +667,79 @@ async def get_chord_complexification_result(jobId: str):
         raise HTTPException(status_code=404, detail="Job not found or failed")
 
 
+# ============================================
+# Job Progress Stream
+# ============================================
+
+def sse_event(response: JobStatusResponse) -> str:
+    """Format a status update as a Server-Sent Event"""
+    return f"event: status\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
+
+
+@app.get(
+    "/tasks/events/{jobId}",
+    response_class=StreamingResponse,
+    tags=["tasks"]
+)
+async def stream_job_events(jobId: str, request: Request):
+    """
+    Stream job status updates as Server-Sent Events.
+
+    Works for every task kind. Sends the current status first, then one event
+    per progress update, and closes once the job completes or fails. All
+    clients watching a job share a single Redis subscription.
+    """
+    async def events():
+        queue = await progress_broker.subscribe(jobId)
+        try:
+            # Subscribed before reading the snapshot, so no update falls in between
+            current = await asyncio.to_thread(get_job_status_from_celery, jobId)
+            yield sse_event(current)
+            if current.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return
+
+            while not await request.is_disconnected():
+                try:
+                    event: Optional[dict] = await asyncio.wait_for(
+                        queue.get(), timeout=settings.progress_stream_keepalive
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    # Subscription lost; the client reconnects and gets a fresh snapshot
+                    return
+                yield sse_event(job_status_from_event(event))
+                if event['state'] in TERMINAL_STATES:
+                    return
+        finally:
+            progress_broker.unsubscribe(jobId, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "hiserver"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: ready once the chord suggestion engine is warmed up"""
+    if not suggestion_engine_ready():
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up", "service": "hiserver"}
+        )
+    return {"status": "ready", "service": "hiserver", "warmupSeconds": warmup_seconds()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,145 @@
+import asyncio
+import json
+from typing import Any, Optional
+
+import redis
+from celery.signals import task_prerun, task_postrun
+
+from app.config import settings
+
+CHANNEL_PREFIX = "hiserver:progress:"
+TERMINAL_STATES = ('SUCCESS', 'FAILURE', 'REVOKED')
+
+_publisher: Optional[redis.Redis] = None
+
+
+def progress_channel(job_id: str) -> str:
+    """Redis pub/sub channel carrying state changes for one job"""
+    return f"{CHANNEL_PREFIX}{job_id}"
+
+
+def publish_progress(job_id: str, state: str, meta: Optional[dict[str, Any]] = None) -> None:
+    """
+    Publish a job state change to its progress channel (worker side).
+
+    Publishing is best effort: a Redis hiccup must never fail the task itself.
+    """
+    global _publisher
+    try:
+        if _publisher is None:
+            _publisher = redis.Redis.from_url(settings.redis_url)
+        event = {'jobId': job_id, 'state': state, 'meta': meta or {}}
+        _publisher.publish(progress_channel(job_id), json.dumps(event))
+    except Exception as e:
+        print(f"Warning: Failed to publish progress for {job_id}: {e}")
+
+
+@task_prerun.connect
+def publish_task_started(task_id=None, **kwargs):
+    """Announce that a worker picked the job up"""
+    publish_progress(task_id, 'STARTED')
+
+
+@task_postrun.connect
+def publish_task_finished(task_id=None, state=None, retval=None, **kwargs):
+    """Publish the final state so stream subscribers can close"""
+    meta = {}
+    if state == 'FAILURE' and retval is not None:
+        meta['error'] = str(retval)
+    publish_progress(task_id, state or 'SUCCESS', meta)
+
+
+class ProgressBroker:
+    """
+    Fans job progress events out to streaming clients (API side).
+
+    Each job with at least one connected client gets exactly one Redis
+    subscription, whose messages are copied into a queue per client. The
+    subscription is dropped when the last client for the job disconnects.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._readers: dict[str, asyncio.Task] = {}
+        self._ready: dict[str, asyncio.Event] = {}
+        self._redis = None
+
+    def _client(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+        return self._redis
+
+    async def subscribe(self, job_id: str, timeout: float = 5.0) -> asyncio.Queue:
+        """
+        Register a client for a job's events.
+
+        Returns once the job's Redis subscription is active (or failed to
+        start within timeout), so a status snapshot read afterwards can't miss
+        an update published in between.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        if job_id not in self._readers:
+            self._ready[job_id] = asyncio.Event()
+            self._readers[job_id] = asyncio.create_task(self._read(job_id))
+        try:
+            await asyncio.wait_for(self._ready[job_id].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Remove a client, dropping the job's subscription if it was the last one"""
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+            self._ready.pop(job_id, None)
+            reader = self._readers.pop(job_id, None)
+            if reader is not None:
+                reader.cancel()
+
+    def subscriber_count(self, job_id: str) -> int:
+        """Number of clients currently streaming a job"""
+        return len(self._subscribers.get(job_id, ()))
+
+    async def _read(self, job_id: str) -> None:
+        pubsub = self._client().pubsub()
+        try:
+            await pubsub.subscribe(progress_channel(job_id))
+            if job_id in self._ready:
+                self._ready[job_id].set()
+            async for message in pubsub.listen():
+                if message['type'] != 'message':
+                    continue
+                event = json.loads(message['data'])
+                for queue in list(self._subscribers.get(job_id, ())):
+                    if queue.full():
+                        # Slow client: drop its oldest event rather than block the others
+                        queue.get_nowait()
+                    queue.put_nowait(event)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Warning: Progress subscription for {job_id} failed: {e}")
+            # Let the next client start a fresh subscription
+            self._readers.pop(job_id, None)
+            ready = self._ready.pop(job_id, None)
+            if ready is not None:
+                ready.set()
+            for queue in list(self._subscribers.get(job_id, ())):
+                if not queue.full():
+                    queue.put_nowait(None)
+        finally:
+            try:
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+progress_broker = ProgressBroker()
@@ -49,6 +49,7 @@ class SeparatedAudio(BaseModel):
     instrument: str
     url: str
     format: str = "opus"
+    sizeBytes: Optional[int] = None
 
 
 class AudioSeparationResult(BaseModel):
@@ -121,6 +122,20 @@ class AlternativeChordResponse(BaseModel):
     alternatives: list[AlternativeChord]
 
 
+# Suggestion sessions (incremental alternative chord recommendation)
+class SuggestionSessionResponse(BaseModel):
+    sessionId: str
+    key: Optional[str] = None
+    chords: list[str]
+    invalidatedPositions: list[int] = Field(
+        default_factory=list, description="Positions whose cached suggestions were dropped by the edit"
+    )
+
+
+class ChordEditRequest(BaseModel):
+    symbol: str = Field(..., description="New chord symbol", examples=["Fmaj7"])
+
+
 # Unified Chord Format
 class TimeChordPair(BaseModel):
     time: float = Field(..., description="Time in beats")
@@ -0,0 +1,70 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+from app.chord_engine import get_suggestion_engine
+
+from halmoni import ChordProgression, Key, SuggestionSession
+
+
+class SuggestionSessionStore:
+    """
+    In-process suggestion sessions addressed by ID.
+
+    Sessions live in the API process that created them. Idle sessions expire
+    after ttl seconds and the least recently used one is dropped when more
+    than max_sessions are open.
+    """
+
+    def __init__(self, ttl: float = 3600.0, max_sessions: int = 1000):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, tuple[float, SuggestionSession]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, progression: ChordProgression, key: Optional[Key] = None) -> str:
+        """Open a session for a progression and return its ID"""
+        session = SuggestionSession(progression, key, engine=get_suggestion_engine())
+        session_id = str(uuid.uuid4())
+        with self._lock:
+            self._expire()
+            self._sessions[session_id] = (time.monotonic(), session)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id: str) -> Optional[SuggestionSession]:
+        """Return a session and mark it as used, or None if unknown or expired"""
+        with self._lock:
+            self._expire()
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            self._sessions[session_id] = (time.monotonic(), entry[1])
+            self._sessions.move_to_end(session_id)
+            return entry[1]
+
+    def delete(self, session_id: str) -> bool:
+        """Close a session; returns whether it existed"""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self.ttl
+        while self._sessions:
+            session_id, (last_used, _) = next(iter(self._sessions.items()))
+            if last_used >= deadline:
+                break
+            del self._sessions[session_id]
+
+
+suggestion_sessions = SuggestionSessionStore(
+    ttl=settings.suggestion_session_ttl,
+    max_sessions=settings.suggestion_session_max,
+)
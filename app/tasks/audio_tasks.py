@@ -3,26 +3,121 @@ import sys
 import tempfile
 from pathlib import Path
 from celery import Task
+from celery.signals import worker_process_init
 from app.celery_app import celery_app
+from app.progress import publish_progress
+from app.config import settings
 
 # Add hiscore to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../hiscore'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../hiscore/MVSEP-MDX23-Colab_v2'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../hiscore/YourMT3'))
 
+from hiscore.model_pool import get_model_pool
+from hiscore.stem_cache import get_stem_cache
+from hiscore.stem_encoder import get_stem_encoder, link_or_copy
+
+# Configured at import so forked pool processes inherit the budget
+get_model_pool().configure(
+    memory_budget_bytes=settings.separation_model_memory_budget_mb * 1024 * 1024
+)
+get_stem_cache().configure(
+    cache_dir=settings.stem_cache_dir,
+    max_bytes=settings.stem_cache_max_mb * 1024 * 1024
+)
+get_stem_encoder().configure(
+    max_workers=settings.stem_encoder_workers,
+    opus_bitrate_kbps=settings.opus_bitrate_kbps,
+    flac_compression_level=settings.flac_compression_level
+)
+
+# htdemucs stems: drums, bass, other, vocals
+STEM_FOR_INSTRUMENT = {
+    'drums': 'drums',
+    'bass': 'bass',
+    'other': 'other',
+    'vocals': 'vocals',
+    'piano': 'other',  # Map piano to 'other' for now
+    'guitar': 'other'  # Map guitar to 'other' for now
+}
+
+
+def plan_stems(instruments: list[str]) -> dict[str, list[str]]:
+    """
+    Group requested instruments by the stem they resolve to
+
+    Args:
+        instruments: Requested instrument names
+
+    Returns:
+        Unique stems in request order, each with the instruments aliased to it
+    """
+    plan: dict[str, list[str]] = {}
+    for instrument in instruments:
+        aliases = plan.setdefault(STEM_FOR_INSTRUMENT.get(instrument.lower(), 'other'), [])
+        if instrument not in aliases:
+            aliases.append(instrument)
+    return plan
+
+
+def separated_stems(file_path: str, progress=None) -> dict:
+    """
+    All stems of the audio, from the stem cache or a fresh separation run
+
+    Args:
+        file_path: Path to the input audio file
+        progress: Called with (segments done, total segments) while separating
+    """
+    from hiscore.model_pool import default_device
+
+    return get_stem_cache().get_or_separate(
+        file_path,
+        settings.separation_model,
+        default_device(),
+        segment_seconds=settings.separation_segment_seconds,
+        overlap_seconds=settings.separation_overlap_seconds,
+        progress=progress,
+    )
+
+
+def export_stem(stems: dict, stem: str, output_path: Path) -> None:
+    """Place a cached stem at output_path"""
+    # A hard link keeps the output valid after the cache entry is evicted
+    link_or_copy(stems[stem], output_path)
+
+
+@worker_process_init.connect
+def preload_separation_models(**kwargs):
+    """Load separation models once per worker process, before the first job."""
+    get_model_pool().preload(settings.separation_preload_models)
+
+
+def basic_pitch_runtime_options():
+    """ONNX Runtime options for Basic Pitch, built from settings."""
+    from hiscore.basic_pitch_onnx import OnnxRuntimeOptions
+
+    return OnnxRuntimeOptions(
+        intra_op_num_threads=settings.onnx_intra_op_num_threads,
+        inter_op_num_threads=settings.onnx_inter_op_num_threads,
+        graph_optimization_level=settings.onnx_graph_optimization_level,
+        enable_cpu_mem_arena=settings.onnx_enable_cpu_mem_arena,
+        enable_mem_pattern=settings.onnx_enable_mem_pattern,
+    )
+
 
 class ProgressTask(Task):
     """Base task with progress tracking"""
-    def update_progress(self, current: int, total: int, message: str = ""):
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': current,
-                'total': total,
-                'percent': int((current / total) * 100) if total > 0 else 0,
-                'message': message
-            }
-        )
+    def update_progress(self, current: int, total: int, message: str = "", task_id: str = None):
+        # task_id lets pipeline stages report progress under their job's ID
+        task_id = task_id or self.request.id
+        meta = {
+            'current': current,
+            'total': total,
+            'percent': int((current / total) * 100) if total > 0 else 0,
+            'message': message
+        }
+        self.update_state(task_id=task_id, state='PROGRESS', meta=meta)
+        publish_progress(task_id, 'PROGRESS', meta)
 
 
 @celery_app.task(bind=True, base=ProgressTask)
@@ -38,69 +133,51 @@ def audio_separation_task(self, file_path: str, instruments: list[str]):
         dict with separated audio file paths
     """
     job_id = self.request.id
-    from demucs import pretrained
-    from demucs.apply import apply_model
-    import torch
-    import torchaudio
 
     self.update_progress(0, 100, "Loading audio separation model")
 
     try:
-        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        model = pretrained.get_model('htdemucs')
-        model.to(device)
-
-        self.update_progress(20, 100, "Loading audio file")
-
-        waveform, sample_rate = torchaudio.load(file_path)
-        if waveform.shape[0] == 1:
-            waveform = waveform.repeat(2, 1)
-        waveform = waveform.to(device)
-
-        self.update_progress(40, 100, "Separating audio")
-
-        with torch.no_grad():
-            sources = apply_model(model, waveform.unsqueeze(0))
-
-        # htdemucs outputs: drums (0), bass (1), other (2), vocals (3)
-        instrument_map = {
-            'drums': 0,
-            'bass': 1,
-            'other': 2,
-            'vocals': 3,
-            'piano': 2,  # Map piano to 'other' for now
-            'guitar': 2  # Map guitar to 'other' for now
-        }
+        self.update_progress(20, 100, "Separating audio")
 
-        output_dir = Path(f"./outputs/{job_id}")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        def segment_progress(done: int, total: int):
+            self.update_progress(20 + int(60 * done / total), 100, f"Separated segment {done}/{total}")
 
-        results = []
-        progress_per_instrument = 60 / len(instruments)
+        # Every stem is computed and cached, so repeat runs on the same audio skip separation
+        stems = separated_stems(file_path, progress=segment_progress)
 
-        for idx, instrument in enumerate(instruments):
-            instrument_idx = instrument_map.get(instrument.lower(), 2)
-            separated_audio = sources[0, instrument_idx]
+        output_dir = Path(f"./outputs/{job_id}")
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-            output_path = output_dir / f"{instrument}.opus"
+        # Instruments that resolve to the same stem share one output file.
+        # All unique stems are queued on the encoder pool at once and encode concurrently.
+        plan = plan_stems(instruments)
+        encoder = get_stem_encoder()
+        encodes = {
+            stem: encoder.submit(stems[stem], output_dir / stem, settings.stem_output_format)
+            for stem in plan
+        }
 
-            # Convert to opus format (using .wav for now, would need opus encoder)
-            output_path_wav = output_dir / f"{instrument}.wav"
-            torchaudio.save(str(output_path_wav), separated_audio.cpu(), sample_rate)
+        outputs = {}
+        progress_per_stem = 20 / len(plan)
 
-            # For now, use .wav instead of .opus
-            results.append({
-                'instrument': instrument,
-                'url': f'/outputs/{job_id}/{instrument}.wav',
-                'format': 'wav'
-            })
+        for idx, (stem, aliases) in enumerate(plan.items()):
+            encoded = encodes[stem].result()
+            for instrument in aliases:
+                outputs[instrument] = {
+                    'instrument': instrument,
+                    'url': f'/outputs/{job_id}/{encoded.path.name}',
+                    'format': encoded.format,
+                    'sizeBytes': encoded.size_bytes
+                }
 
             self.update_progress(
-                40 + int((idx + 1) * progress_per_instrument),
+                80 + int((idx + 1) * progress_per_stem),
                 100,
-                f"Separated {instrument}"
+                f"Encoded {', '.join(aliases)}"
             )
 
+        results = [outputs[instrument] for instrument in dict.fromkeys(instruments)]
+
         self.update_progress(100, 100, "Audio separation completed")
 
         return {
@@ -144,7 +221,12 @@ def audio_transcription_task(self, file_path: str, instrument: str, engine: str
 
             self.update_progress(40, 100, "Transcribing audio")
 
-            _, midi_data, _ = predict_basic_pitch(file_path, model_path)
+            _, midi_data, _ = predict_basic_pitch(
+                file_path,
+                model_path,
+                runtime_options=basic_pitch_runtime_options(),
+                batch_size=settings.basic_pitch_batch_size,
+            )
 
             midi_path = output_dir / f"{instrument}_transcription.mid"
             midi_data.write(str(midi_path))
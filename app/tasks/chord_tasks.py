@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from celery import Task
 from app.celery_app import celery_app
+from app.progress import publish_progress
 
 # Add halmoni to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../halmoni'))
@@ -13,16 +14,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../noten/src'))
 
 class ProgressTask(Task):
     """Base task with progress tracking"""
-    def update_progress(self, current: int, total: int, message: str = ""):
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': current,
-                'total': total,
-                'percent': int((current / total) * 100) if total > 0 else 0,
-                'message': message
-            }
-        )
+    def update_progress(self, current: int, total: int, message: str = "", task_id: str = None):
+        # task_id lets pipeline stages report progress under their job's ID
+        task_id = task_id or self.request.id
+        meta = {
+            'current': current,
+            'total': total,
+            'percent': int((current / total) * 100) if total > 0 else 0,
+            'message': message
+        }
+        self.update_state(task_id=task_id, state='PROGRESS', meta=meta)
+        publish_progress(task_id, 'PROGRESS', meta)
 
 
 @celery_app.task(bind=True, base=ProgressTask)
@@ -45,21 +47,19 @@ def chord_recognition_task(self, midi_file_path: str, format: str = "json"):
     try:
         # Analyze MIDI file
         analyzer = MIDIAnalyzer()
-        midi_data = analyzer.load_midi_file(midi_file_path)
+        note_table = analyzer.load_note_table(midi_file_path)
 
         self.update_progress(30, 100, "Detecting chords")
 
         # Detect chords
         detector = ChordDetector()
-        # get_time_windows expects a flat list of notes
-        all_notes = midi_data['notes']  # Already a flat list
-        time_windows = analyzer.get_time_windows(all_notes, window_size=1.0)
+        time_windows = analyzer.get_time_windows(note_table, window_size=1.0)
 
         chords = []
         for window_start, window_notes in time_windows:
             notes = analyzer.group_simultaneous_notes(window_notes)
             if notes:
-                chord = detector.detect_chord_from_midi_notes(notes[0])
+                chord = detector.detect_chord_from_midi_notes(notes[0].to_dicts())
                 if chord:
                     chords.append(chord)
 
@@ -67,7 +67,7 @@ def chord_recognition_task(self, midi_file_path: str, format: str = "json"):
 
         # Detect key
         key_detector = KeyDetector()
-        key, confidence = key_detector.detect_key_from_midi_notes(all_notes)
+        key, confidence = key_detector.detect_key_from_midi_notes(note_table)
 
         self.update_progress(80, 100, "Creating chord progression")
 
@@ -267,123 +267,6 @@ def easier_chord_recommendation_task(
         raise Exception(f"Easier chord recommendation failed: {str(e)}")
 
 
-@celery_app.task(bind=True, base=ProgressTask)
-def e2e_base_ready_task(self, audio_file_path: str, instrument: str):
-    """
-    End-to-end pipeline: separation + transcription + chord recognition
-
-    Args:
-        audio_file_path: Path to the input audio file
-        instrument: Target instrument name
-
-    Returns:
-        dict with all output file paths
-    """
-    job_id = self.request.id
-    from demucs import pretrained
-    from demucs.apply import apply_model
-    import torch
-    import torchaudio
-    from halmoni import MIDIAnalyzer, ChordDetector, KeyDetector, ChordProgression
-    import json
-
-    self.update_progress(0, 100, "Starting E2E pipeline")
-
-    try:
-        output_dir = Path(f"./outputs/{job_id}")
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Step 1: Audio separation
-        self.update_progress(10, 100, "Separating audio")
-
-        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        model = pretrained.get_model('htdemucs')
-        model.to(device)
-
-        waveform, sample_rate = torchaudio.load(audio_file_path)
-        if waveform.shape[0] == 1:
-            waveform = waveform.repeat(2, 1)
-        waveform = waveform.to(device)
-
-        with torch.no_grad():
-            sources = apply_model(model, waveform.unsqueeze(0))
-
-        # Get instrument index (bass=1, drums=0, other=2, vocals=3)
-        instrument_map = {'drums': 0, 'bass': 1, 'other': 2, 'vocals': 3, 'piano': 2, 'guitar': 2}
-        instrument_idx = instrument_map.get(instrument.lower(), 2)
-        separated_audio = sources[0, instrument_idx]
-
-        separated_audio_path = output_dir / f"{instrument}_separated.wav"
-        torchaudio.save(str(separated_audio_path), separated_audio.cpu(), sample_rate)
-        separated_audio_url = f'/outputs/{job_id}/{instrument}_separated.wav'
-
-        # Step 2: Transcription
-        self.update_progress(40, 100, "Transcribing audio")
-
-        from hiscore.basic_pitch_onnx import predict_basic_pitch
-        model_path = os.path.join("hiscore", "basic-pitch", "basic_pitch", "saved_models", "icassp_2022", "nmp.onnx")
-
-        _, midi_data, _ = predict_basic_pitch(str(separated_audio_path), model_path)
-
-        midi_path = output_dir / f"{instrument}_transcription.mid"
-        midi_data.write(str(midi_path))
-
-        # Apply BPM detection (temporarily disabled)
-        # from hiscore.main import detect_bpm, apply_bpm_to_midi_file
-        # bpm = detect_bpm(str(separated_audio_path))
-        # apply_bpm_to_midi_file(str(midi_path), bpm)
-
-        transcription_url = f'/outputs/{job_id}/{instrument}_transcription.mid'
-
-        # Step 3: Chord recognition
-        self.update_progress(70, 100, "Recognizing chords")
-
-        analyzer = MIDIAnalyzer()
-        midi_data_analysis = analyzer.load_midi_file(str(midi_path))
-
-        detector = ChordDetector()
-        # get_time_windows expects a flat list of notes
-        all_notes_flat = midi_data_analysis['notes']  # Already a flat list
-        time_windows = analyzer.get_time_windows(all_notes_flat, window_size=1.0)
-
-        chords = []
-        for window_start, window_notes in time_windows:
-            notes = analyzer.group_simultaneous_notes(window_notes)
-            if notes:
-                chord = detector.detect_chord_from_midi_notes(notes[0])
-                if chord:
-                    chords.append(chord)
-
-        key_detector = KeyDetector()
-        all_notes = all_notes_flat
-        key, confidence = key_detector.detect_key_from_midi_notes(all_notes)
-
-        progression = ChordProgression(chords=chords, key=key)
-
-        chord_output_path = output_dir / "chord_progression.json"
-        progression_data = {
-            'key': str(key) if key else None,
-            'chords': [{'symbol': str(chord), 'duration': 1.0} for chord in chords]
-        }
-        with open(chord_output_path, 'w') as f:
-            json.dump(progression_data, f, indent=2)
-
-        chord_progression_url = f'/outputs/{job_id}/chord_progression.json'
-
-        self.update_progress(100, 100, "E2E pipeline completed")
-
-        return {
-            'jobId': job_id,
-            'transcriptionUrl': transcription_url,
-            'separatedAudioUrl': separated_audio_url,
-            'chordProgressionUrl': chord_progression_url,
-            'format': 'json'
-        }
-
-    except Exception as e:
-        raise Exception(f"E2E pipeline failed: {str(e)}")
-
-
 @celery_app.task(bind=True, base=ProgressTask)
 def chord_complexification_task(
     self, chord_file_path: str, target_style: str, format: str = "noten"
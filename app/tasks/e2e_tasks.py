@@ -0,0 +1,189 @@
+import os
+import sys
+import json
+import uuid
+from pathlib import Path
+from celery import chain
+from app.celery_app import celery_app
+from app.config import settings
+from app.progress import publish_progress
+from app.tasks.audio_tasks import (
+    ProgressTask, STEM_FOR_INSTRUMENT, basic_pitch_runtime_options, separated_stems, export_stem
+)
+
+# Add halmoni to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../halmoni'))
+
+# The E2E pipeline runs as a chain of stage tasks:
+#
+#   e2e_separation_stage    (queue "separation")
+#   e2e_transcription_stage (queue "analysis")
+#   e2e_chord_stage         (queue "analysis", task id = job id)
+#
+# Stages hand each other file paths, not audio, and report progress under the
+# job id so status endpoints and progress streams see a single job. The final
+# stage's result is the E2EBaseResult.
+
+
+def start_e2e_pipeline(audio_file_path: str, instrument: str) -> str:
+    """
+    Enqueue the E2E pipeline for an audio file
+
+    Args:
+        audio_file_path: Path to the input audio file
+        instrument: Target instrument name
+
+    Returns:
+        Job ID, which is also the task ID of the final stage
+    """
+    job_id = str(uuid.uuid4())
+
+    pipeline = chain(
+        e2e_separation_stage.s(audio_file_path, instrument, job_id),
+        e2e_transcription_stage.s(instrument, job_id),
+        e2e_chord_stage.s(job_id).set(task_id=job_id),
+    )
+    pipeline.link_error(mark_e2e_failed.s(job_id))
+    pipeline.apply_async()
+
+    return job_id
+
+
+@celery_app.task
+def mark_e2e_failed(request, exc, traceback, job_id: str):
+    """Errback: record a failed stage as the failure of the whole job"""
+    # Stages already raise "E2E pipeline failed: ..." errors
+    celery_app.backend.mark_as_failure(job_id, exc, call_errbacks=False)
+    publish_progress(job_id, 'FAILURE', {'error': str(exc)})
+
+
+@celery_app.task(bind=True, base=ProgressTask)
+def e2e_separation_stage(self, audio_file_path: str, instrument: str, job_id: str):
+    """
+    E2E stage 1: separate the target instrument from the input audio
+
+    Returns:
+        dict with the separated audio path and URL
+    """
+    self.update_progress(0, 100, "Starting E2E pipeline", task_id=job_id)
+
+    try:
+        output_dir = Path(f"./outputs/{job_id}")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        self.update_progress(10, 100, "Separating audio", task_id=job_id)
+
+        def segment_progress(done: int, total: int):
+            self.update_progress(
+                10 + int(30 * done / total), 100, f"Separated segment {done}/{total}", task_id=job_id
+            )
+
+        stems = separated_stems(audio_file_path, progress=segment_progress)
+
+        separated_audio_path = output_dir / f"{instrument}_separated.wav"
+        export_stem(stems, STEM_FOR_INSTRUMENT.get(instrument.lower(), 'other'), separated_audio_path)
+
+        return {
+            'separatedAudioPath': str(separated_audio_path),
+            'separatedAudioUrl': f'/outputs/{job_id}/{instrument}_separated.wav',
+        }
+
+    except Exception as e:
+        raise Exception(f"E2E pipeline failed: {str(e)}")
+
+
+@celery_app.task(bind=True, base=ProgressTask)
+def e2e_transcription_stage(self, stage_result: dict, instrument: str, job_id: str):
+    """
+    E2E stage 2: transcribe the separated audio to MIDI
+
+    Returns:
+        stage_result extended with the MIDI path and URL
+    """
+    from hiscore.basic_pitch_onnx import predict_basic_pitch
+
+    self.update_progress(40, 100, "Transcribing audio", task_id=job_id)
+
+    try:
+        output_dir = Path(f"./outputs/{job_id}")
+        model_path = os.path.join("hiscore", "basic-pitch", "basic_pitch", "saved_models", "icassp_2022", "nmp.onnx")
+
+        _, midi_data, _ = predict_basic_pitch(
+            stage_result['separatedAudioPath'],
+            model_path,
+            runtime_options=basic_pitch_runtime_options(),
+            batch_size=settings.basic_pitch_batch_size,
+        )
+
+        midi_path = output_dir / f"{instrument}_transcription.mid"
+        midi_data.write(str(midi_path))
+
+        # Apply BPM detection (temporarily disabled)
+        # from hiscore.main import detect_bpm, apply_bpm_to_midi_file
+        # bpm = detect_bpm(stage_result['separatedAudioPath'])
+        # apply_bpm_to_midi_file(str(midi_path), bpm)
+
+        return {
+            **stage_result,
+            'midiPath': str(midi_path),
+            'transcriptionUrl': f'/outputs/{job_id}/{instrument}_transcription.mid',
+        }
+
+    except Exception as e:
+        raise Exception(f"E2E pipeline failed: {str(e)}")
+
+
+@celery_app.task(bind=True, base=ProgressTask)
+def e2e_chord_stage(self, stage_result: dict, job_id: str):
+    """
+    E2E stage 3: recognize chords from the transcription
+
+    Returns:
+        dict matching E2EBaseResult
+    """
+    from halmoni import MIDIAnalyzer, ChordDetector, KeyDetector, ChordProgression
+
+    self.update_progress(70, 100, "Recognizing chords", task_id=job_id)
+
+    try:
+        output_dir = Path(f"./outputs/{job_id}")
+
+        analyzer = MIDIAnalyzer()
+        note_table = analyzer.load_note_table(stage_result['midiPath'])
+
+        detector = ChordDetector()
+        time_windows = analyzer.get_time_windows(note_table, window_size=1.0)
+
+        chords = []
+        for window_start, window_notes in time_windows:
+            notes = analyzer.group_simultaneous_notes(window_notes)
+            if notes:
+                chord = detector.detect_chord_from_midi_notes(notes[0].to_dicts())
+                if chord:
+                    chords.append(chord)
+
+        key_detector = KeyDetector()
+        key, confidence = key_detector.detect_key_from_midi_notes(note_table)
+
+        progression = ChordProgression(chords=chords, key=key)
+
+        chord_output_path = output_dir / "chord_progression.json"
+        progression_data = {
+            'key': str(key) if key else None,
+            'chords': [{'symbol': str(chord), 'duration': 1.0} for chord in chords]
+        }
+        with open(chord_output_path, 'w') as f:
+            json.dump(progression_data, f, indent=2)
+
+        self.update_progress(100, 100, "E2E pipeline completed", task_id=job_id)
+
+        return {
+            'jobId': job_id,
+            'transcriptionUrl': stage_result['transcriptionUrl'],
+            'separatedAudioUrl': stage_result['separatedAudioUrl'],
+            'chordProgressionUrl': f'/outputs/{job_id}/chord_progression.json',
+            'format': 'json'
+        }
+
+    except Exception as e:
+        raise Exception(f"E2E pipeline failed: {str(e)}")
@@ -0,0 +1,66 @@
+import hashlib
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile, status
+
+from app.config import settings
+
+
+@dataclass
+class StoredUpload:
+    """An uploaded file saved under its content hash"""
+    path: Path
+    sha256: str
+    size: int
+    filename: str
+
+
+def upload_path(sha256: str, filename: str) -> Path:
+    """Content-addressed location for an upload, keeping its extension"""
+    suffix = Path(filename).suffix.lower()
+    return Path(settings.upload_dir) / f"{sha256}{suffix}"
+
+
+async def save_upload(upload: UploadFile) -> StoredUpload:
+    """
+    Save an upload as {sha256}{suffix} in the upload directory.
+
+    The upload is streamed to a temporary file in fixed-size chunks with
+    non-blocking writes, hashing as it goes, so only one chunk is held in
+    memory. Uploads larger than max_file_size are rejected with 413.
+    Identical content is stored once.
+    """
+    filename = upload.filename or ""
+    tmp_path = Path(settings.upload_dir) / f".{uuid.uuid4().hex}.upload"
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            while chunk := await upload.read(settings.upload_chunk_size):
+                size += len(chunk)
+                if size > settings.max_file_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File exceeds maximum size of {settings.max_file_size} bytes"
+                    )
+                digest.update(chunk)
+                await f.write(chunk)
+
+        sha256 = digest.hexdigest()
+        path = upload_path(sha256, filename)
+        if await aiofiles.os.path.exists(path):
+            await aiofiles.os.remove(tmp_path)
+        else:
+            # Rename into place so readers never see a partial file
+            await aiofiles.os.replace(tmp_path, path)
+    except BaseException:
+        if await aiofiles.os.path.exists(tmp_path):
+            await aiofiles.os.remove(tmp_path)
+        raise
+
+    return StoredUpload(path=path, sha256=sha256, size=size, filename=filename)
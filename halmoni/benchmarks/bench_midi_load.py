@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""MIDIAnalyzer MIDI loading with the direct SMF reader against mido.
+
+Usage:
+    python benchmarks/bench_midi_load.py
+    python benchmarks/bench_midi_load.py --tracks 8 --notes 20000
+    python benchmarks/bench_midi_load.py --file song.mid
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import mido
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from halmoni import MIDIAnalyzer  # noqa: E402
+
+
+def write_dense_midi(path: str, tracks: int, notes: int, seed: int) -> None:
+    """Transcription-like multi-track file: overlapping notes with pedal and tempo events."""
+    rng = random.Random(seed)
+    midi_file = mido.MidiFile(ticks_per_beat=480)
+    for track_idx in range(tracks):
+        events = []
+        for _ in range(notes):
+            start = rng.randrange(0, notes * 60)
+            end = start + rng.randrange(10, 1920)
+            note = rng.randrange(21, 109)
+            events.append((start, mido.Message('note_on', note=note, velocity=rng.randrange(1, 128),
+                                               channel=track_idx % 16)))
+            events.append((end, mido.Message('note_off', note=note, channel=track_idx % 16)))
+        for tick in range(0, notes * 60, 1920):
+            events.append((tick, mido.Message('control_change', control=64, value=rng.choice([0, 127]),
+                                              channel=track_idx % 16)))
+        if track_idx == 0:
+            events.append((0, mido.MetaMessage('set_tempo', tempo=500000)))
+        events.sort(key=lambda event: event[0])
+
+        track = mido.MidiTrack([mido.MetaMessage('track_name', name=f'Track {track_idx}')])
+        last_tick = 0
+        for tick, msg in events:
+            track.append(msg.copy(time=tick - last_tick))
+            last_tick = tick
+        midi_file.tracks.append(track)
+    midi_file.save(path)
+
+
+def best_of(repeats: int, func, *args):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MIDI loading")
+    parser.add_argument("--file", help="MIDI file to load (synthetic if not given)")
+    parser.add_argument("--tracks", type=int, default=4, help="Tracks in the synthetic file")
+    parser.add_argument("--notes", type=int, default=10_000, help="Notes per synthetic track")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp_dir, 'dense.mid')
+            write_dense_midi(path, args.tracks, args.notes, args.seed)
+
+        fast = MIDIAnalyzer()
+        slow = MIDIAnalyzer(fast_parser=False)
+
+        fast_time, table = best_of(args.repeats, fast.load_note_table, path)
+        slow_time, expected = best_of(args.repeats, slow.load_note_table, path)
+        print(f"{os.path.getsize(path) / 1024:.0f} KiB, {len(table)} notes")
+        print(f"load_note_table  direct {fast_time * 1000:8.1f} ms, mido {slow_time * 1000:8.1f} ms "
+              f"({slow_time / fast_time:.1f}x)")
+
+        fast_time, analysis = best_of(args.repeats, fast.load_midi_file, path)
+        slow_time, expected_analysis = best_of(args.repeats, slow.load_midi_file, path)
+        print(f"load_midi_file   direct {fast_time * 1000:8.1f} ms, mido {slow_time * 1000:8.1f} ms "
+              f"({slow_time / fast_time:.1f}x)")
+        print(f"output identical: {table.to_dicts() == expected.to_dicts() and analysis['notes'] == expected_analysis['notes']}")
+
+
+if __name__ == '__main__':
+    main()
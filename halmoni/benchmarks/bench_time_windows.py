@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""MIDIAnalyzer.get_time_windows on synthetic dense MIDI, against the per-window scan.
+
+Usage:
+    python benchmarks/bench_time_windows.py
+    python benchmarks/bench_time_windows.py --notes 50000 --beats 2000 --window 0.5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from halmoni import MIDIAnalyzer  # noqa: E402
+
+
+def dense_notes(count: int, beats: float, seed: int) -> List[Dict]:
+    """Piano-transcription-like notes: short and long notes spread over the piece."""
+    rng = random.Random(seed)
+    notes = []
+    for _ in range(count):
+        start = rng.uniform(0, beats)
+        duration = rng.choice([0.05, 0.25, 0.5, 1.0, 2.0]) * rng.uniform(0.5, 1.5)
+        notes.append({
+            'midi_note': rng.randrange(21, 109),
+            'velocity': rng.randrange(20, 128),
+            'start_time': start,
+            'end_time': start + duration,
+            'duration': duration,
+        })
+    return notes
+
+
+def scan_time_windows(notes: List[Dict], window_size: float) -> List[Tuple[float, List[Dict]]]:
+    """The per-window scan over all notes that the sweep replaced."""
+    if not notes:
+        return []
+    start_time = min(note['start_time'] for note in notes)
+    end_time = max(note['end_time'] for note in notes)
+    windows = []
+    current_time = start_time
+    while current_time < end_time:
+        window_end = current_time + window_size
+        window_notes = [
+            note for note in notes
+            if note['start_time'] < window_end and note['end_time'] > current_time
+        ]
+        if window_notes:
+            windows.append((current_time, window_notes))
+        current_time += window_size
+    return windows
+
+
+def best_of(repeats: int, func, *args):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MIDIAnalyzer.get_time_windows")
+    parser.add_argument("--notes", type=int, default=20_000, help="Number of notes")
+    parser.add_argument("--beats", type=float, default=1_000, help="Length of the piece in beats")
+    parser.add_argument("--window", type=float, default=1.0, help="Window size in beats")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-scan", action="store_true", help="Don't run the per-window scan")
+    args = parser.parse_args()
+
+    notes = dense_notes(args.notes, args.beats, args.seed)
+    analyzer = MIDIAnalyzer()
+
+    sweep_time, windows = best_of(args.repeats, analyzer.get_time_windows, notes, args.window)
+    print(f"{args.notes} notes, {len(windows)} windows of {args.window} beats")
+    print(f"sweep  {sweep_time * 1000:10.1f} ms")
+
+    if not args.skip_scan:
+        scan_time, expected = best_of(1, scan_time_windows, notes, args.window)
+        identical = len(windows) == len(expected) and all(
+            start == expected_start and len(window) == len(expected_window)
+            and all(a is b for a, b in zip(window, expected_window))
+            for (start, window), (expected_start, expected_window) in zip(windows, expected)
+        )
+        print(f"scan   {scan_time * 1000:10.1f} ms  ({scan_time / sweep_time:.0f}x slower)")
+        print(f"output identical: {identical}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Allocation and speed of the Note/Chord value objects in suggestion workloads.
+
+Usage:
+    python benchmarks/bench_value_objects.py
+    python benchmarks/bench_value_objects.py --chords 128 --repeats 5
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from halmoni import Chord, ChordProgression, ChordSuggestionEngine, Key, Note  # noqa: E402
+
+SYMBOLS = ['C', 'Am', 'F', 'G7', 'Em', 'Dm7', 'Bb', 'E7', 'Cmaj7', 'F#m7b5', 'Db7', 'Gsus4']
+
+
+def measure(workload: Callable[[], object], repeats: int) -> Tuple[float, int, int]:
+    """Best wall time, bytes still held by the result and peak bytes of one run."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        workload()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = workload()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, current, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Note/Chord value objects")
+    parser.add_argument("--notes", type=int, default=100_000, help="Notes to create")
+    parser.add_argument("--chords", type=int, default=64, help="Length of the suggested progression")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    key = Key(Note('C', 4), 'major')
+    symbols = [SYMBOLS[i % len(SYMBOLS)] for i in range(args.chords)]
+    progression = ChordProgression.from_symbols(symbols, key=key)
+    engine = ChordSuggestionEngine()
+
+    workloads = {
+        f"{args.notes} notes from MIDI numbers": lambda: [Note(i % 128) for i in range(args.notes)],
+        f"{args.notes // 10} chords from symbols": lambda: [
+            Chord.from_symbol(SYMBOLS[i % len(SYMBOLS)]) for i in range(args.notes // 10)
+        ],
+        f"{args.notes // 10} chord pitch-class lookups": lambda: [
+            progression.chords[i % args.chords].pitch_classes for i in range(args.notes // 10)
+        ],
+        f"key analysis of {args.chords} chords x 100": lambda: [
+            key.analyze_chord(chord) for _ in range(100) for chord in progression.chords
+        ],
+        f"suggestions for a {args.chords}-chord progression": lambda: engine.get_suggestions(
+            progression, key, max_suggestions=1000
+        ),
+    }
+
+    for name, workload in workloads.items():
+        best, held, peak = measure(workload, args.repeats)
+        print(
+            f"{name:<45} best {best * 1000:8.2f} ms, "
+            f"held {held / 1024:8.1f} KiB, peak {peak / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,13 @@ Provides chord analysis, progression suggestions, and instrument difficulty anal
 
 __version__ = "0.1.0"
 
-from .core import Note, Interval, Chord, Scale, Key, ChordProgression, ChordVoicing
-from .analysis import MIDIAnalyzer, ChordDetector, KeyDetector, AdamStarkChordDetector
+from .core import Note, Interval, PitchClassSet, Chord, Scale, Key, ChordProgression, ChordVoicing
+from .analysis import MIDIAnalyzer, NoteTable, ChordDetector, KeyDetector, AdamStarkChordDetector
 from .instruments import GuitarDifficulty, PianoDifficulty, BassDifficulty
 from .suggestions import (
     ChordSuggestion,
     ChordSuggestionEngine,
+    SuggestionSession,
     BorrowedChordStrategy,
     ChromaticApproachStrategy,
     NeapolitanStrategy,
@@ -23,12 +24,14 @@ from .suggestions import (
 __all__ = [
     "Note",
     "Interval", 
+    "PitchClassSet",
     "Chord",
     "Scale",
     "Key",
     "ChordProgression",
     "ChordVoicing",
     "MIDIAnalyzer",
+    "NoteTable",
     "ChordDetector",
     "KeyDetector",
     "AdamStarkChordDetector",
@@ -37,6 +40,7 @@ __all__ = [
     "BassDifficulty",
     "ChordSuggestion",
     "ChordSuggestionEngine",
+    "SuggestionSession",
     "BorrowedChordStrategy",
     "ChromaticApproachStrategy",
     "NeapolitanStrategy",
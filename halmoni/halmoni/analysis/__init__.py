@@ -1,12 +1,14 @@
 """MIDI analysis and chord detection modules."""
 
 from .midi_analyzer import MIDIAnalyzer
+from .note_table import NoteTable
 from .chord_detector import ChordDetector
 from .key_detector import KeyDetector
 from .adam_stark_detector import AdamStarkChordDetector
 
 __all__ = [
     "MIDIAnalyzer",
+    "NoteTable",
     "ChordDetector", 
     "KeyDetector",
     "AdamStarkChordDetector",
@@ -5,7 +5,7 @@ Based on: https://github.com/adamstark/Chord-Detector-and-Chromagram
 Original C++ implementation by Adam Stark, converted to Python for halmoni library.
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 import numpy as np
 from ..core import Note, Chord
 
@@ -37,11 +37,21 @@ class AdamStarkChordDetector:
         self.num_chords_in_classifier = len(self.chord_names)
         self.num_semitones = 12
         
+        # Index of the perfect fifth above each semitone
+        self.fifth_indices = (np.arange(self.num_semitones) + 7) % self.num_semitones
+        
         self._make_chord_profiles()
+        self.profile_names = [
+            self._get_chord_name(index // self.num_semitones, index % self.num_semitones)
+            for index in range(len(self.chord_profiles))
+        ]
+    
+    # Frames scored at once; bounds the [frames, profiles, 12] difference array
+    SCORE_CHUNK_FRAMES = 256
     
     def _make_chord_profiles(self) -> None:
         """Create chord profiles for all chord types and roots."""
-        # Initialize profiles array
+        # Initialize profiles array, one row per (chord type, root)
         self.chord_profiles = np.zeros((self.num_chords_in_classifier * self.num_semitones, self.num_semitones))
         
         # Chord interval patterns (semitones from root)
@@ -83,12 +93,21 @@ class AdamStarkChordDetector:
         if len(chromagram) != self.num_semitones:
             raise ValueError("Chromagram must have 12 elements")
         
-        # Normalize chromagram
-        chroma_sum = np.sum(chromagram)
-        if chroma_sum == 0:
-            return 'N', 0.0
+        return self.batch_detect_chords([chromagram])[0]
+    
+    def _detect_frames(self, chromagrams: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the best profile for every frame of a [frames, 12] chromagram array.
         
-        normalized_chroma = chromagram / chroma_sum
+        Returns:
+            Tuple of (best profile index, confidence) arrays; frames with no
+            energy get index -1 and confidence 0
+        """
+        # Normalize chromagrams
+        chroma_sums = np.sum(chromagrams, axis=1)
+        silent = chroma_sums == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized_chroma = chromagrams / chroma_sums[:, None]
         
         # Remove some 5th note energy (as in original implementation)
         processed_chroma = self._remove_fifth_energy(normalized_chroma)
@@ -97,20 +116,15 @@ class AdamStarkChordDetector:
         chord_scores = self._calculate_all_chord_scores(processed_chroma)
         
         # Find best match (minimum score in original algorithm)
-        best_chord_index = np.argmin(chord_scores)
-        best_score = chord_scores[best_chord_index]
-        
-        # Convert index to chord type and root
-        chord_type = best_chord_index // self.num_semitones
-        root_note = best_chord_index % self.num_semitones
-        
-        # Generate chord name
-        chord_name = self._get_chord_name(chord_type, root_note)
+        best_indices = np.argmin(chord_scores, axis=1)
+        best_scores = chord_scores[np.arange(len(best_indices)), best_indices]
         
         # Convert score to confidence (lower score = higher confidence in original)
-        confidence = max(0.0, 1.0 - best_score)
+        confidences = np.maximum(0.0, 1.0 - best_scores)
         
-        return chord_name, confidence
+        best_indices[silent] = -1
+        confidences[silent] = 0.0
+        return best_indices, confidences
     
     def _remove_fifth_energy(self, chromagram: np.ndarray) -> np.ndarray:
         """
@@ -121,20 +135,33 @@ class AdamStarkChordDetector:
         """
         processed = chromagram.copy()
         
-        for i in range(self.num_semitones):
-            fifth_index = (i + 7) % self.num_semitones
-            # Reduce 5th energy by 20% (arbitrary factor from original)
-            processed[fifth_index] *= 0.8
+        # Reduce 5th energy by 20% (arbitrary factor from original); works on
+        # a single chromagram or a [frames, 12] batch. Multiplied in float64
+        # and stored back in the chromagram's dtype, as the per-element loop did
+        fifths = processed[..., self.fifth_indices]
+        processed[..., self.fifth_indices] = fifths.astype(np.float64) * 0.8
         
         return processed
     
     def _calculate_all_chord_scores(self, chromagram: np.ndarray) -> np.ndarray:
-        """Calculate scores for all chord types and roots."""
-        num_profiles = self.num_chords_in_classifier * self.num_semitones
-        scores = np.zeros(num_profiles)
+        """
+        Calculate scores for all chord types and roots.
+        
+        Args:
+            chromagram: A 12-element chromagram or a [frames, 12] batch
+            
+        Returns:
+            Scores per profile, shaped [profiles] or [frames, profiles]
+        """
+        if chromagram.ndim == 1:
+            return self._calculate_all_chord_scores(chromagram[None, :])[0]
         
-        for i in range(num_profiles):
-            scores[i] = self._calculate_chord_score(chromagram, i)
+        # Sum of squared differences against every profile, in chunks of frames
+        scores = np.empty((len(chromagram), len(self.chord_profiles)))
+        for start in range(0, len(chromagram), self.SCORE_CHUNK_FRAMES):
+            chunk = chromagram[start:start + self.SCORE_CHUNK_FRAMES]
+            differences = chunk[:, None, :] - self.chord_profiles[None, :, :]
+            scores[start:start + len(chunk)] = np.sum(differences ** 2, axis=2)
         
         return scores
     
@@ -290,23 +317,36 @@ class AdamStarkChordDetector:
         # For now, just return empty chromagram
         return np.zeros(self.num_semitones)
     
-    def batch_detect_chords(self, chromagrams: List[np.ndarray]) -> List[Tuple[str, float]]:
+    def batch_detect_chords(self, chromagrams: Union[List[np.ndarray], np.ndarray]) -> List[Tuple[str, float]]:
         """
         Detect chords from multiple chromagrams.
         
+        All frames are scored against all profiles in one array operation, so
+        frame-level detection over a whole song is fast.
+        
         Args:
-            chromagrams: List of chromagram arrays
+            chromagrams: List of chromagram arrays, or a [frames, 12] array
             
         Returns:
             List of (chord_name, confidence) tuples
         """
-        results = []
-        
-        for chromagram in chromagrams:
-            chord_name, confidence = self.detect_chord(chromagram)
-            results.append((chord_name, confidence))
+        # Keep the input dtype: float32 chromagrams are normalized in float32
+        try:
+            frames = np.asarray(chromagrams)
+        except ValueError:
+            raise ValueError("Chromagram must have 12 elements")
+        if frames.size == 0 and frames.ndim < 2:
+            return []
+        if frames.ndim != 2 or frames.shape[1] != self.num_semitones:
+            raise ValueError("Chromagram must have 12 elements")
+        if not np.issubdtype(frames.dtype, np.number):
+            raise ValueError("Chromagram must be numeric")
         
-        return results
+        best_indices, confidences = self._detect_frames(frames)
+        return [
+            (self.profile_names[index] if index >= 0 else 'N', confidence)
+            for index, confidence in zip(best_indices.tolist(), confidences.tolist())
+        ]
     
     def get_chord_profile(self, chord_name: str) -> Optional[np.ndarray]:
         """
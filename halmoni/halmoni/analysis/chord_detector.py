@@ -3,7 +3,7 @@
 from typing import List, Dict, Tuple, Optional, Set
 import numpy as np
 from collections import Counter
-from ..core import Note, Chord, Interval
+from ..core import Note, Chord, Interval, PitchClassSet
 
 
 class ChordDetector:
@@ -47,16 +47,49 @@ class ChordDetector:
         'dominant7b13': [0, 4, 7, 10, 8],
     }
     
-    def __init__(self, min_notes: int = 2, bass_weight: float = 2.0):
+    # Templates as pitch-class masks relative to the root
+    CHORD_TEMPLATE_MASKS = {
+        quality: PitchClassSet.from_pitch_classes(template).mask
+        for quality, template in CHORD_TEMPLATES.items()
+    }
+    _TEMPLATE_QUALITIES = list(CHORD_TEMPLATE_MASKS)
+    
+    # Qualities detection returns; this freezes detection output to what it was
+    # before Chord could build the minor-major, augmented seventh and altered
+    # dominant qualities. The other templates still compete on score, so a
+    # better match to one of them means no better chord is reported, exactly
+    # as when constructing those chords raised ValueError.
+    DETECTABLE_QUALITIES = frozenset(CHORD_TEMPLATES) - {
+        'minor_major7', 'augmented7', 'dominant7b5', 'dominant7#5',
+        'dominant7b9', 'dominant7#9', 'dominant7#11', 'dominant7b13',
+    }
+    
+    # Minimum template score for a match to count as a chord
+    MATCH_THRESHOLD = 0.5
+    
+    # Row of the lookup table used when there is no lowest note
+    NO_BASS_ROW = 12
+    
+    # Best match for every (lowest pitch class, pitch-class mask), built on first use
+    _lookup_table: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    
+    def __init__(self, min_notes: int = 2, bass_weight: float = 2.0,
+                 use_lookup_table: bool = True, verify_lookup_table: bool = False):
         """
         Initialize chord detector.
         
         Args:
             min_notes: Minimum number of notes required to detect a chord
             bass_weight: Weight factor for bass notes in root detection
+            use_lookup_table: Find matches in the precomputed table instead
+                of scoring every root and template
+            verify_lookup_table: Also run the scorer on every lookup and raise
+                an AssertionError if the two disagree
         """
         self.min_notes = min_notes
         self.bass_weight = bass_weight
+        self.use_lookup_table = use_lookup_table
+        self.verify_lookup_table = verify_lookup_table
     
     def detect_chord_from_notes(self, notes: List[Note], 
                                bass_note: Optional[Note] = None) -> Optional[Chord]:
@@ -74,21 +107,13 @@ class ChordDetector:
             return None
         
         # Get unique pitch classes
-        pitch_classes = list(set(note.pitch_class for note in notes))
+        pitch_class_set = PitchClassSet.from_notes(notes)
         
-        if len(pitch_classes) < self.min_notes:
+        if len(pitch_class_set) < self.min_notes:
             return None
         
-        # Convert to semitone representation
-        semitones = []
-        for pc in pitch_classes:
-            note = Note(pc, 4)  # Use octave 4 as reference
-            semitones.append(note.midi_number % 12)
-        
-        semitones = sorted(set(semitones))
-        
         # Try to find best chord match
-        best_match = self._find_best_chord_match(semitones, notes, bass_note)
+        best_match = self._find_best_chord_match(pitch_class_set, notes, bass_note)
         
         return best_match
     
@@ -138,54 +163,171 @@ class ChordDetector:
         
         return self.detect_chord_from_notes(notes, bass_note)
     
-    def _find_best_chord_match(self, semitones: List[int], notes: List[Note],
+    def _find_best_chord_match(self, pitch_class_set: PitchClassSet, notes: List[Note],
                               bass_note: Optional[Note] = None) -> Optional[Chord]:
         """Find the best matching chord template."""
+        # Pitch class of the lowest note, which earns the root-in-bass bonus
+        lowest_semitone = min(note.midi_number for note in notes) % 12 if notes else None
+        
+        if self.use_lookup_table:
+            match = self._lookup_chord_match(pitch_class_set.mask, lowest_semitone)
+            if self.verify_lookup_table:
+                expected = self._score_chord_match(pitch_class_set, lowest_semitone)
+                if match != expected:
+                    raise AssertionError(
+                        f"Chord lookup table gives {match} for {pitch_class_set!r} "
+                        f"with lowest note {lowest_semitone}, scorer gives {expected}"
+                    )
+        else:
+            match = self._score_chord_match(pitch_class_set, lowest_semitone)
+        
+        best_score, root_semitone, chord_quality = match
+        
+        # Only return chord if score is above threshold
+        if best_score <= self.MATCH_THRESHOLD or root_semitone is None:
+            return None
+        
+        root_note = Note(root_semitone)
+        
+        # Handle slash chord if bass note is different from root
+        slash_bass = None
+        if bass_note and bass_note.pitch_class != root_note.pitch_class:
+            slash_bass = bass_note
+        
+        return Chord(root_note, chord_quality, slash_bass)
+    
+    def _score_chord_match(self, pitch_class_set: PitchClassSet,
+                           lowest_semitone: Optional[int]) -> Tuple[float, Optional[int], Optional[str]]:
+        """
+        Score every root and template.
+        
+        Only templates in DETECTABLE_QUALITIES become the result, but every
+        template can set the best score; this keeps the outputs detection
+        had before the other qualities existed.
+        
+        Returns:
+            Tuple of (best score, root semitone, quality), where the root and
+            quality are those of the last detectable template that set a new
+            best score (None if there was none)
+        """
         best_score = -1
-        best_chord = None
+        best_root = None
+        best_quality = None
         
         # Try each possible root note
-        for root_semitone in semitones:
-            # Normalize semitones relative to this root
-            normalized = [(s - root_semitone) % 12 for s in semitones]
-            normalized = sorted(set(normalized))
+        for root_semitone in pitch_class_set:
+            # Normalize pitch classes relative to this root
+            normalized = pitch_class_set.transpose(-root_semitone).mask
             
             # Try each chord template
-            for chord_quality, template in self.CHORD_TEMPLATES.items():
-                score = self._calculate_chord_score(normalized, template, notes, root_semitone)
+            for chord_quality, template_mask in self.CHORD_TEMPLATE_MASKS.items():
+                score = self._calculate_chord_score(
+                    normalized, template_mask, root_semitone == lowest_semitone
+                )
                 
                 if score > best_score:
                     best_score = score
-                    root_note = Note(root_semitone)
-                    
-                    # Handle slash chord if bass note is different from root
-                    slash_bass = None
-                    if bass_note and bass_note.pitch_class != root_note.pitch_class:
-                        slash_bass = bass_note
-                    
-                    try:
-                        best_chord = Chord(root_note, chord_quality, slash_bass)
-                    except ValueError:
-                        # Skip invalid chord qualities
-                        continue
+                    if chord_quality in self.DETECTABLE_QUALITIES:
+                        best_root = root_semitone
+                        best_quality = chord_quality
         
-        # Only return chord if score is above threshold
-        threshold = 0.5
-        if best_score > threshold:
-            return best_chord
-        
-        return None
+        return best_score, best_root, best_quality
+    
+    def _lookup_chord_match(self, mask: int,
+                            lowest_semitone: Optional[int]) -> Tuple[float, Optional[int], Optional[str]]:
+        """Look up the best (score, root semitone, quality) for a pitch-class mask."""
+        scores, roots, qualities = self._get_lookup_table()
+        row = self.NO_BASS_ROW if lowest_semitone is None else lowest_semitone
+        root = int(roots[row, mask])
+        if root < 0:
+            return float(scores[row, mask]), None, None
+        return float(scores[row, mask]), root, self._TEMPLATE_QUALITIES[qualities[row, mask]]
+    
+    @classmethod
+    def _get_lookup_table(cls) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the (scores, roots, quality indices) tables, building them on first use."""
+        if cls._lookup_table is None:
+            cls._lookup_table = cls._build_lookup_table()
+        return cls._lookup_table
     
-    def _calculate_chord_score(self, normalized_semitones: List[int], 
-                              template: List[int], notes: List[Note],
-                              root_semitone: int) -> float:
-        """Calculate how well a set of notes matches a chord template."""
-        template_set = set(template)
-        notes_set = set(normalized_semitones)
+    @classmethod
+    def _build_lookup_table(cls) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score every root and template for all 4096 pitch-class masks at once.
+        
+        Mirrors _calculate_chord_score and the search of _score_chord_match
+        (roots ascending, then templates in order, only a strictly better
+        score replaces the best, results limited to DETECTABLE_QUALITIES to
+        freeze the old outputs), so each entry is exactly what the scorer
+        returns.
         
+        Returns:
+            Arrays of shape (13, 4096) indexed by [lowest pitch class, mask]
+            (row 12 when there is no lowest note): best score (-1 for the
+            empty set), root semitone of the chosen detectable match (-1 for
+            none) and index into _TEMPLATE_QUALITIES
+        """
+        masks = np.arange(4096)
+        bits = (masks[:, None] >> np.arange(12)) & 1
+        templates = np.array(list(cls.CHORD_TEMPLATE_MASKS.values()))
+        template_bits = (templates[:, None] >> np.arange(12)) & 1
+        
+        # Per normalized mask and template, the terms of _calculate_chord_score
+        matches = bits @ template_bits.T
+        template_size = template_bits.sum(axis=1)
+        total_notes = bits.sum(axis=1)[:, None]
+        extra_notes = total_notes - matches
+        with np.errstate(divide='ignore', invalid='ignore'):
+            base = matches / template_size - (0.5 * (extra_notes / total_notes))
+        
+        thirds = (1 << 3) | (1 << 4)
+        fifth = 1 << 7
+        has_third = ((templates & thirds) != 0) & ((masks[:, None] & thirds) != 0)
+        has_fifth = ((templates & fifth) != 0) & ((masks[:, None] & fifth) != 0)
+        essential = np.where(has_third, 0.1, 0.0) + np.where(has_fifth, 0.1, 0.0)
+        
+        score_without_bass = np.maximum(0.0, base + essential)
+        score_with_bass = np.maximum(0.0, (base + 0.2) + essential)
+        score_without_bass[0] = score_with_bass[0] = 0.0  # No notes
+        
+        # Rows of each mask normalized to every root: [mask, root]
+        roots = np.arange(12)
+        normalized = ((masks[:, None] >> roots) | (masks[:, None] << (12 - roots))) & 0xFFF
+        is_root = bits.astype(bool)
+        
+        num_templates = len(templates)
+        detectable = np.tile([quality in cls.DETECTABLE_QUALITIES for quality in cls._TEMPLATE_QUALITIES], 12)
+        scores = np.empty((13, 4096))
+        best_roots = np.empty((13, 4096), dtype=np.int8)
+        best_qualities = np.empty((13, 4096), dtype=np.int8)
+        
+        for lowest in range(13):
+            candidate = score_without_bass[normalized]  # [mask, root, template]
+            if lowest < 12:
+                candidate[:, lowest] = score_with_bass[normalized[:, lowest]]
+            candidate[~is_root] = -1.0
+            
+            candidate = candidate.reshape(4096, -1)
+            
+            # Candidates that beat every earlier one, in search order
+            running_best = np.maximum.accumulate(candidate, axis=1)
+            earlier_best = np.hstack([np.full((4096, 1), -1.0), running_best[:, :-1]])
+            chosen = (candidate > earlier_best) & detectable
+            
+            # The last detectable new best is the chord the scorer keeps
+            last = chosen.shape[1] - 1 - chosen[:, ::-1].argmax(axis=1)
+            scores[lowest] = running_best[:, -1]
+            best_roots[lowest] = np.where(chosen.any(axis=1), last // num_templates, -1)
+            best_qualities[lowest] = last % num_templates
+        
+        return scores, best_roots, best_qualities
+    
+    def _calculate_chord_score(self, normalized_mask: int, template_mask: int,
+                              root_in_bass: bool) -> float:
+        """Calculate how well a pitch-class mask matches a chord template mask."""
         # Basic match score: how many template notes are present
-        matches = len(template_set.intersection(notes_set))
-        template_size = len(template_set)
+        matches = (template_mask & normalized_mask).bit_count()
+        template_size = template_mask.bit_count()
         
         if template_size == 0:
             return 0.0
@@ -193,8 +335,8 @@ class ChordDetector:
         match_score = matches / template_size
         
         # Penalize extra notes that don't belong to the chord
-        extra_notes = len(notes_set - template_set)
-        total_notes = len(notes_set)
+        extra_notes = (normalized_mask & ~template_mask).bit_count()
+        total_notes = normalized_mask.bit_count()
         
         if total_notes == 0:
             return 0.0
@@ -202,22 +344,19 @@ class ChordDetector:
         extra_penalty = extra_notes / total_notes
         
         # Bonus for having the root in the bass
-        bass_bonus = 0.0
-        if notes:
-            bass_note = min(notes, key=lambda n: n.midi_number)
-            if (bass_note.midi_number % 12) == root_semitone:
-                bass_bonus = 0.2
+        bass_bonus = 0.2 if root_in_bass else 0.0
         
         # Bonus for having essential chord tones (root, third, fifth)
         essential_bonus = 0.0
-        essential_tones = {0}  # Root is always essential
         
-        if 3 in template or 4 in template:  # Has third
-            if 3 in notes_set or 4 in notes_set:
+        thirds = (1 << 3) | (1 << 4)
+        if template_mask & thirds:  # Has third
+            if normalized_mask & thirds:
                 essential_bonus += 0.1
         
-        if 7 in template:  # Has fifth
-            if 7 in notes_set:
+        fifth = 1 << 7
+        if template_mask & fifth:  # Has fifth
+            if normalized_mask & fifth:
                 essential_bonus += 0.1
         
         # Combine scores
@@ -379,8 +518,8 @@ class ChordDetector:
         analysis['root_motion'] = root_interval
         
         # Find common tones
-        common_pitch_classes = chord1.pitch_classes.intersection(chord2.pitch_classes)
-        analysis['common_tones'] = list(common_pitch_classes)
+        common_pitch_classes = chord1.pitch_class_set & chord2.pitch_class_set
+        analysis['common_tones'] = common_pitch_classes.pitch_classes
         
         # Classify motion type
         root_semitones = root_interval.simple_semitones
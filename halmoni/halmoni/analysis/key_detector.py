@@ -1,9 +1,10 @@
 """Key detection and tonal analysis utilities."""
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 import numpy as np
 from collections import Counter
 from ..core import Note, Key, Scale, Chord
+from .note_table import NoteTable
 
 
 class KeyDetector:
@@ -64,37 +65,46 @@ class KeyDetector:
         
         return best_key, best_score
     
-    def detect_key_from_midi_notes(self, midi_notes: List[Dict]) -> Tuple[Key, float]:
+    def detect_key_from_midi_notes(self, midi_notes: Union[List[Dict], NoteTable]) -> Tuple[Key, float]:
         """
         Detect key from MIDI note dictionaries.
         
         Args:
-            midi_notes: List of MIDI note dictionaries with duration and velocity info
+            midi_notes: List of MIDI note dictionaries with duration and velocity
+                info, or a NoteTable
             
         Returns:
             Tuple of (detected_key, confidence_score)
         """
-        if not midi_notes:
+        if not len(midi_notes):
             return Key(Note('C', 4), 'major'), 0.0
         
-        notes = []
-        weights = []
+        if isinstance(midi_notes, NoteTable):
+            midi_numbers = midi_notes.midi_note
+            durations = midi_notes.duration
+            velocities = midi_notes.velocity
+        else:
+            # Notes without a MIDI number are skipped
+            midi_notes = [midi_note for midi_note in midi_notes if 'midi_note' in midi_note]
+            midi_numbers = np.array([midi_note['midi_note'] for midi_note in midi_notes], dtype=int)
+            durations = np.array([midi_note.get('duration', 1.0) for midi_note in midi_notes], dtype=float)
+            velocities = np.array([midi_note.get('velocity', 64) for midi_note in midi_notes], dtype=float)
+        
+        # Skip invalid MIDI notes
+        valid = (midi_numbers >= 0) & (midi_numbers <= 127)
+        if not valid.any():
+            return Key(Note('C', 4), 'major'), 0.0
         
-        for midi_note in midi_notes:
-            try:
-                note = Note(midi_note['midi_note'])
-                notes.append(note)
-                
-                # Weight by duration and velocity
-                duration = midi_note.get('duration', 1.0)
-                velocity = midi_note.get('velocity', 64) / 127.0
-                weight = duration * velocity
-                weights.append(weight)
-                
-            except (ValueError, KeyError):
-                continue
+        # Weight by duration and velocity
+        weights = durations[valid] * (velocities[valid] / 127.0)
+        histogram = np.bincount(midi_numbers[valid] % 12, weights=weights, minlength=12)
+        
+        # Normalize
+        total = histogram.sum()
+        if total > 0:
+            histogram = histogram / total
         
-        return self.detect_key_from_notes(notes, weights)
+        return self._find_best_key_match(histogram)
     
     def detect_key_from_chords(self, chords: List[Chord], 
                              durations: Optional[List[float]] = None) -> Tuple[Key, float]:
@@ -347,16 +357,14 @@ class KeyDetector:
         if key1.tonic.pitch_class == key2.tonic.pitch_class:
             if key1.mode != key2.mode:
                 analysis['relationship'] = 'parallel'
-                analysis['common_notes'] = len(set(key1.scale.pitch_classes) & 
-                                               set(key2.scale.pitch_classes))
+                analysis['common_notes'] = len(key1.pitch_class_set & key2.pitch_class_set)
             return analysis
         
         # Check for closely related keys
         key1_related = key1.get_closely_related_keys()
         if key2 in key1_related:
             analysis['relationship'] = 'closely_related'
-            analysis['common_notes'] = len(set(key1.scale.pitch_classes) & 
-                                           set(key2.scale.pitch_classes))
+            analysis['common_notes'] = len(key1.pitch_class_set & key2.pitch_class_set)
             return analysis
         
         # Calculate distance on circle of fifths
@@ -397,7 +405,7 @@ class KeyDetector:
             analysis['distance'] = 7  # Maximum distance
         
         # Count common notes
-        common_pitch_classes = set(key1.scale.pitch_classes) & set(key2.scale.pitch_classes)
+        common_pitch_classes = key1.pitch_class_set & key2.pitch_class_set
         analysis['common_notes'] = len(common_pitch_classes)
         
         return analysis
\ No newline at end of file
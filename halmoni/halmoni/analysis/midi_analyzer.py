@@ -1,24 +1,30 @@
 """MIDI file analysis and preprocessing utilities."""
 
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Union
 import mido
 import numpy as np
 from ..core import Note, Chord
+from .note_table import NoteTable
+from .smf_reader import read_smf, UnsupportedMidiFile
 
 
 class MIDIAnalyzer:
     """Analyzes MIDI files and extracts musical information."""
     
-    def __init__(self, quantization: float = 0.25, min_velocity: int = 20):
+    def __init__(self, quantization: float = 0.25, min_velocity: int = 20,
+                 fast_parser: bool = True):
         """
         Initialize MIDI analyzer.
         
         Args:
             quantization: Time quantization in beats (0.25 = 16th notes)
             min_velocity: Minimum velocity to consider a note active
+            fast_parser: Read files with the direct SMF reader, falling back
+                to mido for files it doesn't support
         """
         self.quantization = quantization
         self.min_velocity = min_velocity
+        self.fast_parser = fast_parser
     
     def load_midi_file(self, filepath: str) -> Dict[str, any]:
         """
@@ -28,16 +34,14 @@ class MIDIAnalyzer:
             filepath: Path to MIDI file
             
         Returns:
-            Dictionary with MIDI analysis data
+            Dictionary with MIDI analysis data; 'notes' holds note dictionaries
+            and 'note_table' the same notes as a NoteTable
         """
-        try:
-            midi_file = mido.MidiFile(filepath)
-        except Exception as e:
-            raise ValueError(f"Could not load MIDI file: {e}")
+        ticks_per_beat, tracks = self._read_tracks(filepath)
         
         analysis = {
             'filename': filepath,
-            'ticks_per_beat': midi_file.ticks_per_beat,
+            'ticks_per_beat': ticks_per_beat,
             'tempo': 120,  # Default, will be updated if tempo changes found
             'time_signature': (4, 4),  # Default
             'tracks': [],
@@ -47,8 +51,8 @@ class MIDIAnalyzer:
         }
         
         # Process each track
-        for track_idx, track in enumerate(midi_file.tracks):
-            track_analysis = self._analyze_track(track, midi_file.ticks_per_beat, track_idx)
+        for track_analysis in tracks:
+            track_analysis['notes'] = track_analysis['note_table'].to_dicts()
             analysis['tracks'].append(track_analysis)
             analysis['notes'].extend(track_analysis['notes'])
             
@@ -63,21 +67,74 @@ class MIDIAnalyzer:
         
         # Sort notes by time
         analysis['notes'] = sorted(analysis['notes'], key=lambda n: n['start_time'])
+        analysis['note_table'] = NoteTable.concatenate(
+            track['note_table'] for track in analysis['tracks']
+        ).sorted_by_start()
         
         return analysis
     
+    def load_note_table(self, filepath: str) -> NoteTable:
+        """
+        Load the notes of a MIDI file without building note dictionaries.
+        
+        Args:
+            filepath: Path to MIDI file
+            
+        Returns:
+            NoteTable of all notes sorted by start time
+        """
+        _, tracks = self._read_tracks(filepath)
+        return NoteTable.concatenate(track['note_table'] for track in tracks).sorted_by_start()
+    
+    def _read_tracks(self, filepath: str) -> Tuple[int, List[Dict[str, any]]]:
+        """Read every track of a MIDI file; returns (ticks_per_beat, track analyses)."""
+        if self.fast_parser:
+            try:
+                return read_smf(filepath, self.min_velocity)
+            except (UnsupportedMidiFile, OSError):
+                pass  # Exotic, malformed or unreadable file; let mido handle or report it
+        
+        midi_file = self._open_midi_file(filepath)
+        return midi_file.ticks_per_beat, [
+            self._read_track(track, midi_file.ticks_per_beat, track_idx)
+            for track_idx, track in enumerate(midi_file.tracks)
+        ]
+    
+    def _open_midi_file(self, filepath: str) -> mido.MidiFile:
+        try:
+            return mido.MidiFile(filepath)
+        except Exception as e:
+            raise ValueError(f"Could not load MIDI file: {e}")
+    
     def _analyze_track(self, track: mido.MidiTrack, ticks_per_beat: int, track_idx: int) -> Dict[str, any]:
         """Analyze a single MIDI track."""
+        track_analysis = self._read_track(track, ticks_per_beat, track_idx)
+        track_analysis['notes'] = track_analysis['note_table'].to_dicts()
+        return track_analysis
+    
+    def _read_track(self, track: mido.MidiTrack, ticks_per_beat: int, track_idx: int) -> Dict[str, any]:
+        """Read a single MIDI track's metadata and notes, as a NoteTable."""
         track_analysis = {
             'track_index': track_idx,
             'track_name': '',
             'channel': None,
-            'notes': [],
             'tempo_changes': [],
             'time_signature_changes': [],
-            'active_notes': {}  # For tracking note on/off events
         }
         
+        # Note columns, in note-off order
+        columns = {field: [] for field in NoteTable.FIELDS}
+        active_notes = {}  # (channel, note) -> (velocity, start_time), for note off events
+        
+        def add_note(channel: int, note: int, end_time: float) -> None:
+            velocity, start_time = active_notes.pop((channel, note))
+            columns['midi_note'].append(note)
+            columns['velocity'].append(velocity)
+            columns['channel'].append(channel)
+            columns['start_time'].append(start_time)
+            columns['end_time'].append(end_time)
+            columns['duration'].append(end_time - start_time)
+        
         current_time = 0
         current_tempo = 500000  # Default tempo (120 BPM in microseconds)
         
@@ -105,38 +162,22 @@ class MIDIAnalyzer:
                 # Convert ticks to beats
                 time_beats = mido.tick2second(current_time, ticks_per_beat, current_tempo) * (current_tempo / 500000) * 2
                 
-                note_data = {
-                    'midi_note': msg.note,
-                    'velocity': msg.velocity,
-                    'channel': msg.channel,
-                    'start_time': time_beats,
-                    'end_time': None  # Will be set by note_off
-                }
-                
                 # Store in active notes for when we get the note_off
-                key = (msg.channel, msg.note)
-                track_analysis['active_notes'][key] = note_data
+                active_notes[(msg.channel, msg.note)] = (msg.velocity, time_beats)
                 
                 if track_analysis['channel'] is None:
                     track_analysis['channel'] = msg.channel
             
             elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-                key = (msg.channel, msg.note)
-                if key in track_analysis['active_notes']:
-                    note_data = track_analysis['active_notes'][key]
+                if (msg.channel, msg.note) in active_notes:
                     time_beats = mido.tick2second(current_time, ticks_per_beat, current_tempo) * (current_tempo / 500000) * 2
-                    note_data['end_time'] = time_beats
-                    note_data['duration'] = time_beats - note_data['start_time']
-                    
-                    track_analysis['notes'].append(note_data)
-                    del track_analysis['active_notes'][key]
+                    add_note(msg.channel, msg.note, time_beats)
         
         # Handle any remaining active notes (treat as ending at track end)
-        for note_data in track_analysis['active_notes'].values():
-            note_data['end_time'] = current_time
-            note_data['duration'] = current_time - note_data['start_time']
-            track_analysis['notes'].append(note_data)
+        for channel, note in list(active_notes):
+            add_note(channel, note, current_time)
         
+        track_analysis['note_table'] = NoteTable(**columns)
         return track_analysis
     
     def quantize_timing(self, notes: List[Dict], quantization: Optional[float] = None) -> List[Dict]:
@@ -167,42 +208,46 @@ class MIDIAnalyzer:
         
         return quantized_notes
     
-    def group_simultaneous_notes(self, notes: List[Dict], tolerance: float = 0.1) -> List[List[Dict]]:
+    def group_simultaneous_notes(self, notes: Union[List[Dict], NoteTable],
+                                 tolerance: float = 0.1) -> Union[List[List[Dict]], List[NoteTable]]:
         """
         Group notes that occur simultaneously (within tolerance).
         
         Args:
-            notes: List of note dictionaries
+            notes: List of note dictionaries or a NoteTable
             tolerance: Time tolerance for grouping (in beats)
             
         Returns:
-            List of note groups (each group is a list of simultaneous notes)
+            List of note groups (each group is a list of simultaneous notes,
+            or a NoteTable for NoteTable input)
         """
-        if not notes:
+        if not len(notes):
             return []
         
+        if isinstance(notes, NoteTable):
+            sorted_notes = notes.sorted_by_start()
+            bounds = self._group_bounds(sorted_notes.start_time.tolist(), tolerance)
+            return [sorted_notes[start:end] for start, end in zip(bounds, bounds[1:])]
+        
         # Sort notes by start time
         sorted_notes = sorted(notes, key=lambda n: n['start_time'])
-        
-        groups = []
-        current_group = [sorted_notes[0]]
-        current_time = sorted_notes[0]['start_time']
-        
-        for note in sorted_notes[1:]:
-            if abs(note['start_time'] - current_time) <= tolerance:
-                # Add to current group
-                current_group.append(note)
-            else:
+        bounds = self._group_bounds([note['start_time'] for note in sorted_notes], tolerance)
+        return [sorted_notes[start:end] for start, end in zip(bounds, bounds[1:])]
+    
+    @staticmethod
+    def _group_bounds(sorted_starts: List[float], tolerance: float) -> List[int]:
+        """Offsets where each group of simultaneous notes starts, plus the end."""
+        bounds = [0]
+        current_time = sorted_starts[0]
+        
+        for i, start_time in enumerate(sorted_starts):
+            if abs(start_time - current_time) > tolerance:
                 # Start new group
-                groups.append(current_group)
-                current_group = [note]
-                current_time = note['start_time']
+                bounds.append(i)
+                current_time = start_time
         
-        # Add the last group
-        if current_group:
-            groups.append(current_group)
-        
-        return groups
+        bounds.append(len(sorted_starts))
+        return bounds
     
     def extract_melody_line(self, notes: List[Dict]) -> List[Dict]:
         """
@@ -263,43 +308,74 @@ class MIDIAnalyzer:
         
         return active_notes
     
-    def get_time_windows(self, notes: List[Dict], window_size: float) -> List[Tuple[float, List[Dict]]]:
+    def get_time_windows(self, notes: Union[List[Dict], NoteTable],
+                         window_size: float) -> Union[List[Tuple[float, List[Dict]]], List[Tuple[float, NoteTable]]]:
         """
         Divide notes into time windows for analysis.
         
         Args:
-            notes: List of note dictionaries
+            notes: List of note dictionaries or a NoteTable
             window_size: Size of each window in beats
             
         Returns:
-            List of (window_start_time, notes_in_window) tuples
+            List of (window_start_time, notes_in_window) tuples; window notes
+            keep the input order and are a NoteTable for NoteTable input
         """
-        if not notes:
+        if not len(notes):
             return []
         
-        # Find the time range
-        start_time = min(note['start_time'] for note in notes)
-        end_time = max(note['end_time'] for note in notes)
+        if isinstance(notes, NoteTable):
+            windows = self._time_window_indices(notes.start_time, notes.end_time, window_size)
+            return [(window_start, notes[indices]) for window_start, indices in windows]
         
-        windows = []
-        current_time = start_time
+        count = len(notes)
+        start_times = np.fromiter((note['start_time'] for note in notes), dtype=float, count=count)
+        end_times = np.fromiter((note['end_time'] for note in notes), dtype=float, count=count)
+        windows = self._time_window_indices(start_times, end_times, window_size)
+        return [(window_start, [notes[i] for i in indices.tolist()]) for window_start, indices in windows]
+    
+    @staticmethod
+    def _time_window_indices(start_times: np.ndarray, end_times: np.ndarray,
+                             window_size: float) -> List[Tuple[float, np.ndarray]]:
+        """
+        Indices of the notes overlapping each non-empty window.
         
+        A note overlaps window k when it starts before the window ends and
+        ends after the window starts. Window boundaries only grow, so those
+        windows form one contiguous run per note, found by binary search;
+        the cost is O((notes + windows) log notes) plus the output size.
+        """
+        # Window starts accumulate window_size, as the windows always have
+        window_starts = []
+        current_time = start_times.min().item()
+        end_time = end_times.max().item()
         while current_time < end_time:
-            window_end = current_time + window_size
-            
-            # Find notes that are active during this window
-            window_notes = []
-            for note in notes:
-                # Note is in window if it overlaps with the window time range
-                if note['start_time'] < window_end and note['end_time'] > current_time:
-                    window_notes.append(note)
-            
-            if window_notes:  # Only add non-empty windows
-                windows.append((current_time, window_notes))
-            
+            window_starts.append(current_time)
             current_time += window_size
         
-        return windows
+        starts = np.array(window_starts)
+        ends = starts + window_size
+        
+        # Note i overlaps windows first[i] .. last[i] - 1
+        first = np.searchsorted(ends, start_times, side='right')
+        last = np.searchsorted(starts, end_times, side='left')
+        counts = np.maximum(last - first, 0)
+        
+        note_indices = np.repeat(np.arange(len(start_times)), counts)
+        offsets = np.repeat(np.cumsum(counts) - counts, counts)
+        window_indices = np.repeat(first, counts) + (np.arange(len(note_indices)) - offsets)
+        
+        # Group by window, keeping notes in input order within each window
+        order = np.lexsort((note_indices, window_indices))
+        note_indices = note_indices[order]
+        window_indices = window_indices[order]
+        
+        windows, bounds = np.unique(window_indices, return_index=True)
+        bounds = bounds.tolist() + [len(note_indices)]
+        return [
+            (window_starts[window], note_indices[start:end])
+            for window, start, end in zip(windows.tolist(), bounds, bounds[1:])
+        ]
     
     def convert_to_note_objects(self, midi_notes: List[Dict]) -> List[Note]:
         """
@@ -323,27 +399,31 @@ class MIDIAnalyzer:
         
         return note_objects
     
-    def get_pitch_class_histogram(self, notes: List[Dict]) -> Dict[str, int]:
+    def get_pitch_class_histogram(self, notes: Union[List[Dict], NoteTable]) -> Dict[str, int]:
         """
         Create a histogram of pitch classes in the notes.
         
         Args:
-            notes: List of note dictionaries
+            notes: List of note dictionaries or a NoteTable
             
         Returns:
-            Dictionary mapping pitch classes to occurrence counts
+            Dictionary mapping pitch classes to occurrence counts, in order of
+            first occurrence
         """
-        histogram = {}
-        
-        for note_dict in notes:
-            try:
-                note = Note(note_dict['midi_note'])
-                pitch_class = note.pitch_class
-                histogram[pitch_class] = histogram.get(pitch_class, 0) + 1
-            except ValueError:
-                continue
-        
-        return histogram
+        if isinstance(notes, NoteTable):
+            midi_notes = notes.midi_note
+        else:
+            midi_notes = np.array([note_dict['midi_note'] for note_dict in notes], dtype=int)
+        
+        # Skip invalid MIDI notes
+        pitch_classes = midi_notes[(midi_notes >= 0) & (midi_notes <= 127)] % 12
+        counts = np.bincount(pitch_classes, minlength=12)
+        
+        present, first_seen = np.unique(pitch_classes, return_index=True)
+        return {
+            Note.CHROMATIC_SCALE[pitch_class]: int(counts[pitch_class])
+            for pitch_class in present[np.argsort(first_seen)].tolist()
+        }
     
     def detect_key_signature(self, notes: List[Dict]) -> Tuple[str, str]:
         """
@@ -0,0 +1,136 @@
+"""Columnar note storage for MIDI analysis."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+import numpy as np
+
+
+class NoteTable:
+    """
+    Notes stored as parallel NumPy arrays, one per field.
+
+    Holds the same fields as the note dictionaries produced by MIDIAnalyzer
+    (midi_note, velocity, channel, start_time, end_time, duration) in about
+    30 bytes per note instead of a dict per note, so analysis passes can be
+    array operations. Row i of every array describes note i.
+    """
+
+    FIELDS = ('midi_note', 'velocity', 'channel', 'start_time', 'end_time', 'duration')
+    __slots__ = FIELDS
+    DTYPES = {
+        'midi_note': np.int16,
+        'velocity': np.int16,
+        'channel': np.int8,
+        'start_time': np.float64,
+        'end_time': np.float64,
+        'duration': np.float64,
+    }
+
+    def __init__(self, midi_note: Sequence[int], velocity: Sequence[int],
+                 channel: Sequence[int], start_time: Sequence[float],
+                 end_time: Sequence[float], duration: Optional[Sequence[float]] = None):
+        """
+        Initialize a note table.
+
+        Args:
+            midi_note: MIDI note numbers
+            velocity: Note-on velocities
+            channel: MIDI channels
+            start_time: Note start times in beats
+            end_time: Note end times in beats
+            duration: Note durations (end_time - start_time if not provided)
+        """
+        self.midi_note = np.asarray(midi_note, dtype=self.DTYPES['midi_note'])
+        self.velocity = np.asarray(velocity, dtype=self.DTYPES['velocity'])
+        self.channel = np.asarray(channel, dtype=self.DTYPES['channel'])
+        self.start_time = np.asarray(start_time, dtype=self.DTYPES['start_time'])
+        self.end_time = np.asarray(end_time, dtype=self.DTYPES['end_time'])
+        if duration is None:
+            duration = self.end_time - self.start_time
+        self.duration = np.asarray(duration, dtype=self.DTYPES['duration'])
+
+        lengths = {len(getattr(self, field)) for field in self.FIELDS}
+        if len(lengths) > 1:
+            raise ValueError("All note table columns must have the same length")
+
+    @classmethod
+    def _from_columns(cls, midi_note: np.ndarray, velocity: np.ndarray, channel: np.ndarray,
+                      start_time: np.ndarray, end_time: np.ndarray, duration: np.ndarray) -> 'NoteTable':
+        """Wrap columns that already have the right dtypes and lengths."""
+        table = object.__new__(cls)
+        table.midi_note = midi_note
+        table.velocity = velocity
+        table.channel = channel
+        table.start_time = start_time
+        table.end_time = end_time
+        table.duration = duration
+        return table
+
+    @classmethod
+    def empty(cls) -> 'NoteTable':
+        """Create a table with no notes."""
+        return cls([], [], [], [], [])
+
+    @classmethod
+    def from_dicts(cls, notes: Iterable[Dict]) -> 'NoteTable':
+        """
+        Create a table from note dictionaries.
+
+        Notes must have midi_note, start_time and end_time; velocity defaults
+        to 64, channel to 0 and duration to end_time - start_time.
+
+        Args:
+            notes: Note dictionaries as produced by MIDIAnalyzer
+        """
+        notes = list(notes)
+        return cls(
+            midi_note=[note['midi_note'] for note in notes],
+            velocity=[note.get('velocity', 64) for note in notes],
+            channel=[note.get('channel', 0) for note in notes],
+            start_time=[note['start_time'] for note in notes],
+            end_time=[note['end_time'] for note in notes],
+            duration=[note.get('duration', note['end_time'] - note['start_time']) for note in notes],
+        )
+
+    @classmethod
+    def concatenate(cls, tables: Iterable['NoteTable']) -> 'NoteTable':
+        """Join tables one after another."""
+        tables = list(tables)
+        if not tables:
+            return cls.empty()
+        return cls(*(np.concatenate([getattr(table, field) for table in tables]) for field in cls.FIELDS))
+
+    def to_dicts(self) -> List[Dict]:
+        """Get the notes as dictionaries, in the format MIDIAnalyzer used to produce."""
+        columns = [getattr(self, field).tolist() for field in self.FIELDS]
+        return [dict(zip(self.FIELDS, row)) for row in zip(*columns)]
+
+    def sorted_by_start(self) -> 'NoteTable':
+        """Get the notes sorted by start time, keeping the order of equal starts."""
+        return self[np.argsort(self.start_time, kind='stable')]
+
+    @property
+    def pitch_classes(self) -> np.ndarray:
+        """Get the pitch class (0-11) of every note."""
+        return self.midi_note % 12
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the columns in bytes."""
+        return sum(getattr(self, field).nbytes for field in self.FIELDS)
+
+    def __len__(self) -> int:
+        """Number of notes in the table."""
+        return len(self.midi_note)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray, List[int]]) -> Union[Dict, 'NoteTable']:
+        """Get one note as a dictionary, or a table of the selected notes."""
+        if isinstance(index, (int, np.integer)):
+            return {field: getattr(self, field)[index].item() for field in self.FIELDS}
+        return NoteTable._from_columns(
+            self.midi_note[index], self.velocity[index], self.channel[index],
+            self.start_time[index], self.end_time[index], self.duration[index],
+        )
+
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return f"NoteTable({len(self)} notes)"
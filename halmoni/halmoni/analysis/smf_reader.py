@@ -0,0 +1,216 @@
+"""Direct Standard MIDI File reader for note extraction."""
+
+import mmap
+import struct
+from typing import Dict, List, Tuple
+import mido
+from .note_table import NoteTable
+
+
+class UnsupportedMidiFile(ValueError):
+    """The file uses something the direct reader doesn't handle; use mido instead."""
+
+
+def read_smf(filepath: str, min_velocity: int = 20) -> Tuple[int, List[Dict[str, any]]]:
+    """
+    Read the tracks of a Standard MIDI File straight from its bytes.
+
+    The file is memory-mapped and its track chunks are decoded in one pass:
+    variable-length deltas, running status, note on/off, tempo, time
+    signature and track name events. No message objects are created; notes
+    go straight into NoteTable columns. The results are the same as reading
+    the file with mido and MIDIAnalyzer._read_track.
+
+    Args:
+        filepath: Path to MIDI file
+        min_velocity: Minimum velocity for a note_on to start a note
+
+    Returns:
+        Tuple of (ticks_per_beat, track analyses as returned by
+        MIDIAnalyzer._read_track)
+
+    Raises:
+        UnsupportedMidiFile: If the file is malformed or uses SMPTE timing,
+            system common messages or running status after sysex
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # Empty file
+            raise UnsupportedMidiFile(str(e))
+
+    with data:
+        try:
+            return _read_chunks(data, min_velocity)
+        except (IndexError, struct.error) as e:  # Truncated file
+            raise UnsupportedMidiFile(f"Truncated MIDI file: {e}")
+
+
+def _read_chunks(data: mmap.mmap, min_velocity: int) -> Tuple[int, List[Dict[str, any]]]:
+    if data[0:4] != b'MThd':
+        raise UnsupportedMidiFile("MThd not found")
+    header_size = int.from_bytes(data[4:8], 'big')
+    if header_size < 6:
+        raise UnsupportedMidiFile("MIDI header too short")
+    _, num_tracks, ticks_per_beat = struct.unpack('>hhh', data[8:14])
+    if ticks_per_beat <= 0:
+        raise UnsupportedMidiFile("SMPTE time division")
+
+    tracks = []
+    position = 8 + header_size
+    for track_idx in range(num_tracks):
+        if data[position:position + 4] != b'MTrk':
+            raise UnsupportedMidiFile("No MTrk header at start of track")
+        size = int.from_bytes(data[position + 4:position + 8], 'big')
+        start = position + 8
+        end = start + size
+        if end > len(data):
+            raise UnsupportedMidiFile("Track chunk runs past the end of the file")
+        tracks.append(_read_track(data, start, end, ticks_per_beat, track_idx, min_velocity))
+        position = end
+
+    return ticks_per_beat, tracks
+
+
+def _read_track(data: mmap.mmap, position: int, end: int, ticks_per_beat: int,
+                track_idx: int, min_velocity: int) -> Dict[str, any]:
+    track_analysis = {
+        'track_index': track_idx,
+        'track_name': '',
+        'channel': None,
+        'tempo_changes': [],
+        'time_signature_changes': [],
+    }
+
+    midi_notes, velocities, channels, start_times, end_times, durations = [], [], [], [], [], []
+    active_notes = {}  # (channel, note) -> (velocity, start_time), for note off events
+
+    current_time = 0
+    current_tempo = 500000  # Default tempo (120 BPM in microseconds)
+    tick_scale = current_tempo * 1e-6 / ticks_per_beat  # As mido.tick2second
+    tempo_ratio = current_tempo / 500000
+    last_status = None
+
+    while position < end:
+        # Variable-length delta time
+        byte = data[position]
+        position += 1
+        delta = byte & 0x7F
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            delta = (delta << 7) | (byte & 0x7F)
+        current_time += delta
+
+        status = data[position]
+        if status < 0x80:
+            # Running status: this is the first data byte
+            if last_status is None or last_status >= 0xF0:
+                raise UnsupportedMidiFile("Running status without a channel status")
+            status = last_status
+        else:
+            position += 1
+            if status != 0xFF:
+                # Meta messages don't set running status
+                last_status = status
+
+        kind = status & 0xF0
+        if kind == 0x90 or kind == 0x80:
+            note = data[position]
+            velocity = data[position + 1]
+            position += 2
+            if note > 127 or velocity > 127:
+                raise UnsupportedMidiFile("Data byte out of range")
+            channel = status & 0x0F
+
+            if kind == 0x90 and velocity >= min_velocity:
+                # Convert ticks to beats
+                time_beats = current_time * tick_scale * tempo_ratio * 2
+                active_notes[(channel, note)] = (velocity, time_beats)
+                if track_analysis['channel'] is None:
+                    track_analysis['channel'] = channel
+
+            elif kind == 0x80 or velocity == 0:
+                started = active_notes.pop((channel, note), None)
+                if started is not None:
+                    time_beats = current_time * tick_scale * tempo_ratio * 2
+                    midi_notes.append(note)
+                    velocities.append(started[0])
+                    channels.append(channel)
+                    start_times.append(started[1])
+                    end_times.append(time_beats)
+                    durations.append(time_beats - started[1])
+
+        elif kind == 0xA0 or kind == 0xB0 or kind == 0xE0:
+            if data[position] > 127 or data[position + 1] > 127:
+                raise UnsupportedMidiFile("Data byte out of range")
+            position += 2
+
+        elif kind == 0xC0 or kind == 0xD0:
+            if data[position] > 127:
+                raise UnsupportedMidiFile("Data byte out of range")
+            position += 1
+
+        elif status == 0xFF:
+            meta_type = data[position]
+            position += 1
+            length, position = _read_variable_int(data, position)
+            payload = data[position:position + length]
+            position += length
+
+            if meta_type == 0x03:
+                track_analysis['track_name'] = payload.decode('latin1')
+
+            elif meta_type == 0x51:
+                if length < 3:
+                    raise UnsupportedMidiFile("Short set_tempo event")
+                current_tempo = (payload[0] << 16) | (payload[1] << 8) | payload[2]
+                tick_scale = current_tempo * 1e-6 / ticks_per_beat
+                tempo_ratio = current_tempo / 500000
+                track_analysis['tempo_changes'].append({
+                    'time': current_time,
+                    'tempo': mido.tempo2bpm(current_tempo)
+                })
+
+            elif meta_type == 0x58:
+                if length < 4:
+                    raise UnsupportedMidiFile("Short time_signature event")
+                track_analysis['time_signature_changes'].append({
+                    'time': current_time,
+                    'time_signature': (payload[0], 2 ** payload[1])
+                })
+
+        elif status == 0xF0 or status == 0xF7:
+            length, position = _read_variable_int(data, position)
+            position += length
+
+        else:
+            raise UnsupportedMidiFile(f"Unsupported status byte 0x{status:02x}")
+
+    if position != end:
+        raise UnsupportedMidiFile("Event runs past the end of its track chunk")
+
+    # Handle any remaining active notes (treat as ending at track end)
+    for (channel, note), (velocity, start_time) in active_notes.items():
+        midi_notes.append(note)
+        velocities.append(velocity)
+        channels.append(channel)
+        start_times.append(start_time)
+        end_times.append(current_time)
+        durations.append(current_time - start_time)
+
+    track_analysis['note_table'] = NoteTable(
+        midi_notes, velocities, channels, start_times, end_times, durations
+    )
+    return track_analysis
+
+
+def _read_variable_int(data: mmap.mmap, position: int) -> Tuple[int, int]:
+    """Decode a variable-length quantity; returns (value, next position)."""
+    value = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, position
@@ -2,6 +2,7 @@
 
 from .note import Note
 from .interval import Interval
+from .pitch_class_set import PitchClassSet
 from .chord import Chord, ChordVoicing, ChordInversion
 from .scale import Scale
 from .key import Key
@@ -10,6 +11,7 @@ from .progression import ChordProgression
 __all__ = [
     "Note",
     "Interval",
+    "PitchClassSet",
     "Chord", 
     "ChordVoicing",
     "ChordInversion",
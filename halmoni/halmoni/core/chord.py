@@ -1,13 +1,18 @@
 """Chord-related classes for representing musical chords and voicings."""
 
-from typing import List, Optional, Set, Tuple, Dict
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Set, Tuple, Dict
 from .note import Note
 from .interval import Interval
+from .pitch_class_set import PitchClassSet
 
 
 class Chord:
     """Represents a musical chord with root, quality, and extensions."""
     
+    __slots__ = ('root', 'quality', 'bass', '_notes', '_pitch_classes', '_pitch_class_set', '_hash')
+    
     CHORD_TONES = {
         'major': [0, 4, 7],
         'minor': [0, 3, 7], 
@@ -29,6 +34,22 @@ class Chord:
         'dominant13': [0, 4, 7, 10, 2, 5, 9],
         'sus2': [0, 2, 7],
         'sus4': [0, 5, 7],
+        'major6': [0, 4, 7, 9],
+        'minor6': [0, 3, 7, 9],
+        'six_nine': [0, 4, 7, 9, 2],
+        'minor_six_nine': [0, 3, 7, 9, 2],
+        'add9': [0, 4, 7, 2],
+        'minor_add9': [0, 3, 7, 2],
+        'minor_major7': [0, 3, 7, 11],
+        'augmented7': [0, 4, 8, 10],
+        'major7#11': [0, 4, 7, 11, 6],
+        'dominant7sus4': [0, 5, 7, 10],
+        'dominant7b5': [0, 4, 6, 10],
+        'dominant7#5': [0, 4, 8, 10],
+        'dominant7b9': [0, 4, 7, 10, 1],
+        'dominant7#9': [0, 4, 7, 10, 3],
+        'dominant7#11': [0, 4, 7, 10, 6],
+        'dominant7b13': [0, 4, 7, 10, 8],
     }
     
     CHORD_SYMBOLS = {
@@ -52,117 +73,172 @@ class Chord:
         'dominant13': '13',
         'sus2': 'sus2',
         'sus4': 'sus4',
+        'major6': '6',
+        'minor6': 'm6',
+        'six_nine': '6/9',
+        'minor_six_nine': 'm6/9',
+        'add9': 'add9',
+        'minor_add9': 'madd9',
+        'minor_major7': 'mMaj7',
+        'augmented7': 'aug7',
+        'major7#11': 'maj7#11',
+        'dominant7sus4': '7sus4',
+        'dominant7b5': '7b5',
+        'dominant7#5': '7#5',
+        'dominant7b9': '7b9',
+        'dominant7#9': '7#9',
+        'dominant7#11': '7#11',
+        'dominant7b13': '7b13',
+    }
+    
+    # Quality spellings accepted by from_symbol besides the CHORD_SYMBOLS ones
+    QUALITY_ALIASES = {
+        'M': 'major',
+        'maj': 'major',
+        'min': 'minor',
+        '-': 'minor',
+        '°': 'diminished',
+        '+': 'augmented',
+        'M7': 'major7',
+        'Δ': 'major7',
+        'Δ7': 'major7',
+        'min7': 'minor7',
+        '-7': 'minor7',
+        '°7': 'diminished7',
+        'ø': 'half_diminished7',
+        'ø7': 'half_diminished7',
+        'min7b5': 'half_diminished7',
+        '-7b5': 'half_diminished7',
+        'M9': 'major9',
+        'min9': 'minor9',
+        '-9': 'minor9',
+        'min11': 'minor11',
+        'min13': 'minor13',
+        'sus': 'sus4',
+        'M6': 'major6',
+        'maj6': 'major6',
+        'min6': 'minor6',
+        '-6': 'minor6',
+        '69': 'six_nine',
+        'm69': 'minor_six_nine',
+        '2': 'add9',
+        'add2': 'add9',
+        'madd2': 'minor_add9',
+        'minadd9': 'minor_add9',
+        'mM7': 'minor_major7',
+        'mmaj7': 'minor_major7',
+        'minmaj7': 'minor_major7',
+        '+7': 'augmented7',
+        '7+': 'augmented7',
+        'aug7': 'augmented7',
+        'maj7#11': 'major7#11',
+        'M7#11': 'major7#11',
+        'Δ#11': 'major7#11',
+        '7sus': 'dominant7sus4',
+        '7+5': 'dominant7#5',
+        '7-5': 'dominant7b5',
+        '7-9': 'dominant7b9',
+        '7+9': 'dominant7#9',
+        '7+11': 'dominant7#11',
     }
     
-    def __init__(self, root: Note, quality: str, bass: Optional[Note] = None):
+    def __new__(cls, root: Note, quality: str, bass: Optional[Note] = None) -> 'Chord':
         """
-        Initialize a Chord.
+        Create a Chord.
+        
+        Chords are immutable and interned by (root, quality, bass) spelling, so
+        their notes and pitch classes are computed once per distinct chord.
         
         Args:
             root: Root note of the chord
             quality: Chord quality (e.g., 'major', 'minor7', 'dominant9')
             bass: Bass note for slash chords (optional)
         """
-        self.root = root
-        self.quality = quality
-        self.bass = bass or root
+        bass = bass or root
+        key = (root.pitch_class, root.octave, quality, bass.pitch_class, bass.octave)
+        chord = _CHORDS.get(key)
+        if chord is not None:
+            return chord
         
-        if quality not in self.CHORD_TONES:
+        if quality not in cls.CHORD_TONES:
             raise ValueError(f"Unknown chord quality: {quality}")
+        
+        chord = object.__new__(cls)
+        object.__setattr__(chord, 'root', root)
+        object.__setattr__(chord, 'quality', quality)
+        object.__setattr__(chord, 'bass', bass)
+        object.__setattr__(chord, '_notes', None)
+        object.__setattr__(chord, '_pitch_classes', None)
+        object.__setattr__(chord, '_pitch_class_set', None)
+        object.__setattr__(chord, '_hash', hash((root, quality, bass)))
+        _CHORDS[key] = chord
+        return chord
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Chord is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Chord is immutable")
+    
+    def __reduce__(self) -> Tuple[type, tuple]:
+        """Pickle by value so unpickled chords are the interned instances."""
+        return (Chord, (self.root, self.quality, self.bass))
     
     @classmethod
     def from_symbol(cls, symbol: str, octave: int = 4) -> 'Chord':
         """
         Create a chord from chord symbol notation.
         
+        Parses are cached, so repeated symbols return the interned chord
+        without being parsed again.
+        
         Args:
-            symbol: Chord symbol (e.g., 'Cmaj7', 'Am', 'G7/B')
+            symbol: Chord symbol (e.g., 'Cmaj7', 'Am', 'G7/B', 'C6/9', 'G7(b9)')
             octave: Octave for the root note
         """
-        # Handle slash chords
-        if '/' in symbol:
-            chord_part, bass_part = symbol.split('/')
-            bass_note = Note(bass_part, octave)
-        else:
-            chord_part = symbol
-            bass_note = None
-        
-        # Parse root note
-        if len(chord_part) < 1:
-            raise ValueError("Invalid chord symbol")
-        
-        root_str = chord_part[0]
-        remainder = chord_part[1:]
-        
-        # Handle accidentals
-        if remainder and remainder[0] in '#b':
-            root_str += remainder[0]
-            remainder = remainder[1:]
-        
-        root_note = Note(root_str, octave)
-        
-        # Parse quality
-        quality = cls._parse_quality(remainder)
-        
-        return cls(root_note, quality, bass_note)
+        return _parse_symbol(symbol, octave)
     
     @classmethod
     def _parse_quality(cls, quality_str: str) -> str:
         """Parse chord quality from string."""
-        quality_map = {
-            '': 'major',
-            'M': 'major',
-            'maj': 'major',
-            'm': 'minor',
-            'min': 'minor',
-            'dim': 'diminished',
-            '°': 'diminished',
-            'aug': 'augmented',
-            '+': 'augmented',
-            '7': 'dominant7',
-            'maj7': 'major7',
-            'M7': 'major7',
-            'm7': 'minor7',
-            'min7': 'minor7',
-            'dim7': 'diminished7',
-            '°7': 'diminished7',
-            'm7b5': 'half_diminished7',
-            'ø7': 'half_diminished7',
-            '9': 'dominant9',
-            'maj9': 'major9',
-            'M9': 'major9',
-            'm9': 'minor9',
-            '11': 'dominant11',
-            'maj11': 'major11',
-            'm11': 'minor11',
-            '13': 'dominant13',
-            'maj13': 'major13',
-            'm13': 'minor13',
-            'sus2': 'sus2',
-            'sus4': 'sus4',
-        }
-        
-        if quality_str in quality_map:
-            return quality_map[quality_str]
-        
-        raise ValueError(f"Unknown chord quality: {quality_str}")
+        quality = _QUALITIES.get(quality_str)
+        if quality is None:
+            # Drop parentheses and commas around alterations, e.g. '7(b9)'
+            normalized = quality_str.translate(_QUALITY_NORMALIZATION)
+            quality = _QUALITIES.get(normalized)
+        if quality is None:
+            raise ValueError(f"Unknown chord quality: {quality_str}")
+        return quality
     
     @property
     def notes(self) -> List[Note]:
         """Get all notes in the chord."""
-        intervals = self.CHORD_TONES[self.quality]
-        notes = []
-        
-        for interval_semitones in intervals:
-            note = self.root.transpose(interval_semitones)
-            notes.append(note)
-        
-        return notes
+        if self._notes is None:
+            notes = tuple(
+                self.root.transpose(interval_semitones)
+                for interval_semitones in self.CHORD_TONES[self.quality]
+            )
+            object.__setattr__(self, '_notes', notes)
+        return list(self._notes)
     
     @property
-    def pitch_classes(self) -> Set[str]:
+    def pitch_classes(self) -> FrozenSet[str]:
         """Get unique pitch classes in the chord."""
-        return {note.pitch_class for note in self.notes}
+        if self._pitch_classes is None:
+            if self._notes is None:
+                self.notes
+            pitch_classes = frozenset(note.pitch_class for note in self._notes)
+            object.__setattr__(self, '_pitch_classes', pitch_classes)
+        return self._pitch_classes
+    
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        """Get the chord's pitch classes as a bitmask set."""
+        if self._pitch_class_set is None:
+            if self._notes is None:
+                self.notes
+            object.__setattr__(self, '_pitch_class_set', PitchClassSet.from_notes(self._notes))
+        return self._pitch_class_set
     
     @property
     def symbol(self) -> str:
@@ -176,7 +252,7 @@ class Chord:
     
     def contains_note(self, note: Note) -> bool:
         """Check if chord contains a specific note (by pitch class)."""
-        return note.pitch_class in self.pitch_classes
+        return self.pitch_class_set.contains_note(note)
     
     def get_chord_tone_function(self, note: Note) -> Optional[str]:
         """Get the function of a note in the chord (root, third, fifth, etc.)."""
@@ -225,7 +301,39 @@ class Chord:
     
     def __hash__(self) -> int:
         """Hash based on root, quality, and bass."""
-        return hash((self.root, self.quality, self.bass))
+        return self._hash
+
+
+_SYMBOL_PATTERN = re.compile(r'^([A-G][#b]?)(.*?)(?:/([A-G][#b]?))?$')
+
+_QUALITIES: Dict[str, str] = {
+    **{symbol: quality for quality, symbol in Chord.CHORD_SYMBOLS.items()},
+    **Chord.QUALITY_ALIASES,
+}
+
+_QUALITY_NORMALIZATION = str.maketrans({'(': None, ')': None, ',': None, ' ': None, '♭': 'b', '♯': '#'})
+
+# Unicode accidentals in roots and basses, e.g. 'B♭7/E♭'
+_ACCIDENTAL_NORMALIZATION = str.maketrans({'♭': 'b', '♯': '#'})
+
+
+@lru_cache(maxsize=1024)
+def _parse_symbol(symbol: str, octave: int) -> Chord:
+    """Parse a chord symbol; the result is interned, so it can be cached."""
+    match = _SYMBOL_PATTERN.match(symbol.strip().translate(_ACCIDENTAL_NORMALIZATION))
+    if match is None:
+        raise ValueError(f"Invalid chord symbol: {symbol}")
+    
+    root_str, quality_str, bass_str = match.groups()
+    root_note = Note(root_str, octave)
+    bass_note = Note(bass_str, octave) if bass_str else None
+    quality = Chord._parse_quality(quality_str)
+    
+    return Chord(root_note, quality, bass_note)
+
+
+# Interned chords by (root pitch class, root octave, quality, bass pitch class, bass octave)
+_CHORDS: Dict[Tuple[str, int, str, str, int], Chord] = {}
 
 
 class ChordInversion:
@@ -283,9 +391,8 @@ class ChordVoicing:
         self.notes = sorted(notes)  # Sort by pitch height
         
         # Validate that all notes belong to the chord
-        chord_pitch_classes = chord.pitch_classes
         for note in notes:
-            if note.pitch_class not in chord_pitch_classes:
+            if not chord.contains_note(note):
                 raise ValueError(f"Note {note} not in chord {chord}")
     
     @property
@@ -3,6 +3,7 @@
 from typing import List, Dict, Optional, Tuple
 from .note import Note
 from .scale import Scale
+from .pitch_class_set import PitchClassSet
 
 
 class Key:
@@ -67,6 +68,11 @@ class Key:
         """Get the scale associated with this key."""
         return self._scale
     
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        """Get the key's diatonic pitch classes as a bitmask set."""
+        return self._scale.pitch_class_set
+    
     @property
     def signature(self) -> int:
         """Get the key signature (number of sharps/flats)."""
@@ -172,16 +178,14 @@ class Key:
             expected_chord = self.get_chord_for_degree(root_degree)
             
             # Compare chord tones
-            chord_pitch_classes = chord.pitch_classes
-            expected_pitch_classes = expected_chord.pitch_classes
-            
-            if chord_pitch_classes == expected_pitch_classes:
+            if chord.pitch_class_set == expected_chord.pitch_class_set:
                 analysis['is_diatonic'] = True
             else:
                 analysis['is_diatonic'] = False
                 # Find non-chord tones
-                for pitch_class in chord_pitch_classes:
-                    if pitch_class not in self.scale.pitch_classes:
+                scale_pitch_classes = self.pitch_class_set
+                for pitch_class in chord.pitch_classes:
+                    if pitch_class not in scale_pitch_classes:
                         analysis['non_chord_tones'].append(pitch_class)
             
             # Determine harmonic function
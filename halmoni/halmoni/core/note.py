@@ -1,12 +1,14 @@
 """Note class for representing musical notes."""
 
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import re
 
 
 class Note:
     """Represents a musical note with pitch class, octave, and enharmonic handling."""
     
+    __slots__ = ('_pitch_class', '_octave', '_midi_number')
+    
     CHROMATIC_SCALE = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
     FLAT_SCALE = ['C', 'Db', 'D', 'Eb', 'E', 'F', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B']
     
@@ -18,9 +20,12 @@ class Note:
         'A#': 'Bb', 'Bb': 'A#'
     }
     
-    def __init__(self, pitch: Union[str, int], octave: Optional[int] = None):
+    def __new__(cls, pitch: Union[str, int], octave: Optional[int] = None) -> 'Note':
         """
-        Initialize a Note.
+        Create a Note.
+        
+        Notes are immutable and interned: every 'C4' (or MIDI 60) is the same
+        object, so creating and transposing notes doesn't allocate.
         
         Args:
             pitch: Note name (e.g., 'C', 'F#', 'Bb') or MIDI number (0-127)
@@ -29,32 +34,65 @@ class Note:
         if isinstance(pitch, int):
             if not 0 <= pitch <= 127:
                 raise ValueError("MIDI pitch must be between 0 and 127")
-            self._midi_number = pitch
-            self._pitch_class = self.CHROMATIC_SCALE[pitch % 12]
-            self._octave = pitch // 12 - 1
-        else:
-            self._pitch_class = self._normalize_pitch_class(pitch)
-            if octave is None:
-                raise ValueError("Octave must be specified when pitch is a string")
-            if not 0 <= octave <= 10:
-                raise ValueError("Octave must be between 0 and 10")
-            self._octave = octave
-            self._midi_number = self._calculate_midi_number()
-    
-    def _normalize_pitch_class(self, pitch: str) -> str:
+            note = _MIDI_NOTES[pitch]
+            if note is None:
+                note = _MIDI_NOTES[pitch] = cls._intern(
+                    cls.CHROMATIC_SCALE[pitch % 12], pitch // 12 - 1, pitch
+                )
+            return note
+        
+        if octave is not None and 0 <= octave <= 10:
+            note = _NOTES.get((pitch, octave))
+            if note is not None:
+                return note
+        
+        pitch_class = cls._normalize_pitch_class(pitch)
+        if octave is None:
+            raise ValueError("Octave must be specified when pitch is a string")
+        if not 0 <= octave <= 10:
+            raise ValueError("Octave must be between 0 and 10")
+        return cls._intern(pitch_class, octave, cls._calculate_midi_number(pitch_class, octave))
+    
+    @classmethod
+    def _intern(cls, pitch_class: str, octave: int, midi_number: int) -> 'Note':
+        """Return the shared instance for a spelled pitch, creating it once."""
+        note = _NOTES.get((pitch_class, octave))
+        if note is None:
+            note = object.__new__(cls)
+            object.__setattr__(note, '_pitch_class', pitch_class)
+            object.__setattr__(note, '_octave', octave)
+            object.__setattr__(note, '_midi_number', midi_number)
+            _NOTES[(pitch_class, octave)] = note
+        return note
+    
+    @staticmethod
+    def _normalize_pitch_class(pitch: str) -> str:
         """Normalize pitch class string."""
         pitch = pitch.strip()
         if not re.match(r'^[A-G][#b]?$', pitch):
             raise ValueError(f"Invalid pitch class: {pitch}")
         return pitch
     
-    def _calculate_midi_number(self) -> int:
+    @classmethod
+    def _calculate_midi_number(cls, pitch_class: str, octave: int) -> int:
         """Calculate MIDI number from pitch class and octave."""
         try:
-            pitch_index = self.CHROMATIC_SCALE.index(self._pitch_class)
+            pitch_index = cls.CHROMATIC_SCALE.index(pitch_class)
         except ValueError:
-            pitch_index = self.FLAT_SCALE.index(self._pitch_class)
-        return (self._octave + 1) * 12 + pitch_index
+            pitch_index = cls.FLAT_SCALE.index(pitch_class)
+        return (octave + 1) * 12 + pitch_index
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Note is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Note is immutable")
+    
+    def __reduce__(self) -> Tuple[type, tuple]:
+        """Pickle by pitch so unpickled notes are the interned instances."""
+        if self._pitch_class == self.CHROMATIC_SCALE[self._midi_number % 12]:
+            return (Note, (self._midi_number,))
+        return (Note, (self._pitch_class, self._octave))
     
     @property
     def pitch_class(self) -> str:
@@ -110,4 +148,9 @@ class Note:
     
     def __lt__(self, other: 'Note') -> bool:
         """Compare notes by pitch height."""
-        return self._midi_number < other._midi_number
\ No newline at end of file
+        return self._midi_number < other._midi_number
+
+
+# Interned notes by (pitch class, octave), and by MIDI number for MIDI-built notes
+_NOTES: Dict[Tuple[str, int], Note] = {}
+_MIDI_NOTES: List[Optional[Note]] = [None] * 128
@@ -0,0 +1,168 @@
+"""Pitch-class sets stored as 12-bit masks."""
+
+from typing import Dict, Iterable, Iterator, List, Union
+from .note import Note
+
+
+class PitchClassSet:
+    """
+    An immutable set of pitch classes stored as a 12-bit integer.
+
+    Bit n is set when pitch class n (C = 0, C# = 1, ..., B = 11) is present,
+    so membership, subset, intersection and transposition are bit operations.
+    Pitch classes are compared enharmonically: C# and Db are the same bit.
+    """
+
+    __slots__ = ('_mask',)
+
+    FULL_MASK = 0xFFF
+
+    def __new__(cls, mask: int = 0) -> 'PitchClassSet':
+        """
+        Create a pitch-class set.
+
+        Sets are interned, so there is exactly one instance per mask.
+
+        Args:
+            mask: 12-bit mask with bit n set for pitch class n
+        """
+        if not 0 <= mask <= cls.FULL_MASK:
+            raise ValueError(f"Pitch-class mask must be between 0 and {cls.FULL_MASK}")
+        pc_set = _PITCH_CLASS_SETS.get(mask)
+        if pc_set is None:
+            pc_set = object.__new__(cls)
+            object.__setattr__(pc_set, '_mask', mask)
+            _PITCH_CLASS_SETS[mask] = pc_set
+        return pc_set
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> 'PitchClassSet':
+        """Create a set from the pitch classes of some notes."""
+        mask = 0
+        for note in notes:
+            mask |= 1 << (note.midi_number % 12)
+        return cls(mask)
+
+    @classmethod
+    def from_pitch_classes(cls, pitch_classes: Iterable[Union[str, int]]) -> 'PitchClassSet':
+        """Create a set from pitch-class names (e.g. 'C', 'Bb') or numbers 0-11."""
+        mask = 0
+        for pitch_class in pitch_classes:
+            mask |= 1 << pitch_class_number(pitch_class)
+        return cls(mask)
+
+    @property
+    def mask(self) -> int:
+        """Get the 12-bit mask."""
+        return self._mask
+
+    @property
+    def pitch_classes(self) -> List[str]:
+        """Get the pitch-class names in the set, spelled with sharps."""
+        return [Note.CHROMATIC_SCALE[pc] for pc in self]
+
+    def contains_note(self, note: Note) -> bool:
+        """Check if the set contains a note's pitch class."""
+        return bool(self._mask >> (note.midi_number % 12) & 1)
+
+    def transpose(self, semitones: int) -> 'PitchClassSet':
+        """Transpose every pitch class by a number of semitones."""
+        shift = semitones % 12
+        mask = self._mask
+        return PitchClassSet(((mask << shift) | (mask >> (12 - shift))) & self.FULL_MASK)
+
+    def issubset(self, other: 'PitchClassSet') -> bool:
+        """Check if every pitch class in this set is in other."""
+        return self._mask & ~other._mask == 0
+
+    def issuperset(self, other: 'PitchClassSet') -> bool:
+        """Check if every pitch class in other is in this set."""
+        return other._mask & ~self._mask == 0
+
+    def intersection(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        """Get the pitch classes in both sets."""
+        return PitchClassSet(self._mask & other._mask)
+
+    def union(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        """Get the pitch classes in either set."""
+        return PitchClassSet(self._mask | other._mask)
+
+    def difference(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        """Get the pitch classes in this set but not in other."""
+        return PitchClassSet(self._mask & ~other._mask)
+
+    def complement(self) -> 'PitchClassSet':
+        """Get the pitch classes not in this set."""
+        return PitchClassSet(~self._mask & self.FULL_MASK)
+
+    __and__ = intersection
+    __or__ = union
+    __sub__ = difference
+    __le__ = issubset
+    __ge__ = issuperset
+    __invert__ = complement
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("PitchClassSet is immutable")
+
+    def __reduce__(self) -> tuple:
+        """Pickle by mask so unpickled sets are the interned instances."""
+        return (PitchClassSet, (self._mask,))
+
+    def __contains__(self, item: Union[Note, str, int]) -> bool:
+        """Check membership of a Note, pitch-class name or number."""
+        if isinstance(item, Note):
+            return self.contains_note(item)
+        return bool(self._mask >> pitch_class_number(item) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over pitch-class numbers in ascending order."""
+        mask = self._mask
+        return (pc for pc in range(12) if mask >> pc & 1)
+
+    def __len__(self) -> int:
+        """Number of pitch classes in the set."""
+        return self._mask.bit_count()
+
+    def __bool__(self) -> bool:
+        """Whether the set is non-empty."""
+        return self._mask != 0
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality based on the mask."""
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return self._mask == other._mask
+
+    def __hash__(self) -> int:
+        """Hash based on the mask."""
+        return hash(self._mask)
+
+    def __str__(self) -> str:
+        """String representation of the set."""
+        return '{' + ', '.join(self.pitch_classes) + '}'
+
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return f"PitchClassSet(0b{self._mask:012b})"
+
+
+def pitch_class_number(pitch_class: Union[str, int]) -> int:
+    """Get the number (0-11) of a pitch-class name such as 'C#' or 'Db'."""
+    if isinstance(pitch_class, int):
+        if not 0 <= pitch_class <= 11:
+            raise ValueError(f"Pitch class must be between 0 and 11: {pitch_class}")
+        return pitch_class
+    number = _PITCH_CLASS_NUMBERS.get(pitch_class)
+    if number is None:
+        raise ValueError(f"Invalid pitch class: {pitch_class}")
+    return number
+
+
+_PITCH_CLASS_NUMBERS: Dict[str, int] = {
+    **{name: i for i, name in enumerate(Note.FLAT_SCALE)},
+    **{name: i for i, name in enumerate(Note.CHROMATIC_SCALE)},
+}
+
+# Interned sets by mask
+_PITCH_CLASS_SETS: Dict[int, PitchClassSet] = {}
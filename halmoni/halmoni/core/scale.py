@@ -1,8 +1,17 @@
 """Scale class for representing musical scales."""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from .note import Note
 from .interval import Interval
+from .pitch_class_set import PitchClassSet
+
+# Scale contents depend only on the tonic's MIDI number and the interval
+# pattern, so they are computed once and shared by every Scale (and Key).
+_NOTES_CACHE: Dict[Tuple[int, Tuple[int, ...]], Tuple[Note, ...]] = {}
+_PITCH_CLASSES_CACHE: Dict[Tuple[int, Tuple[int, ...]], Tuple[str, ...]] = {}
+_PITCH_CLASS_SET_CACHE: Dict[Tuple[int, Tuple[int, ...]], PitchClassSet] = {}
+_DEGREE_CACHE: Dict[Tuple[int, Tuple[int, ...]], Dict[str, int]] = {}
+_CHORD_CACHE: Dict[Tuple[int, Tuple[int, ...], int, str], 'Chord'] = {}
 
 
 class Scale:
@@ -113,19 +122,39 @@ class Scale:
         """Get the interval pattern in semitones."""
         return self.SCALE_PATTERNS[self.scale_type]
     
+    @property
+    def _cache_key(self) -> Tuple[int, Tuple[int, ...]]:
+        return (self.tonic.midi_number, tuple(self.pattern))
+    
     @property
     def notes(self) -> List[Note]:
         """Get all notes in the scale."""
-        notes = []
-        for semitones in self.pattern:
-            note = self.tonic.transpose(semitones)
-            notes.append(note)
-        return notes
+        cache_key = self._cache_key
+        notes = _NOTES_CACHE.get(cache_key)
+        if notes is None:
+            notes = tuple(self.tonic.transpose(semitones) for semitones in self.pattern)
+            _NOTES_CACHE[cache_key] = notes
+        return list(notes)
     
     @property
     def pitch_classes(self) -> List[str]:
         """Get pitch classes in the scale."""
-        return [note.pitch_class for note in self.notes]
+        cache_key = self._cache_key
+        pitch_classes = _PITCH_CLASSES_CACHE.get(cache_key)
+        if pitch_classes is None:
+            pitch_classes = tuple(note.pitch_class for note in self.notes)
+            _PITCH_CLASSES_CACHE[cache_key] = pitch_classes
+        return list(pitch_classes)
+    
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        """Get the scale's pitch classes as a bitmask set."""
+        cache_key = self._cache_key
+        pc_set = _PITCH_CLASS_SET_CACHE.get(cache_key)
+        if pc_set is None:
+            pc_set = PitchClassSet.from_notes(self.notes)
+            _PITCH_CLASS_SET_CACHE[cache_key] = pc_set
+        return pc_set
     
     def get_degree(self, degree: int) -> Note:
         """Get a specific scale degree (1-based)."""
@@ -135,15 +164,18 @@ class Scale:
     
     def get_note_degree(self, note: Note) -> Optional[int]:
         """Get the degree of a note in the scale (1-based)."""
-        note_pitch_class = note.pitch_class
-        for i, scale_note in enumerate(self.notes):
-            if scale_note.pitch_class == note_pitch_class:
-                return i + 1
-        return None
+        cache_key = self._cache_key
+        degrees = _DEGREE_CACHE.get(cache_key)
+        if degrees is None:
+            degrees = {}
+            for i, scale_note in enumerate(self.notes):
+                degrees.setdefault(scale_note.pitch_class, i + 1)
+            _DEGREE_CACHE[cache_key] = degrees
+        return degrees.get(note.pitch_class)
     
     def contains_note(self, note: Note) -> bool:
         """Check if a note belongs to the scale."""
-        return note.pitch_class in self.pitch_classes
+        return self.pitch_class_set.contains_note(note)
     
     def get_chord_for_degree(self, degree: int, chord_type: str = 'triad') -> 'Chord':
         """
@@ -155,6 +187,11 @@ class Scale:
         """
         from .chord import Chord
         
+        cache_key = (*self._cache_key, degree, chord_type)
+        cached = _CHORD_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
         root = self.get_degree(degree)
         
         if chord_type == 'triad':
@@ -209,7 +246,9 @@ class Scale:
         else:
             quality = 'major'  # Default fallback
         
-        return Chord(root, quality)
+        chord = Chord(root, quality)
+        _CHORD_CACHE[cache_key] = chord
+        return chord
     
     def get_relative_scale(self, scale_type: str) -> 'Scale':
         """Get a relative scale (same notes, different tonic)."""
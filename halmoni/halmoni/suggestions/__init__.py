@@ -8,6 +8,7 @@ from .sub_v7 import SubV7Strategy
 from .suspend import SuspendStrategy
 from .tsd_movement import TSDMovementStrategy
 from .suggestion_engine import ChordSuggestionEngine
+from .session import SuggestionSession
 
 __all__ = [
     "ChordSuggestion",
@@ -19,4 +20,5 @@ __all__ = [
     "SuspendStrategy",
     "TSDMovementStrategy",
     "ChordSuggestionEngine",
+    "SuggestionSession",
 ]
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Base classes for chord suggestion strategies."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
+from typing import Hashable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from ..core import Chord, Key, ChordProgression, Interval
 
@@ -20,26 +20,80 @@ class ChordSuggestion:
 class ChordSuggestionStrategy(ABC):
     """Base class for all chord suggestion strategies."""
     
+    # Chords (before, after) a position that suggest_for_position looks at.
+    # None means the suggestions may depend on any chord in the progression.
+    context_window: Optional[Tuple[int, int]] = None
+    
     @abstractmethod
     def suggest(self, progression: ChordProgression, 
                 key: Optional[Key] = None) -> List[ChordSuggestion]:
         """Generate chord suggestions for the given progression."""
         pass
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """
+        Generate suggestions for the chord at one position.
+        
+        The default runs suggest() over the whole progression and keeps the
+        suggestions at the position. Strategies override it to evaluate only
+        the position and its neighbours, so the cost doesn't grow with the
+        length of the progression.
+        
+        Args:
+            progression: The chord progression
+            position: Index of the chord to get suggestions for
+            key: Optional key context (uses progression.key if not provided)
+            
+        Returns:
+            Suggestions at the position, sorted by confidence
+        """
+        return [
+            suggestion for suggestion in self.suggest(progression, key)
+            if abs(suggestion.position - position) < 0.1  # Account for floating point precision
+        ]
+    
+    def progression_context(self, progression: ChordProgression,
+                            key: Optional[Key] = None) -> Hashable:
+        """
+        Summary of whole-progression state the suggestions depend on.
+        
+        Strategies whose position suggestions also depend on something outside
+        context_window (e.g. the style of the whole progression) return it
+        here; a change invalidates the suggestions at every position.
+        """
+        return None
+    
     @abstractmethod
     def get_strategy_name(self) -> str:
         """Return the name of this strategy."""
         pass
     
+    def precompute(self, key: Key) -> None:
+        """
+        Build lookup data for a key ahead of the first request in it.
+        
+        The default fills the shared scale tables with the diatonic triads
+        and seventh chords of the key and of its parallel key, the source of
+        borrowed chords. Strategies with tables of their own extend this.
+        
+        Args:
+            key: Key to prepare
+        """
+        for table_key in (key, key.parallel_key):
+            for degree in range(1, 8):
+                table_key.get_chord_for_degree(degree)
+                table_key.get_seventh_chord_for_degree(degree)
+    
     def _calculate_voice_leading_quality(self, chord1: Chord, chord2: Chord) -> float:
         """Calculate voice leading quality between two chords."""
         # Get pitch classes of both chords
-        pc1 = chord1.pitch_classes
-        pc2 = chord2.pitch_classes
+        pc1 = chord1.pitch_class_set.mask
+        pc2 = chord2.pitch_class_set.mask
         
         # Count common tones
-        common_tones = len(pc1.intersection(pc2))
-        max_possible_common = min(len(pc1), len(pc2))
+        common_tones = (pc1 & pc2).bit_count()
+        max_possible_common = min(pc1.bit_count(), pc2.bit_count())
         
         if max_possible_common == 0:
             return 0.5  # Neutral quality
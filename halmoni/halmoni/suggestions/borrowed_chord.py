@@ -26,6 +26,8 @@ class BorrowedChordStrategy(ChordSuggestionStrategy):
         }
     }
     
+    context_window = (0, 1)
+    
     def get_strategy_name(self) -> str:
         """Return the strategy name."""
         return "BorrowedChord"
@@ -49,6 +51,19 @@ class BorrowedChordStrategy(ChordSuggestionStrategy):
         
         return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """Generate borrowed chord suggestions for one position."""
+        analysis_key = key or progression.key
+        
+        if not analysis_key or not self._is_good_borrowed_chord_position(progression, position, analysis_key):
+            return []
+        
+        suggestions = self._generate_borrowed_chords(
+            progression.chords[position], analysis_key, position, progression
+        )
+        return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
+    
     def _is_good_borrowed_chord_position(self, progression: ChordProgression, 
                                        position: int, key: Key) -> bool:
         """Determine if position is suitable for borrowed chords."""
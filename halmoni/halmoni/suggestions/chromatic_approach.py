@@ -8,6 +8,8 @@ from ..core import Chord, Key, ChordProgression, Interval
 class ChromaticApproachStrategy(ChordSuggestionStrategy):
     """Suggests chromatic passing and approach chords."""
     
+    context_window = (0, 0)
+    
     def get_strategy_name(self) -> str:
         """Return the strategy name."""
         return "ChromaticApproach"
@@ -38,6 +40,11 @@ class ChromaticApproachStrategy(ChordSuggestionStrategy):
         
         return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """Approach chords are inserted between chords, never at a chord's position."""
+        return []
+    
     def _should_suggest_passing_chord(self, interval: Interval, 
                                     chord1: Chord, chord2: Chord) -> bool:
         """Determine if a passing chord would be beneficial."""
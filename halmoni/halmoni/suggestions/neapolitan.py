@@ -8,6 +8,8 @@ from ..core import Chord, Key, ChordProgression, Note
 class NeapolitanStrategy(ChordSuggestionStrategy):
     """Suggests Neapolitan sixth chords and related harmonies."""
     
+    context_window = (0, 2)
+    
     def get_strategy_name(self) -> str:
         """Return the strategy name."""
         return "Neapolitan"
@@ -31,6 +33,19 @@ class NeapolitanStrategy(ChordSuggestionStrategy):
         
         return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """Generate Neapolitan chord suggestions for one position."""
+        analysis_key = key or progression.key
+        
+        if not analysis_key or not self._is_good_neapolitan_position(progression, position, analysis_key):
+            return []
+        
+        suggestions = self._generate_neapolitan_chords(
+            progression.chords[position], analysis_key, position, progression
+        )
+        return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
+    
     def _is_good_neapolitan_position(self, progression: ChordProgression, 
                                    position: int, key: Key) -> bool:
         """Identify positions suitable for Neapolitan chords."""
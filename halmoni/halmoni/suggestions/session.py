@@ -0,0 +1,125 @@
+"""Stateful suggestion session for incremental re-suggestion while editing."""
+
+from typing import Dict, Hashable, List, Optional, Set
+from .base_strategy import ChordSuggestion, ChordSuggestionStrategy
+from .suggestion_engine import ChordSuggestionEngine
+from ..core import Chord, ChordProgression, Key
+
+
+class SuggestionSession:
+    """
+    Chord suggestions for a progression that is edited one chord at a time.
+
+    Each strategy's suggestions are cached per position. When a chord is
+    substituted, only the positions whose strategy context window contains
+    the edited index are recomputed, so the cost of an edit does not grow
+    with the length of the progression. A strategy without a context window,
+    or whose whole-progression context changed, is recomputed everywhere.
+    """
+
+    def __init__(self, progression: ChordProgression,
+                 key: Optional[Key] = None,
+                 engine: Optional[ChordSuggestionEngine] = None,
+                 strategy_filter: Optional[List[str]] = None):
+        """
+        Initialize a session.
+
+        Args:
+            progression: The chord progression being edited
+            key: Optional key context (uses progression.key if not provided)
+            engine: Engine whose strategies to use (a new one if not provided)
+            strategy_filter: List of strategy names to use (None = use all)
+        """
+        self.engine = engine or ChordSuggestionEngine()
+        self.key = key
+        self.strategies = self.engine._active_strategies(strategy_filter)
+        self._progression = progression
+        self._cache: Dict[str, Dict[int, List[ChordSuggestion]]] = {
+            strategy.get_strategy_name(): {} for strategy in self.strategies
+        }
+        self._contexts: Dict[str, Hashable] = self._progression_contexts()
+
+    @property
+    def progression(self) -> ChordProgression:
+        """The current progression."""
+        return self._progression
+
+    def get_suggestions_for_position(self, position: int) -> List[ChordSuggestion]:
+        """
+        Get suggestions for a position, computing only what isn't cached.
+
+        Args:
+            position: Position index to get suggestions for
+
+        Returns:
+            List of suggestions for the position sorted by confidence
+        """
+        if not 0 <= position < len(self._progression):
+            return []
+
+        all_suggestions = []
+        for strategy in self.strategies:
+            cache = self._cache[strategy.get_strategy_name()]
+            suggestions = cache.get(position)
+            if suggestions is None:
+                suggestions = self.engine._strategy_suggestions_for_position(
+                    strategy, self._progression, position, self.key
+                )
+                cache[position] = suggestions
+            all_suggestions.extend(suggestions)
+
+        return self.engine._rank(all_suggestions)
+
+    def substitute_chord(self, index: int, new_chord: Chord) -> List[int]:
+        """
+        Replace the chord at index and invalidate the affected positions.
+
+        Args:
+            index: Position of the chord to replace
+            new_chord: The new chord
+
+        Returns:
+            Sorted positions whose cached suggestions were dropped
+        """
+        if not 0 <= index < len(self._progression):
+            raise IndexError(f"Chord index {index} out of range")
+
+        self._progression = self._progression.substitute_chord(index, new_chord)
+        contexts = self._progression_contexts()
+
+        invalidated: Set[int] = set()
+        for strategy in self.strategies:
+            name = strategy.get_strategy_name()
+            positions = self._affected_positions(strategy, index, contexts[name] != self._contexts[name])
+            cache = self._cache[name]
+            for position in positions:
+                if cache.pop(position, None) is not None:
+                    invalidated.add(position)
+
+        self._contexts = contexts
+        return sorted(invalidated)
+
+    def invalidate(self) -> None:
+        """Drop all cached suggestions."""
+        for cache in self._cache.values():
+            cache.clear()
+
+    def is_cached(self, position: int) -> bool:
+        """Whether every strategy has cached suggestions for the position."""
+        return all(position in cache for cache in self._cache.values())
+
+    def _affected_positions(self, strategy: ChordSuggestionStrategy,
+                            index: int, context_changed: bool) -> range:
+        """Positions whose suggestions from strategy can see the chord at index."""
+        if strategy.context_window is None or context_changed:
+            return range(len(self._progression))
+
+        before, after = strategy.context_window
+        # Position p looks at chords p - before .. p + after
+        return range(max(0, index - after), min(len(self._progression), index + before + 1))
+
+    def _progression_contexts(self) -> Dict[str, Hashable]:
+        return {
+            strategy.get_strategy_name(): strategy.progression_context(self._progression, self.key)
+            for strategy in self.strategies
+        }
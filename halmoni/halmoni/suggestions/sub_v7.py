@@ -8,10 +8,17 @@ from ..core import Chord, Key, ChordProgression, Note, Interval
 class SubV7Strategy(ChordSuggestionStrategy):
     """Suggests tritone substitution chords."""
     
+    context_window = (1, 1)
+    
     def get_strategy_name(self) -> str:
         """Return the strategy name."""
         return "SubV7"
     
+    def progression_context(self, progression: ChordProgression,
+                            key: Optional[Key] = None) -> bool:
+        """Confidence depends on whether the whole progression looks like jazz."""
+        return self._appears_to_be_jazz_context(progression, key or progression.key)
+    
     def suggest(self, progression: ChordProgression, 
                 key: Optional[Key] = None) -> List[ChordSuggestion]:
         """Generate tritone substitution suggestions."""
@@ -31,6 +38,20 @@ class SubV7Strategy(ChordSuggestionStrategy):
         
         return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """Generate tritone substitution suggestions for one position."""
+        analysis_key = key or progression.key
+        chord = progression.chords[position]
+        
+        if not analysis_key or not self._is_substitutable_dominant(chord, analysis_key):
+            return []
+        
+        suggestions = self._generate_tritone_substitutions(
+            chord, analysis_key, position, progression
+        )
+        return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
+    
     def _is_substitutable_dominant(self, chord: Chord, key: Key) -> bool:
         """Check if chord is suitable for tritone substitution."""
         # Must be a dominant seventh chord or extension
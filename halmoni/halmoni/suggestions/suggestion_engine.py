@@ -1,14 +1,14 @@
 """Main chord suggestion engine coordinating all strategies."""
 
 from typing import List, Optional, Set, Dict
-from .base_strategy import ChordSuggestion
+from .base_strategy import ChordSuggestion, ChordSuggestionStrategy
 from .borrowed_chord import BorrowedChordStrategy
 from .chromatic_approach import ChromaticApproachStrategy
 from .neapolitan import NeapolitanStrategy
 from .sub_v7 import SubV7Strategy
 from .suspend import SuspendStrategy
 from .tsd_movement import TSDMovementStrategy
-from ..core import ChordProgression, Key
+from ..core import Chord, ChordProgression, Key, Note
 
 
 class ChordSuggestionEngine:
@@ -29,6 +29,42 @@ class ChordSuggestionEngine:
             strategy.get_strategy_name(): strategy 
             for strategy in self.strategies
         }
+        self.warmed_up = False
+    
+    def warmup(self, keys: Optional[List[Key]] = None) -> None:
+        """
+        Precompute per-key data so the first requests don't pay for it.
+        
+        Every strategy prepares its tables for each key (diatonic and
+        borrowed chords, tritone substitutes for all 12 roots), then the
+        engine runs once over a I-IV-V7-I cadence in each key.
+        
+        Args:
+            keys: Keys to prepare (default: all 12 major and 12 minor keys)
+        """
+        if keys is None:
+            keys = [
+                Key(Note(pitch_class, 4), mode)
+                for mode in ('major', 'minor')
+                for pitch_class in Note.CHROMATIC_SCALE
+            ]
+        
+        for key in keys:
+            for strategy in self.strategies:
+                strategy.precompute(key)
+            
+            cadence = ChordProgression(
+                chords=[
+                    key.get_chord_for_degree(1),
+                    key.get_chord_for_degree(4),
+                    Chord(key.scale.get_degree(5), 'dominant7'),
+                    key.get_chord_for_degree(1),
+                ],
+                key=key
+            )
+            self.get_suggestions(cadence, key)
+        
+        self.warmed_up = True
     
     def get_suggestions(self, progression: ChordProgression, 
                        key: Optional[Key] = None,
@@ -105,6 +141,9 @@ class ChordSuggestionEngine:
         """
         Get suggestions specifically for a given position in the progression.
         
+        Only the position and its neighbours are evaluated, so the cost does
+        not depend on the length of the progression.
+        
         Args:
             progression: The chord progression
             position: Position index to get suggestions for
@@ -112,17 +151,48 @@ class ChordSuggestionEngine:
             strategy_filter: Optional list of strategy names to use
             
         Returns:
-            List of suggestions for the specified position
+            List of suggestions for the specified position sorted by confidence
         """
-        all_suggestions = self.get_suggestions(progression, key, strategy_filter)
+        if not 0 <= position < len(progression.chords):
+            return []
+        
+        all_suggestions = []
+        for strategy in self._active_strategies(strategy_filter):
+            all_suggestions.extend(
+                self._strategy_suggestions_for_position(strategy, progression, position, key)
+            )
         
-        # Filter suggestions for the specific position
-        position_suggestions = [
-            suggestion for suggestion in all_suggestions
-            if abs(suggestion.position - position) < 0.1  # Account for floating point precision
+        return self._rank(all_suggestions)
+    
+    def _active_strategies(self, strategy_filter: Optional[List[str]] = None) -> List[ChordSuggestionStrategy]:
+        """Strategies selected by a filter of strategy names (None = all)."""
+        if not strategy_filter:
+            return self.strategies
+        return [
+            strategy for strategy in self.strategies 
+            if strategy.get_strategy_name() in strategy_filter
         ]
+    
+    def _strategy_suggestions_for_position(self, strategy: ChordSuggestionStrategy,
+                                           progression: ChordProgression,
+                                           position: int,
+                                           key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """One strategy's suggestions for a position, tagged with their source."""
+        try:
+            suggestions = strategy.suggest_for_position(progression, position, key)
+        except Exception as e:
+            # Log error but continue with other strategies
+            print(f"Warning: Strategy {strategy.get_strategy_name()} failed: {e}")
+            return []
         
-        return position_suggestions
+        for suggestion in suggestions:
+            suggestion.strategy_source = strategy.get_strategy_name()
+        return suggestions
+    
+    def _rank(self, suggestions: List[ChordSuggestion]) -> List[ChordSuggestion]:
+        """Remove duplicates and sort by confidence."""
+        unique_suggestions = self._remove_duplicates(suggestions)
+        return sorted(unique_suggestions, key=lambda x: x.confidence, reverse=True)
     
     def analyze_progression_potential(self, progression: ChordProgression,
                                     key: Optional[Key] = None) -> Dict[str, any]:
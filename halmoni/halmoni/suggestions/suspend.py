@@ -8,6 +8,8 @@ from ..core import Chord, Key, ChordProgression
 class SuspendStrategy(ChordSuggestionStrategy):
     """Suggests suspension chords and resolutions."""
     
+    context_window = (0, 1)
+    
     def get_strategy_name(self) -> str:
         """Return the strategy name."""
         return "Suspend"
@@ -35,6 +37,24 @@ class SuspendStrategy(ChordSuggestionStrategy):
         
         return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """Generate suspension suggestions for one position and its resolution to the next chord."""
+        suggestions = []
+        analysis_key = key or progression.key
+        chord = progression.chords[position]
+        
+        if self._is_good_suspension_candidate(chord, analysis_key):
+            suggestions.extend(self._generate_suspensions(chord, analysis_key, position))
+        
+        next_chord = self._get_next_chord(progression, position)
+        if next_chord:
+            suggestions.extend(self._generate_suspension_resolutions(
+                chord, next_chord, analysis_key, position
+            ))
+        
+        return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
+    
     def _is_good_suspension_candidate(self, chord: Chord, key: Optional[Key]) -> bool:
         """Check if chord is suitable for suspension treatment."""
         
@@ -195,7 +215,7 @@ class SuspendStrategy(ChordSuggestionStrategy):
             return True
         
         # Related chords (sharing common tones) can work
-        common_tones = chord1.pitch_classes.intersection(chord2.pitch_classes)
+        common_tones = chord1.pitch_class_set & chord2.pitch_class_set
         if len(common_tones) >= 2:
             return True
         
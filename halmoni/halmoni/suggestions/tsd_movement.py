@@ -32,6 +32,8 @@ class TSDMovementStrategy(ChordSuggestionStrategy):
         ('dominant', 'subdominant', 0.3),   # D → S (retrograde, avoid)
     ]
     
+    context_window = (0, 0)
+    
     def get_strategy_name(self) -> str:
         """Return the strategy name."""
         return "TSDMovement"
@@ -63,6 +65,25 @@ class TSDMovementStrategy(ChordSuggestionStrategy):
         
         return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
     
+    def suggest_for_position(self, progression: ChordProgression, position: int,
+                             key: Optional[Key] = None) -> List[ChordSuggestion]:
+        """
+        Generate functional alternatives for one position.
+        
+        Bridge and cadential completions are insertions between or after
+        chords, so only the functional improvements apply to a position.
+        """
+        analysis_key = key or progression.key
+        
+        if not analysis_key:
+            return []
+        
+        function = self._get_harmonic_function(progression.chords[position], analysis_key)
+        suggestions = self._suggest_functional_improvements(
+            progression, position, function, analysis_key
+        )
+        return sorted(suggestions, key=lambda x: x.confidence, reverse=True)
+    
     def _analyze_functional_progression(self, progression: ChordProgression, 
                                       key: Key) -> List[Tuple[Chord, str]]:
         """Analyze the functional progression of chords."""
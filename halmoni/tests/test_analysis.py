@@ -1,9 +1,14 @@
 """Tests for analysis module (MIDI, chord detection, key detection)."""
 
+import struct
+import mido
+import numpy as np
 import pytest
 from halmoni import (
-    Note, Chord, Key, MIDIAnalyzer, ChordDetector, KeyDetector
+    Note, Chord, Key, MIDIAnalyzer, NoteTable, ChordDetector, KeyDetector, PitchClassSet,
+    AdamStarkChordDetector
 )
+from halmoni.analysis.smf_reader import read_smf, UnsupportedMidiFile
 
 
 class TestChordDetector:
@@ -85,6 +90,48 @@ class TestChordDetector:
         assert 'common_tones' in analysis
         assert 'motion_type' in analysis
 
+    @pytest.mark.parametrize("names, expected", [
+        (['D', 'F', 'A', 'C#'], ('D', 'minor')),
+        (['E', 'G#', 'B', 'D', 'F'], ('E', 'dominant7')),
+        (['B', 'D#', 'F#', 'A', 'D'], ('B', 'minor7')),
+        (['C', 'E', 'G#', 'A#'], ('C', 'augmented')),
+    ])
+    def test_detected_qualities(self, names: list, expected: tuple) -> None:
+        """Test detection of voicings that best match a template outside DETECTABLE_QUALITIES."""
+        notes = [Note(name, 3 if i == 0 else 4) for i, name in enumerate(names)]
+        for use_lookup_table in (True, False):
+            detector = ChordDetector(use_lookup_table=use_lookup_table)
+            chord = detector.detect_chord_from_notes(notes, notes[0])
+            assert (chord.root.pitch_class, chord.quality) == expected
+
+    def test_lookup_table_matches_scorer(self) -> None:
+        """Test lookup table entries against scoring every root and template."""
+        detector = ChordDetector()
+        for mask in range(0, 4096, 7):
+            pitch_class_set = PitchClassSet(mask)
+            for lowest in [None, *pitch_class_set]:
+                assert detector._lookup_chord_match(mask, lowest) == \
+                    detector._score_chord_match(pitch_class_set, lowest)
+
+    def test_lookup_table_switches(self) -> None:
+        """Test detection with the lookup table off and with verification on."""
+        notes = [Note('C', 3), Note('G', 4), Note('E', 5), Note('B', 4)]
+        chords = [
+            ChordDetector(use_lookup_table=use, verify_lookup_table=verify).detect_chord_from_notes(notes, notes[0])
+            for use, verify in [(True, False), (False, False), (True, True)]
+        ]
+        assert chords[0] == chords[1] == chords[2]
+        assert chords[0] is not None
+        assert chords[0].root.pitch_class == 'C'
+        assert chords[0].quality == 'major7'
+
+    def test_verify_lookup_table_raises_on_mismatch(self, monkeypatch) -> None:
+        """Test that verification raises when the table and scorer disagree."""
+        detector = ChordDetector(verify_lookup_table=True)
+        monkeypatch.setattr(detector, '_lookup_chord_match', lambda mask, lowest: (1.0, 2, 'minor'))
+        with pytest.raises(AssertionError, match="lookup table"):
+            detector.detect_chord_from_notes([Note('C', 4), Note('E', 4), Note('G', 4)])
+
 
 class TestKeyDetector:
     """Tests for the KeyDetector class."""
@@ -326,6 +373,23 @@ class TestMIDIAnalyzer:
         assert all(isinstance(w[0], float) for w in windows)
         assert all(isinstance(w[1], list) for w in windows)
 
+    def test_get_time_windows_overlaps(self) -> None:
+        """Test that windows hold every overlapping note in input order."""
+        analyzer = MIDIAnalyzer()
+        notes = [
+            {'start_time': 2.5, 'end_time': 3.0, 'midi_note': 67},
+            {'start_time': 0.0, 'end_time': 4.0, 'midi_note': 48},
+            {'start_time': 1.0, 'end_time': 2.0, 'midi_note': 64},  # Ends on a window start
+            {'start_time': 0.5, 'end_time': 0.5, 'midi_note': 60},  # Zero length
+        ]
+
+        windows = analyzer.get_time_windows(notes, window_size=1.0)
+
+        assert [start for start, _ in windows] == [0.0, 1.0, 2.0, 3.0]
+        assert [[n['midi_note'] for n in window] for _, window in windows] == [
+            [48, 60], [48, 64], [67, 48], [48],
+        ]
+
     def test_get_time_windows_empty(self) -> None:
         """Test time windows with empty notes list."""
         analyzer = MIDIAnalyzer()
@@ -403,6 +467,212 @@ class TestMIDIAnalyzer:
         assert 'E' in histogram
 
 
+class TestNoteTable:
+    """Tests for NoteTable and the MIDIAnalyzer passes that accept it."""
+
+    @pytest.fixture
+    def notes(self) -> list:
+        return [
+            {'midi_note': 67, 'velocity': 90, 'channel': 0, 'start_time': 2.5, 'end_time': 3.0, 'duration': 0.5},
+            {'midi_note': 48, 'velocity': 70, 'channel': 1, 'start_time': 0.0, 'end_time': 4.0, 'duration': 4.0},
+            {'midi_note': 64, 'velocity': 80, 'channel': 0, 'start_time': 1.0, 'end_time': 2.0, 'duration': 1.0},
+            {'midi_note': 60, 'velocity': 100, 'channel': 0, 'start_time': 1.05, 'end_time': 2.0, 'duration': 0.95},
+        ]
+
+    def test_dict_round_trip(self, notes: list) -> None:
+        """Test converting note dictionaries to a table and back."""
+        table = NoteTable.from_dicts(notes)
+        assert len(table) == 4
+        assert table.to_dicts() == notes
+        assert table[2] == notes[2]
+        assert table.pitch_classes.tolist() == [7, 0, 4, 0]
+
+    def test_from_dicts_defaults(self) -> None:
+        """Test defaults for missing velocity, channel and duration."""
+        table = NoteTable.from_dicts([{'midi_note': 60, 'start_time': 1.0, 'end_time': 2.5}])
+        assert table[0] == {
+            'midi_note': 60, 'velocity': 64, 'channel': 0,
+            'start_time': 1.0, 'end_time': 2.5, 'duration': 1.5,
+        }
+
+    def test_sorted_by_start(self, notes: list) -> None:
+        """Test sorting a table by start time."""
+        table = NoteTable.from_dicts(notes).sorted_by_start()
+        assert table.midi_note.tolist() == [48, 64, 60, 67]
+
+    def test_time_windows_match_dicts(self, notes: list) -> None:
+        """Test that windowing a table selects the same notes as the dict list."""
+        analyzer = MIDIAnalyzer()
+        expected = analyzer.get_time_windows(notes, window_size=1.0)
+        windows = analyzer.get_time_windows(NoteTable.from_dicts(notes), window_size=1.0)
+
+        assert [start for start, _ in windows] == [start for start, _ in expected]
+        for (_, table), (_, window_notes) in zip(windows, expected):
+            assert isinstance(table, NoteTable)
+            assert table.to_dicts() == window_notes
+
+    def test_group_simultaneous_notes_table(self, notes: list) -> None:
+        """Test grouping a table into simultaneous notes."""
+        analyzer = MIDIAnalyzer()
+        groups = analyzer.group_simultaneous_notes(NoteTable.from_dicts(notes), tolerance=0.1)
+        assert [group.midi_note.tolist() for group in groups] == [[48], [64, 60], [67]]
+        assert [group.to_dicts() for group in groups] == analyzer.group_simultaneous_notes(notes, tolerance=0.1)
+
+    def test_histogram_and_key_match_dicts(self, notes: list) -> None:
+        """Test histogram and key detection on a table against the dict list."""
+        analyzer = MIDIAnalyzer()
+        table = NoteTable.from_dicts(notes)
+        assert analyzer.get_pitch_class_histogram(table) == {'G': 1, 'C': 2, 'E': 1}
+        assert analyzer.get_pitch_class_histogram(table) == analyzer.get_pitch_class_histogram(notes)
+
+        detector = KeyDetector()
+        assert detector.detect_key_from_midi_notes(table) == detector.detect_key_from_midi_notes(notes)
+
+    def test_empty_table(self) -> None:
+        """Test analysis passes on an empty table."""
+        analyzer = MIDIAnalyzer()
+        table = NoteTable.empty()
+        assert analyzer.get_time_windows(table, window_size=1.0) == []
+        assert analyzer.group_simultaneous_notes(table) == []
+        assert analyzer.get_pitch_class_histogram(table) == {}
+        assert KeyDetector().detect_key_from_midi_notes(table)[1] == 0.0
+
+
+class TestAdamStarkChordDetector:
+    """Tests for batch scoring in AdamStarkChordDetector."""
+
+    def test_batch_scores_match_per_profile(self) -> None:
+        """Test that batch scores equal the per-profile score of every frame."""
+        detector = AdamStarkChordDetector()
+        rng = np.random.default_rng(0)
+        frames = rng.random((20, 12)) * (rng.random((20, 12)) < 0.5)
+
+        scores = detector._calculate_all_chord_scores(frames)
+        assert scores.shape == (20, len(detector.chord_profiles))
+        for frame, frame_scores in zip(frames, scores):
+            expected = [
+                detector._calculate_chord_score(frame, index)
+                for index in range(len(detector.chord_profiles))
+            ]
+            assert frame_scores.tolist() == expected
+            assert detector._calculate_all_chord_scores(frame).tolist() == expected
+
+    def test_batch_detect_chords(self) -> None:
+        """Test batch detection against single-frame detection."""
+        detector = AdamStarkChordDetector()
+        c_major = np.zeros(12)
+        c_major[[0, 4, 7]] = 1.0
+        a_minor7 = np.zeros(12)
+        a_minor7[[9, 0, 4, 7]] = 1.0
+        frames = [c_major, np.zeros(12), a_minor7]
+
+        results = detector.batch_detect_chords(frames)
+        assert len(results) == 3
+        assert results[1] == ('N', 0.0)
+        assert results == [detector.detect_chord(frame) for frame in frames]
+        assert detector.batch_detect_chords(np.array(frames)) == results
+        assert detector.batch_detect_chords([]) == []
+
+        with pytest.raises(ValueError):
+            detector.batch_detect_chords([c_major, np.zeros(11)])
+
+    def test_batch_keeps_float32_precision(self) -> None:
+        """Test that float32 chromagrams are normalized in float32, frame by frame."""
+        detector = AdamStarkChordDetector()
+        rng = np.random.default_rng(1)
+        frames = (rng.random((50, 12)) * 10).astype(np.float32)
+
+        for frame, (_, confidence) in zip(frames, detector.batch_detect_chords(frames)):
+            processed = frame / np.sum(frame)
+            for i in range(12):
+                processed[(i + 7) % 12] *= 0.8
+            scores = [
+                detector._calculate_chord_score(processed, index)
+                for index in range(len(detector.chord_profiles))
+            ]
+            assert confidence == max(0.0, 1.0 - min(scores))
+
+
+class TestSMFReader:
+    """Tests for the direct SMF reader against mido."""
+
+    @staticmethod
+    def smf_bytes(track: bytes, division: int = 96) -> bytes:
+        header = b'MThd' + struct.pack('>ihhh', 6, 0, 1, division)
+        return header + b'MTrk' + struct.pack('>i', len(track)) + track
+
+    @pytest.fixture
+    def midi_path(self, tmp_path) -> str:
+        midi_file = mido.MidiFile(ticks_per_beat=480)
+        track = mido.MidiTrack([
+            mido.MetaMessage('track_name', name='Piano'),
+            mido.MetaMessage('time_signature', numerator=3, denominator=4),
+            mido.Message('program_change', program=1),
+            mido.Message('note_on', note=60, velocity=100),
+            mido.Message('note_on', note=64, velocity=10),
+            mido.MetaMessage('set_tempo', tempo=600000, time=240),
+            mido.Message('note_off', note=60, time=240),
+            mido.Message('control_change', control=64, value=127),
+            mido.Message('note_on', note=67, velocity=80, channel=2, time=120),
+            mido.Message('sysex', data=[1, 2, 3]),
+        ])
+        bass = mido.MidiTrack([
+            mido.Message('note_on', note=36, velocity=90, channel=1),
+            mido.Message('note_on', note=36, velocity=0, channel=1, time=960),
+        ])
+        midi_file.tracks.extend([track, bass])
+        path = tmp_path / 'song.mid'
+        midi_file.save(str(path))
+        return str(path)
+
+    def test_matches_mido(self, midi_path: str) -> None:
+        """Test that the direct reader gives the same analysis as mido."""
+        fast = MIDIAnalyzer().load_midi_file(midi_path)
+        expected = MIDIAnalyzer(fast_parser=False).load_midi_file(midi_path)
+
+        assert fast['notes'] == expected['notes']
+        assert fast['note_table'].to_dicts() == expected['notes']
+        assert fast['tempo_changes'] == expected['tempo_changes']
+        assert fast['time_signature'] == expected['time_signature'] == (3, 4)
+        assert [track['track_name'] for track in fast['tracks']] == ['Piano', '']
+        assert [track['channel'] for track in fast['tracks']] == [0, 1]
+        assert [note['midi_note'] for note in fast['notes']] == [60, 36, 67]
+
+    def test_running_status(self, tmp_path) -> None:
+        """Test note events that rely on running status and multi-byte deltas."""
+        track = bytes([
+            0x00, 0x90, 60, 100,
+            0x00, 64, 90,  # Running status note_on
+            0x81, 0x40, 60, 0,  # Delta of 192 ticks, note_on with velocity 0
+            0x00, 64, 0,
+            0x00, 0xFF, 0x2F, 0x00,
+        ])
+        path = tmp_path / 'running.mid'
+        path.write_bytes(self.smf_bytes(track))
+
+        ticks_per_beat, tracks = read_smf(str(path))
+        assert ticks_per_beat == 96
+        assert tracks[0]['note_table'].to_dicts() == [
+            {'midi_note': 60, 'velocity': 100, 'channel': 0, 'start_time': 0.0, 'end_time': 2.0, 'duration': 2.0},
+            {'midi_note': 64, 'velocity': 90, 'channel': 0, 'start_time': 0.0, 'end_time': 2.0, 'duration': 2.0},
+        ]
+
+    def test_falls_back_to_mido(self, tmp_path) -> None:
+        """Test that unsupported files are read with mido and bad files still fail."""
+        track = bytes([0x00, 0x90, 60, 100, 0x60, 0x80, 60, 0, 0x00, 0xFF, 0x2F, 0x00])
+        path = tmp_path / 'smpte.mid'
+        path.write_bytes(self.smf_bytes(track, division=-(25 << 8) | 40))
+
+        with pytest.raises(UnsupportedMidiFile):
+            read_smf(str(path))
+        assert len(MIDIAnalyzer().load_note_table(str(path))) == 1
+
+        bad_path = tmp_path / 'bad.mid'
+        bad_path.write_bytes(b'not a midi file')
+        with pytest.raises(ValueError, match="Could not load MIDI file"):
+            MIDIAnalyzer().load_midi_file(str(bad_path))
+
+
 class TestChordDetectorAdvanced:
     """Advanced tests for ChordDetector."""
 
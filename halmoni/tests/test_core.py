@@ -1,7 +1,9 @@
 """Comprehensive tests for core music theory classes."""
 
+import pickle
+
 import pytest
-from halmoni import Note, Interval, Chord, Scale, Key, ChordProgression, ChordVoicing
+from halmoni import Note, Interval, PitchClassSet, Chord, Scale, Key, ChordProgression, ChordVoicing
 
 
 class TestNote:
@@ -110,6 +112,22 @@ class TestNote:
         with pytest.raises(ValueError):
             Note('C')
 
+    def test_notes_are_interned(self) -> None:
+        """Test that equal notes are the same object."""
+        assert Note('C', 4) is Note(60)
+        assert Note('Db', 4) is Note('Db', 4)
+        assert Note('Db', 4) is not Note('C#', 4)
+
+    def test_note_is_immutable(self, c_note: Note) -> None:
+        """Test that notes cannot be modified."""
+        with pytest.raises(AttributeError):
+            c_note.octave = 5
+
+    def test_note_pickle_round_trip(self) -> None:
+        """Test that unpickled notes are the interned instances."""
+        for note in (Note('C#', 4), Note('Bb', 2)):
+            assert pickle.loads(pickle.dumps(note)) is note
+
 
 class TestInterval:
     """Tests for the Interval class."""
@@ -270,6 +288,55 @@ class TestInterval:
         assert ninth.octaves == 1
 
 
+class TestPitchClassSet:
+    """Tests for the PitchClassSet class."""
+
+    def test_from_notes_mask(self) -> None:
+        """Test that notes set the bits of their pitch classes."""
+        pc_set = PitchClassSet.from_notes([Note('C', 4), Note('E', 3), Note('G', 5), Note('C', 2)])
+        assert pc_set.mask == 0b000010010001
+        assert len(pc_set) == 3
+        assert list(pc_set) == [0, 4, 7]
+
+    def test_enharmonic_membership(self) -> None:
+        """Test that membership ignores spelling."""
+        pc_set = PitchClassSet.from_pitch_classes(['Db', 'F', 'Ab'])
+        assert 'C#' in pc_set
+        assert Note('G#', 2) in pc_set
+        assert 'C' not in pc_set
+        assert pc_set.pitch_classes == ['C#', 'F', 'G#']
+
+    def test_set_operations(self) -> None:
+        """Test subset, intersection, union and difference."""
+        c_major = PitchClassSet.from_pitch_classes(['C', 'E', 'G'])
+        a_minor = PitchClassSet.from_pitch_classes(['A', 'C', 'E'])
+        assert (c_major & a_minor).pitch_classes == ['C', 'E']
+        assert len(c_major | a_minor) == 4
+        assert (c_major - a_minor).pitch_classes == ['G']
+        assert c_major <= c_major | a_minor
+        assert not c_major.issubset(a_minor)
+
+    def test_transpose_wraps(self) -> None:
+        """Test that transposition rotates the mask."""
+        b_major = PitchClassSet.from_pitch_classes(['B', 'D#', 'F#'])
+        assert b_major.transpose(1) == PitchClassSet.from_pitch_classes(['C', 'E', 'G'])
+        assert b_major.transpose(-11) is b_major.transpose(1)
+        assert b_major.transpose(12) is b_major
+
+    def test_invalid_mask(self) -> None:
+        """Test that masks wider than 12 bits are rejected."""
+        with pytest.raises(ValueError):
+            PitchClassSet(1 << 12)
+
+    def test_chord_scale_and_key_masks(self, c_major_key: Key) -> None:
+        """Test the masks exposed by chords, scales and keys."""
+        g7 = Chord.from_symbol('G7')
+        assert g7.pitch_class_set == PitchClassSet.from_pitch_classes(['G', 'B', 'D', 'F'])
+        assert g7.pitch_class_set <= c_major_key.pitch_class_set
+        assert c_major_key.pitch_class_set is c_major_key.scale.pitch_class_set
+        assert Chord.from_symbol('Db').contains_note(Note('C#', 4))
+
+
 class TestChord:
     """Tests for the Chord class."""
 
@@ -375,6 +442,44 @@ class TestChord:
         cm7b5 = Chord.from_symbol('Cm7b5')
         assert cm7b5.quality == 'half_diminished7'
 
+    def test_chord_extended_symbols(self) -> None:
+        """Test parsing altered, added-tone and six-nine symbols."""
+        assert Chord.from_symbol('G7b9').quality == 'dominant7b9'
+        assert Chord.from_symbol('G7(#11)').quality == 'dominant7#11'
+        assert Chord.from_symbol('Cadd9').quality == 'add9'
+        assert Chord.from_symbol('Bbm(maj7)').quality == 'minor_major7'
+
+        six_nine = Chord.from_symbol('C6/9')
+        assert six_nine.quality == 'six_nine'
+        assert six_nine.bass == six_nine.root
+
+        slash = Chord.from_symbol('Dm7b5/Eb')
+        assert slash.quality == 'half_diminished7'
+        assert slash.bass.pitch_class == 'Eb'
+
+    def test_chord_unicode_accidentals(self) -> None:
+        """Test unicode flats and sharps in roots, qualities and basses."""
+        assert Chord.from_symbol('B♭7') is Chord.from_symbol('Bb7')
+        assert Chord.from_symbol('F♯m7') is Chord.from_symbol('F#m7')
+        assert Chord.from_symbol('G7(♭9)').quality == 'dominant7b9'
+
+        slash = Chord.from_symbol('Cm/E♭')
+        assert slash.bass.pitch_class == 'Eb'
+        assert slash is Chord.from_symbol('Cm/Eb')
+
+    def test_chord_symbol_round_trip(self) -> None:
+        """Test that every quality's symbol parses back to the same chord."""
+        for quality in Chord.CHORD_TONES:
+            chord = Chord(Note('Eb', 3), quality)
+            assert Chord.from_symbol(chord.symbol, octave=3) is chord
+
+    def test_chord_unknown_extension(self) -> None:
+        """Test that unsupported symbols still raise errors."""
+        with pytest.raises(ValueError):
+            Chord.from_symbol('C7b9#11')
+        with pytest.raises(ValueError):
+            Chord.from_symbol('C/9')
+
     def test_chord_augmented(self) -> None:
         """Test augmented chord."""
         caug = Chord.from_symbol('Caug')
@@ -415,6 +520,24 @@ class TestChord:
         assert b_flat_m.root.pitch_class == 'Bb'
         assert b_flat_m.quality == 'minor'
 
+    def test_chords_are_interned(self) -> None:
+        """Test that equal chords are the same object."""
+        assert Chord.from_symbol('G7') is Chord(Note('G', 4), 'dominant7')
+        assert Chord.from_symbol('C/E') is not Chord.from_symbol('C')
+
+    def test_chord_is_immutable(self, c_note: Note) -> None:
+        """Test that chords and their cached notes cannot be modified."""
+        chord = Chord(c_note, 'major')
+        with pytest.raises(AttributeError):
+            chord.quality = 'minor'
+        chord.notes.append(Note('B', 4))
+        assert len(chord.notes) == 3
+
+    def test_chord_pickle_round_trip(self) -> None:
+        """Test that unpickled chords are the interned instances."""
+        chord = Chord.from_symbol('F#m7b5')
+        assert pickle.loads(pickle.dumps(chord)) is chord
+
 
 class TestScale:
     """Tests for the Scale class."""
@@ -4,6 +4,7 @@ import pytest
 from halmoni import (
     Note, Chord, Key, ChordProgression,
     ChordSuggestionEngine,
+    SuggestionSession,
     BorrowedChordStrategy,
     ChromaticApproachStrategy,
     NeapolitanStrategy,
@@ -544,3 +545,122 @@ class TestSuggestionEngineAdvanced:
             if len(suggestions) > 0:
                 # At least some suggestions should have non-empty reasoning
                 assert any(len(s.reasoning) > 0 for s in suggestions)
+
+    def test_warmup(self, simple_progression: ChordProgression,
+                    c_major_key: Key) -> None:
+        """Test that warmup prepares the engine without changing results."""
+        cold = ChordSuggestionEngine().get_suggestions(simple_progression, c_major_key)
+
+        engine = ChordSuggestionEngine()
+        assert not engine.warmed_up
+        engine.warmup()
+        assert engine.warmed_up
+
+        warm = engine.get_suggestions(simple_progression, c_major_key)
+        assert [(s.chord.symbol, s.confidence, s.position) for s in warm] == \
+            [(s.chord.symbol, s.confidence, s.position) for s in cold]
+
+    def test_position_suggestions_match_full_run(self, c_major_key: Key) -> None:
+        """Test that position-scoped suggestions equal those of a full run."""
+        engine = ChordSuggestionEngine()
+        prog = ChordProgression.from_symbols(
+            ['C', 'Am', 'F', 'G7', 'Em', 'Dm7', 'G7', 'C'], key=c_major_key
+        )
+        full = engine.get_suggestions(prog, c_major_key, max_suggestions=1000)
+
+        for position in range(len(prog)):
+            expected = [s for s in full if abs(s.position - position) < 0.1]
+            scoped = engine.get_suggestions_for_position(prog, position, c_major_key)
+            assert [(s.chord.symbol, s.confidence, s.strategy_source) for s in scoped] == \
+                [(s.chord.symbol, s.confidence, s.strategy_source) for s in expected]
+
+    def test_position_suggestions_not_cut_by_global_limit(self, c_major_key: Key) -> None:
+        """Test that a long progression doesn't crowd out a position's suggestions."""
+        engine = ChordSuggestionEngine()
+        loop = ChordProgression.from_symbols(['C', 'Am', 'F', 'G7'], key=c_major_key)
+        song = ChordProgression.from_symbols(['C', 'Am', 'F', 'G7'] * 50, key=c_major_key)
+
+        loop_suggestions = engine.get_suggestions_for_position(loop, 1, c_major_key)
+        song_suggestions = engine.get_suggestions_for_position(song, 1, c_major_key)
+
+        assert len(loop_suggestions) > 0
+        assert [s.chord.symbol for s in song_suggestions] == \
+            [s.chord.symbol for s in loop_suggestions]
+
+    def test_position_out_of_range(self, simple_progression: ChordProgression,
+                                   c_major_key: Key) -> None:
+        """Test that positions outside the progression have no suggestions."""
+        engine = ChordSuggestionEngine()
+        assert engine.get_suggestions_for_position(simple_progression, -1, c_major_key) == []
+        assert engine.get_suggestions_for_position(
+            simple_progression, len(simple_progression), c_major_key
+        ) == []
+
+
+class TestSuggestionSession:
+    """Tests for incremental suggestion sessions."""
+
+    @staticmethod
+    def _summary(suggestions):
+        return [(s.chord.symbol, s.confidence, s.strategy_source) for s in suggestions]
+
+    def test_session_matches_engine(self, c_major_key: Key) -> None:
+        """Test that session suggestions equal the engine's."""
+        engine = ChordSuggestionEngine()
+        prog = ChordProgression.from_symbols(['C', 'Am', 'F', 'G7', 'C'], key=c_major_key)
+        session = SuggestionSession(prog, c_major_key, engine=engine)
+
+        for position in range(len(prog)):
+            assert self._summary(session.get_suggestions_for_position(position)) == \
+                self._summary(engine.get_suggestions_for_position(prog, position, c_major_key))
+            assert session.is_cached(position)
+
+    def test_substitute_invalidates_context_window_only(self, c_major_key: Key) -> None:
+        """Test that an edit only drops positions that can see the edited chord."""
+        prog = ChordProgression.from_symbols(['C', 'Am', 'F', 'G', 'C'] * 8, key=c_major_key)
+        session = SuggestionSession(prog, c_major_key)
+        for position in range(len(prog)):
+            session.get_suggestions_for_position(position)
+
+        invalidated = session.substitute_chord(20, Chord.from_symbol('Dm'))
+
+        assert invalidated == [18, 19, 20, 21]
+        assert session.progression.chords[20].symbol == 'Dm'
+        assert session.is_cached(10)
+        assert not session.is_cached(19)
+
+    def test_substitute_recomputes_correctly(self, c_major_key: Key) -> None:
+        """Test that suggestions after edits equal a fresh computation."""
+        engine = ChordSuggestionEngine()
+        prog = ChordProgression.from_symbols(['C', 'Am', 'F', 'G', 'Em', 'Dm', 'G', 'C'],
+                                             key=c_major_key)
+        session = SuggestionSession(prog, c_major_key, engine=engine)
+        for position in range(len(prog)):
+            session.get_suggestions_for_position(position)
+
+        for index, symbol in [(3, 'G7'), (5, 'Dm7'), (0, 'Cmaj7'), (6, 'Db7')]:
+            session.substitute_chord(index, Chord.from_symbol(symbol))
+            for position in range(len(prog)):
+                assert self._summary(session.get_suggestions_for_position(position)) == \
+                    self._summary(engine.get_suggestions_for_position(
+                        session.progression, position, c_major_key
+                    ))
+
+    def test_progression_context_change_invalidates_all(self, c_major_key: Key) -> None:
+        """Test that a change of whole-progression context drops every position."""
+        prog = ChordProgression.from_symbols(['Dm7', 'G', 'C', 'F'], key=c_major_key)
+        session = SuggestionSession(prog, c_major_key, strategy_filter=['SubV7'])
+        for position in range(len(prog)):
+            session.get_suggestions_for_position(position)
+
+        # Half the chords extended -> jazz context for SubV7
+        invalidated = session.substitute_chord(3, Chord.from_symbol('Fmaj7'))
+
+        assert invalidated == [0, 1, 2, 3]
+
+    def test_substitute_out_of_range(self, simple_progression: ChordProgression,
+                                     c_major_key: Key) -> None:
+        """Test that editing outside the progression raises."""
+        session = SuggestionSession(simple_progression, c_major_key)
+        with pytest.raises(IndexError):
+            session.substitute_chord(len(simple_progression), Chord.from_symbol('C'))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# Throughput of Basic Pitch ONNX inference at different window batch sizes
+#
+# Usage:
+#   python benchmarks/bench_basic_pitch_batch.py smoke.mp3
+#   python benchmarks/bench_basic_pitch_batch.py dance.mp3 --batch-sizes 1 8 32 --repeats 5
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'hiscore'))
+
+from basic_pitch_onnx import AUDIO_SAMPLE_RATE, get_audio_input, run_inference  # noqa: E402
+
+DEFAULT_MODEL_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'basic-pitch', 'basic_pitch', 'saved_models', 'icassp_2022', 'nmp.onnx'
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched Basic Pitch inference")
+    parser.add_argument("audio", help="Audio file to transcribe")
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH, help="Path to nmp.onnx")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    overlap_len = 30 * 256
+    n_windows = 0
+    duration = 0.0
+    for _, _, original_length in get_audio_input(args.audio, overlap_len, 43844 - overlap_len):
+        n_windows += 1
+        duration = original_length / AUDIO_SAMPLE_RATE
+    print(f"{args.audio}: {duration:.1f}s of audio, {n_windows} windows")
+
+    # Warm up the cached session so the first measured run doesn't pay for it
+    reference = run_inference(args.audio, args.model, batch_size=1)
+
+    for batch_size in args.batch_sizes:
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            output = run_inference(args.audio, args.model, batch_size=batch_size)
+            timings.append(time.perf_counter() - start)
+
+        identical = all(np.array_equal(output[k], reference[k]) for k in reference)
+        best = min(timings)
+        print(
+            f"batch {batch_size:>3}: best {best:.3f}s, "
+            f"mean {sum(timings) / len(timings):.3f}s, "
+            f"{n_windows / best:.1f} windows/s, "
+            f"{duration / best:.1f}x realtime, "
+            f"identical to batch 1: {identical}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,17 @@
 
 import os
 import pathlib
-from typing import Dict, Tuple, List, Optional
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, Tuple, List, Optional
 import numpy as np
 import numpy.typing as npt
 import librosa
 import pretty_midi
 import onnxruntime as ort
+import soundfile as sf
+import soxr
 
 # Constants from basic_pitch.constants
 AUDIO_SAMPLE_RATE = 22050
@@ -28,16 +33,91 @@ DEFAULT_ONSET_THRESHOLD = 0.5
 DEFAULT_FRAME_THRESHOLD = 0.3
 DEFAULT_MINIMUM_MIDI_TEMPO = 120
 
+# Streaming audio input
+STREAM_BLOCK_FRAMES = 65536  # source frames decoded per block
+STREAM_PREFETCH_WINDOWS = 16  # windows decoded ahead of inference
+
+# Batched inference
+MAX_AUTO_BATCH_SIZE = 32
+# Rough peak working set of one window through the model (input, activations, outputs)
+ESTIMATED_BYTES_PER_WINDOW = 64 * 1024 * 1024
+
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+@dataclass(frozen=True)
+class OnnxRuntimeOptions:
+    """ONNX Runtime session settings. Hashable so it can key the session cache."""
+    intra_op_num_threads: int = 0  # 0 = let onnxruntime decide
+    inter_op_num_threads: int = 0
+    graph_optimization_level: str = "all"
+    enable_cpu_mem_arena: bool = True
+    enable_mem_pattern: bool = True
+    # CPU provider only (avoiding CUDA issues)
+    providers: Tuple[str, ...] = ("CPUExecutionProvider",)
+
+    def to_session_options(self) -> ort.SessionOptions:
+        """Build the onnxruntime SessionOptions for these settings."""
+        if self.graph_optimization_level not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unknown graph optimization level: {self.graph_optimization_level}"
+            )
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_num_threads
+        options.inter_op_num_threads = self.inter_op_num_threads
+        if self.inter_op_num_threads > 1:
+            # Inter-op threads are only used by the parallel executor
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+        options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[self.graph_optimization_level]
+        options.enable_cpu_mem_arena = self.enable_cpu_mem_arena
+        options.enable_mem_pattern = self.enable_mem_pattern
+        return options
+
+
+_session_cache: Dict[Tuple[str, OnnxRuntimeOptions], ort.InferenceSession] = {}
+_session_cache_lock = threading.Lock()
+
+
+def get_inference_session(
+    model_path: str,
+    runtime_options: Optional[OnnxRuntimeOptions] = None,
+) -> ort.InferenceSession:
+    """Return a process-wide InferenceSession for the model, creating it once."""
+    runtime_options = runtime_options or OnnxRuntimeOptions()
+    cache_key = (os.path.abspath(model_path), runtime_options)
+
+    with _session_cache_lock:
+        session = _session_cache.get(cache_key)
+        if session is None:
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"Model file not found: {model_path}")
+            session = ort.InferenceSession(
+                model_path,
+                sess_options=runtime_options.to_session_options(),
+                providers=list(runtime_options.providers),
+            )
+            _session_cache[cache_key] = session
+        return session
+
+
+def clear_session_cache() -> None:
+    """Drop all cached inference sessions."""
+    with _session_cache_lock:
+        _session_cache.clear()
+
 
 class BasicPitchONNX:
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, runtime_options: Optional[OnnxRuntimeOptions] = None):
         """Initialize ONNX model for Basic Pitch inference."""
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Model file not found: {model_path}")
-        
-        # Set up ONNX runtime with CPU provider (avoiding CUDA issues)
-        providers = ["CPUExecutionProvider"]
-        self.model = ort.InferenceSession(model_path, providers=providers)
+        # Sessions are cached per process, so repeated construction is cheap
+        self.model = get_inference_session(model_path, runtime_options)
     
     def predict(self, audio_input: npt.NDArray[np.float32]) -> Dict[str, npt.NDArray[np.float32]]:
         """Run inference on audio input."""
@@ -89,6 +169,144 @@ def get_audio_input(audio_path: str, overlap_len: int, hop_size: int):
         yield np.expand_dims(window, axis=0), window_time, original_length
 
 
+def decode_audio_blocks(audio_path: str, block_frames: int = STREAM_BLOCK_FRAMES) -> Iterator[npt.NDArray[np.float32]]:
+    """Decode audio in blocks, yielding mono float32 samples at AUDIO_SAMPLE_RATE."""
+    try:
+        sound_file = sf.SoundFile(audio_path)
+    except RuntimeError:
+        # libsndfile can't read this format; decode the whole file instead
+        audio, _ = librosa.load(audio_path, sr=AUDIO_SAMPLE_RATE, mono=True)
+        for i in range(0, audio.shape[0], block_frames):
+            yield audio[i : i + block_frames]
+        return
+
+    with sound_file:
+        resampler = None
+        if sound_file.samplerate != AUDIO_SAMPLE_RATE:
+            # Same soxr quality librosa.load uses by default
+            resampler = soxr.ResampleStream(
+                sound_file.samplerate, AUDIO_SAMPLE_RATE, 1, dtype="float32", quality="HQ"
+            )
+
+        for block in sound_file.blocks(blocksize=block_frames, dtype="float32", always_2d=True):
+            mono = np.mean(block, axis=1)
+            if resampler is not None:
+                mono = resampler.resample_chunk(mono)
+            if mono.shape[0] > 0:
+                yield mono
+
+        if resampler is not None:
+            tail = resampler.resample_chunk(np.zeros((0,), dtype=np.float32), last=True)
+            if tail.shape[0] > 0:
+                yield tail
+
+
+class StreamingAudioInput:
+    """Model windows produced while the audio is still being decoded.
+
+    Yields the same (window, window_time) pairs as get_audio_input, but only
+    keeps about one window of decoded audio plus the prefetch queue in memory.
+    With prefetch_windows > 0, decoding runs in a background thread so
+    inference on early windows overlaps decoding of later audio.
+    original_length is set once the whole file has been decoded.
+    """
+
+    def __init__(
+        self,
+        audio_path: str,
+        overlap_len: int,
+        hop_size: int,
+        block_frames: int = STREAM_BLOCK_FRAMES,
+        prefetch_windows: int = STREAM_PREFETCH_WINDOWS,
+    ):
+        assert overlap_len % 2 == 0, f"overlap_length must be even, got {overlap_len}"
+        self.audio_path = audio_path
+        self.overlap_len = overlap_len
+        self.hop_size = hop_size
+        self.block_frames = block_frames
+        self.prefetch_windows = prefetch_windows
+        self.original_length: Optional[int] = None
+
+    def __iter__(self):
+        if self.prefetch_windows <= 0:
+            yield from self._windows()
+            return
+
+        windows: queue.Queue = queue.Queue(maxsize=self.prefetch_windows)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    windows.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for item in self._windows():
+                    if not put(item):
+                        return
+                put(done)
+            except BaseException as e:
+                put(e)
+
+        producer = threading.Thread(target=produce, name="audio-decode", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = windows.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    def _windows(self):
+        hop_size = self.hop_size
+        # Positions are in the padded signal: overlap_len / 2 zeros, then the audio
+        buffer = np.zeros((int(self.overlap_len / 2),), dtype=np.float32)
+        buffer_start = 0
+        next_start = 0
+        decoded = 0
+
+        for block in decode_audio_blocks(self.audio_path, self.block_frames):
+            decoded += block.shape[0]
+            buffer = np.concatenate([buffer, block])
+            while next_start + AUDIO_N_SAMPLES <= buffer_start + buffer.shape[0]:
+                offset = next_start - buffer_start
+                yield self._window(buffer[offset : offset + AUDIO_N_SAMPLES], next_start)
+                next_start += hop_size
+            # Drop samples no later window needs
+            if next_start > buffer_start:
+                buffer = buffer[next_start - buffer_start :]
+                buffer_start = next_start
+
+        self.original_length = decoded
+        padded_length = int(self.overlap_len / 2) + decoded
+        while next_start < padded_length:
+            offset = next_start - buffer_start
+            window = buffer[offset : offset + AUDIO_N_SAMPLES]
+            window = np.pad(window, pad_width=[[0, AUDIO_N_SAMPLES - len(window)]])
+            yield self._window(window, next_start)
+            next_start += hop_size
+
+    @staticmethod
+    def _window(window: npt.NDArray[np.float32], start: int):
+        t_start = float(start) / AUDIO_SAMPLE_RATE
+        window_time = {
+            "start": t_start,
+            "end": t_start + (AUDIO_N_SAMPLES / AUDIO_SAMPLE_RATE),
+        }
+        return np.expand_dims(np.expand_dims(window, axis=-1), axis=0), window_time
+
+
 def unwrap_output(
     output: npt.NDArray[np.float32],
     audio_original_length: int,
@@ -121,58 +339,111 @@ def simple_note_extraction(
     frame_thresh: float = DEFAULT_FRAME_THRESHOLD,
     min_note_len: int = DEFAULT_MIN_NOTE_LEN,
     midi_tempo: float = DEFAULT_MINIMUM_MIDI_TEMPO,
+    deduplicate: bool = False,
 ) -> Tuple[pretty_midi.PrettyMIDI, List[Tuple[float, float, int, float]]]:
-    """Simple note extraction from model outputs."""
+    """Simple note extraction from model outputs.
+
+    Every onset frame above onset_thresh starts a note that lasts until the
+    frame activation drops to frame_thresh or below. Notes come out ordered by
+    pitch, then onset. With deduplicate=True, onset frames that run into the
+    same note end (a held onset) produce a single note from the earliest one.
+    """
     
     # Create MIDI object
     midi = pretty_midi.PrettyMIDI(initial_tempo=midi_tempo)
     instrument = pretty_midi.Instrument(program=0)  # Piano
+    midi.instruments.append(instrument)
     
     note_events = []
     
     # Simple peak detection approach
     time_step = 1.0 / ANNOTATIONS_FPS
+    n_frames = frames.shape[0]
+    if n_frames == 0:
+        return midi, note_events
     
-    for freq_idx in range(frames.shape[1]):
-        # Find onsets above threshold
-        onset_frames = np.where(onsets[:, freq_idx] > onset_thresh)[0]
-        
-        for onset_frame in onset_frames:
-            # Look for end of note (where frame activation drops below threshold)
-            end_frame = onset_frame + 1
-            while (end_frame < frames.shape[0] and 
-                   frames[end_frame, freq_idx] > frame_thresh):
-                end_frame += 1
-            
-            # Check minimum note length
-            if end_frame - onset_frame >= min_note_len:
-                start_time = onset_frame * time_step
-                end_time = end_frame * time_step
-                midi_note = freq_idx + MIDI_OFFSET
-                
-                # Get average amplitude for velocity
-                amplitude = np.mean(frames[onset_frame:end_frame, freq_idx])
-                velocity = int(min(127, max(1, amplitude * 127)))
-                
-                # Create MIDI note
-                note = pretty_midi.Note(
-                    velocity=velocity,
-                    pitch=midi_note,
-                    start=start_time,
-                    end=end_time,
-                )
-                instrument.notes.append(note)
-                
-                # Add to note events list
-                note_events.append((start_time, end_time, midi_note, amplitude))
+    # next_inactive[t, p]: first frame >= t whose activation is at or below
+    # frame_thresh (n_frames if none), with an extra row so t + 1 is always valid
+    frame_index = np.arange(n_frames + 1)[:, None]
+    inactive = np.ones((n_frames + 1, frames.shape[1]), dtype=bool)
+    inactive[:n_frames] = frames <= frame_thresh
+    next_inactive = np.where(inactive, frame_index, n_frames)
+    next_inactive = np.minimum.accumulate(next_inactive[::-1], axis=0)[::-1]
+    
+    # Transposed so the onsets come out pitch-major, then by frame
+    freq_idx, onset_frame = np.nonzero(onsets.T > onset_thresh)
+    end_frame = next_inactive[onset_frame + 1, freq_idx]
+    
+    keep = end_frame - onset_frame >= min_note_len
+    freq_idx, onset_frame, end_frame = freq_idx[keep], onset_frame[keep], end_frame[keep]
+    
+    if deduplicate and len(onset_frame) > 0:
+        # Held onsets of one note are adjacent and share (pitch, end); keep the first
+        first = np.ones(len(onset_frame), dtype=bool)
+        first[1:] = (freq_idx[1:] != freq_idx[:-1]) | (end_frame[1:] != end_frame[:-1])
+        freq_idx, onset_frame, end_frame = freq_idx[first], onset_frame[first], end_frame[first]
+    
+    if deduplicate:
+        # Average amplitude over [onset, end) from per-pitch running sums
+        cumulative = np.zeros((n_frames + 1, frames.shape[1]), dtype=np.float64)
+        np.cumsum(frames, axis=0, dtype=np.float64, out=cumulative[1:])
+        amplitude = (
+            (cumulative[end_frame, freq_idx] - cumulative[onset_frame, freq_idx])
+            / (end_frame - onset_frame)
+        ).astype(frames.dtype)
+        velocity = np.clip(amplitude.astype(np.float64) * 127, 1, 127).astype(np.int64).tolist()
+    else:
+        # Per-note mean and velocity exactly as the original extractor computed them
+        amplitude = [
+            np.mean(frames[onset:end, pitch])
+            for onset, end, pitch in zip(onset_frame.tolist(), end_frame.tolist(), freq_idx.tolist())
+        ]
+        velocity = [int(min(127, max(1, amp * 127))) for amp in amplitude]
+    
+    start_time = onset_frame * time_step
+    end_time = end_frame * time_step
+    midi_note = freq_idx + MIDI_OFFSET
+    
+    for start, end, pitch, vel, amp in zip(
+        start_time.tolist(), end_time.tolist(), midi_note.tolist(), velocity, amplitude
+    ):
+        instrument.notes.append(pretty_midi.Note(velocity=vel, pitch=pitch, start=start, end=end))
+        note_events.append((start, end, pitch, amp))
     
-    midi.instruments.append(instrument)
     return midi, note_events
 
 
-def run_inference(audio_path: str, model_path: str) -> Dict[str, np.array]:
-    """Run Basic Pitch inference on audio file."""
-    model = BasicPitchONNX(model_path)
+def available_memory_bytes() -> Optional[int]:
+    """Currently available physical memory, or None if it can't be determined."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def auto_batch_size() -> int:
+    """Pick a window batch size that fits in a quarter of the available memory."""
+    available = available_memory_bytes()
+    if available is None:
+        return 8
+    return int(max(1, min(MAX_AUTO_BATCH_SIZE, available // 4 // ESTIMATED_BYTES_PER_WINDOW)))
+
+
+def run_inference(
+    audio_path: str,
+    model_path: str,
+    runtime_options: Optional[OnnxRuntimeOptions] = None,
+    batch_size: int = 0,
+) -> Dict[str, np.array]:
+    """Run Basic Pitch inference on audio file.
+
+    Windows are stacked into [batch_size, AUDIO_N_SAMPLES, 1] tensors so the
+    model runs once per batch instead of once per window. batch_size=0 picks
+    the size from available memory; batch_size=1 is the unbatched path.
+    """
+    model = BasicPitchONNX(model_path, runtime_options)
+    if batch_size <= 0:
+        batch_size = auto_batch_size()
     
     # Setup windowing parameters
     n_overlapping_frames = DEFAULT_OVERLAPPING_FRAMES
@@ -181,13 +452,23 @@ def run_inference(audio_path: str, model_path: str) -> Dict[str, np.array]:
     
     output = {"note": [], "onset": [], "contour": []}
     
-    for audio_windowed, _, audio_original_length in get_audio_input(
-        audio_path, overlap_len, hop_size
-    ):
-        predictions = model.predict(audio_windowed)
+    def run_batch(windows: List[npt.NDArray[np.float32]]) -> None:
+        batch = windows[0] if len(windows) == 1 else np.concatenate(windows)
+        predictions = model.predict(batch)
         for k, v in predictions.items():
             output[k].append(v)
     
+    audio_input = StreamingAudioInput(audio_path, overlap_len, hop_size)
+    pending = []
+    for audio_windowed, _ in audio_input:
+        pending.append(audio_windowed)
+        if len(pending) == batch_size:
+            run_batch(pending)
+            pending = []
+    if pending:
+        run_batch(pending)
+    audio_original_length = audio_input.original_length
+    
     # Unwrap outputs
     unwrapped_output = {
         k: unwrap_output(
@@ -208,13 +489,16 @@ def predict_basic_pitch(
     frame_threshold: float = DEFAULT_FRAME_THRESHOLD,
     minimum_note_length_ms: float = 127.7,
     midi_tempo: float = DEFAULT_MINIMUM_MIDI_TEMPO,
+    runtime_options: Optional[OnnxRuntimeOptions] = None,
+    batch_size: int = 0,
+    deduplicate_onsets: bool = False,
 ) -> Tuple[Dict[str, np.array], pretty_midi.PrettyMIDI, List[Tuple[float, float, int, float]]]:
     """Predict MIDI from audio using Basic Pitch ONNX model."""
     
     print(f"Running Basic Pitch inference on {audio_path}...")
     
     # Run model inference
-    model_output = run_inference(audio_path, model_path)
+    model_output = run_inference(audio_path, model_path, runtime_options, batch_size)
     
     # Convert minimum note length from ms to frames
     min_note_len = int(np.round(
@@ -229,6 +513,7 @@ def predict_basic_pitch(
         frame_thresh=frame_threshold,
         min_note_len=min_note_len,
         midi_tempo=midi_tempo,
+        deduplicate=deduplicate_onsets,
     )
     
     return model_output, midi_data, note_events
\ No newline at end of file
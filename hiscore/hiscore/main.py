@@ -50,16 +50,15 @@ def parse_args()->Arguments:
 
 def audio_separation(args: Arguments, target: TranscriptMode, temp_folder: str):
     # Use Demucs for simpler and more reliable audio separation
-    from demucs import pretrained
     from demucs.apply import apply_model
+    from model_pool import default_device, get_separation_model
     import torch
     import torchaudio
     
-    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    device = default_device()
     
-    # Load pre-trained Demucs model  
-    model = pretrained.get_model('htdemucs')
-    model.to(device)
+    # Pre-trained Demucs model, loaded once per process
+    model = get_separation_model('htdemucs', device)
     
     # Load and process audio
     waveform, sample_rate = torchaudio.load(args.input_audio)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# Process-wide pool of loaded Demucs separation models
+# Keeps models resident between jobs so each worker process loads a model once
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_SEPARATION_MODEL = "htdemucs"
+
+
+def default_device() -> str:
+    """Pick the device separation models should run on."""
+    import torch
+    return 'cuda' if torch.cuda.is_available() else 'cpu'
+
+
+def model_size_bytes(model) -> int:
+    """Approximate resident size of a torch model (parameters + buffers)."""
+    size = 0
+    for tensor in list(model.parameters()) + list(model.buffers()):
+        size += tensor.numel() * tensor.element_size()
+    return size
+
+
+class SeparationModelPool:
+    """LRU cache of loaded separation models with a memory budget.
+
+    Models are keyed by (model name, device). When loading a new model would
+    push the resident size over the budget, the least recently used models are
+    evicted first. A model larger than the whole budget is still kept, alone.
+    """
+
+    def __init__(self, memory_budget_bytes: Optional[int] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            memory_budget_bytes: Maximum resident model size (None or 0 = unlimited)
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self._models: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._loads: Dict[str, int] = {}
+        self._hits: Dict[str, int] = {}
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def configure(self, memory_budget_bytes: Optional[int] = None) -> None:
+        """Change the memory budget, evicting models that no longer fit."""
+        with self._lock:
+            self.memory_budget_bytes = memory_budget_bytes
+            self._evict_until_fits(0)
+
+    def get(self, name: str = DEFAULT_SEPARATION_MODEL, device: Optional[str] = None):
+        """Return a loaded model, loading it on first use."""
+        device = str(device or default_device())
+        key = (name, device)
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self._hits[name] = self._hits.get(name, 0) + 1
+                return model
+
+            start = time.perf_counter()
+            model = self._load(name, device)
+            size = model_size_bytes(model)
+            self._evict_until_fits(size)
+
+            self._models[key] = model
+            self._sizes[key] = size
+            self._loads[name] = self._loads.get(name, 0) + 1
+
+            print(
+                f"Loaded separation model {name} on {device} "
+                f"({size / 2**20:.0f} MB, {time.perf_counter() - start:.1f}s, pid {os.getpid()})"
+            )
+            return model
+
+    def preload(self, names: List[str], device: Optional[str] = None) -> None:
+        """Load models ahead of the first job; a model that fails to load is skipped."""
+        for name in names:
+            try:
+                self.get(name, device)
+            except Exception as e:
+                print(f"Warning: Failed to preload separation model {name}: {e}")
+
+    def clear(self) -> None:
+        """Drop every resident model."""
+        with self._lock:
+            self._models.clear()
+            self._sizes.clear()
+
+    @property
+    def resident_bytes(self) -> int:
+        """Total size of resident models."""
+        return sum(self._sizes.values())
+
+    def stats(self) -> Dict[str, object]:
+        """Load/hit counters and residency information for this process."""
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'loads': dict(self._loads),
+                'hits': dict(self._hits),
+                'evictions': self._evictions,
+                'resident_models': [f"{name}@{device}" for name, device in self._models],
+                'resident_bytes': self.resident_bytes,
+                'budget_bytes': self.memory_budget_bytes,
+            }
+
+    def _load(self, name: str, device: str):
+        from demucs import pretrained
+
+        model = pretrained.get_model(name)
+        model.to(device)
+        model.eval()
+        return model
+
+    def _evict_until_fits(self, incoming_bytes: int) -> None:
+        if not self.memory_budget_bytes:
+            return
+        while self._models and self.resident_bytes + incoming_bytes > self.memory_budget_bytes:
+            key, _ = self._models.popitem(last=False)
+            del self._sizes[key]
+            self._evictions += 1
+            print(f"Evicted separation model {key[0]} on {key[1]} (pid {os.getpid()})")
+
+
+_default_pool = SeparationModelPool()
+
+
+def get_model_pool() -> SeparationModelPool:
+    """Return the process-wide separation model pool."""
+    return _default_pool
+
+
+def get_separation_model(name: str = DEFAULT_SEPARATION_MODEL, device: Optional[str] = None):
+    """Return a resident separation model from the process-wide pool."""
+    return _default_pool.get(name, device)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# On-disk cache of separated stems
+# A separation run computes every stem of the model, so all of them are kept,
+# keyed by audio content hash, model name and model version
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .model_pool import DEFAULT_SEPARATION_MODEL, default_device, get_separation_model
+
+MANIFEST_NAME = "stems.json"
+DEFAULT_CACHE_DIR = "./cache/stems"
+DEFAULT_SEGMENT_SECONDS = 60.0
+DEFAULT_OVERLAP_SECONDS = 1.0
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Content hash of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def separation_model_version() -> str:
+    """Version tag for cached stems; pretrained weights ship with the demucs release."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return f"demucs-{version('demucs')}"
+    except PackageNotFoundError:
+        return "demucs-unknown"
+
+
+class _AudioReader:
+    """Random-access frames of an audio file as float32 [channels, frames]."""
+
+    def __init__(self, audio_path: str):
+        import soundfile as sf
+
+        self._file = None
+        self._audio = None
+        try:
+            self._file = sf.SoundFile(audio_path)
+            self.sample_rate = self._file.samplerate
+            self.frames = self._file.frames
+        except RuntimeError:
+            # Formats libsndfile can't read (e.g. m4a): decode the whole file once
+            import torchaudio
+
+            waveform, self.sample_rate = torchaudio.load(audio_path)
+            self._audio = waveform.numpy()
+            self.frames = self._audio.shape[1]
+
+    def read(self, start: int, n_frames: int) -> np.ndarray:
+        if self._audio is not None:
+            audio = self._audio[:, start : start + n_frames]
+        else:
+            self._file.seek(start)
+            audio = self._file.read(n_frames, dtype="float32", always_2d=True).T
+        if audio.shape[0] == 1:  # Convert mono to stereo
+            audio = np.repeat(audio, 2, axis=0)
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _separate_segment(model, segment: np.ndarray, device: str) -> np.ndarray:
+    """Separate one [channels, frames] segment into [stems, channels, frames]."""
+    from demucs.apply import apply_model
+    import torch
+
+    waveform = torch.from_numpy(segment).to(device)
+    with torch.no_grad():
+        sources = apply_model(model, waveform.unsqueeze(0))
+    return sources[0].cpu().numpy()
+
+
+def separate_to_dir(
+    audio_path: str,
+    output_dir: Path,
+    model_name: str = DEFAULT_SEPARATION_MODEL,
+    device: Optional[str] = None,
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[Dict[str, Path], int]:
+    """
+    Run separation and write every stem of the model as WAV into output_dir.
+
+    The audio is read and separated in segments of segment_seconds, each
+    extended by overlap_seconds into the next one. Overlapping regions are
+    stitched with a linear crossfade and every stem is appended to its file as
+    soon as a segment is done, so memory use depends on the segment length,
+    not the track length. segment_seconds=0 separates the track in one piece.
+
+    Args:
+        audio_path: Input audio file
+        output_dir: Directory for the stem WAVs
+        model_name: Separation model
+        device: Device to separate on
+        segment_seconds: Segment length (0 = whole track)
+        overlap_seconds: Crossfade length between segments
+        progress: Called with (segments done, total segments) after each segment
+
+    Returns:
+        Mapping of stem name to WAV path, and the sample rate
+    """
+    import soundfile as sf
+
+    device = device or default_device()
+    model = get_separation_model(model_name, device)
+
+    reader = _AudioReader(audio_path)
+    sample_rate = reader.sample_rate
+    total_frames = reader.frames
+    hop = int(segment_seconds * sample_rate) if segment_seconds > 0 else max(total_frames, 1)
+    overlap = min(int(overlap_seconds * sample_rate), hop) if segment_seconds > 0 else 0
+    # Segment i is the last one once it reaches the end of the track
+    n_segments = max(1, -(-(total_frames - overlap) // hop))
+
+    stems = {stem: output_dir / f"{stem}.wav" for stem in model.sources}
+    writers = [
+        sf.SoundFile(str(path), "w", samplerate=sample_rate, channels=2, format="WAV", subtype="FLOAT")
+        for path in stems.values()
+    ]
+    try:
+        fade_in = np.linspace(0.0, 1.0, overlap, endpoint=False, dtype=np.float32)
+        tail = None  # previous segment's output over the current overlap region
+
+        for index in range(n_segments):
+            start = index * hop
+            last = start + hop + overlap >= total_frames
+            sources = _separate_segment(model, reader.read(start, hop + overlap), device)
+
+            if tail is not None:
+                n = min(tail.shape[-1], sources.shape[-1])
+                weight = fade_in[:n]
+                sources[..., :n] = tail[..., :n] * (1.0 - weight) + sources[..., :n] * weight
+
+            if last:
+                chunk, tail = sources, None
+            else:
+                chunk, tail = sources[..., :hop], sources[..., hop:].copy()
+
+            for stem_idx, writer in enumerate(writers):
+                writer.write(chunk[stem_idx].T)
+
+            if progress is not None:
+                progress(index + 1, n_segments)
+            if last:
+                break
+    finally:
+        for writer in writers:
+            writer.close()
+        reader.close()
+
+    return stems, sample_rate
+
+
+class StemCache:
+    """Separated stems on disk with size-based LRU eviction.
+
+    Entries live in {cache_dir}/{model}/{version}/{sha256}/ with one WAV per
+    stem and a manifest, written to a temporary directory and renamed into
+    place so readers never see a partial entry. Hits refresh the manifest's
+    mtime; when the cache grows past max_bytes the least recently used
+    entries are removed.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Root directory for cached stems
+            max_bytes: Maximum total size of cached stems (None or 0 = unlimited)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def configure(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        """Change the cache location and size limit."""
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def entry_dir(self, sha256: str, model_name: str) -> Path:
+        return self.cache_dir / model_name / separation_model_version() / sha256
+
+    def get(self, sha256: str, model_name: str = DEFAULT_SEPARATION_MODEL) -> Optional[Dict[str, Path]]:
+        """Return cached stem paths for the audio, or None on a miss."""
+        entry = self.entry_dir(sha256, model_name)
+        manifest_path = entry / MANIFEST_NAME
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            stems = {stem: entry / name for stem, name in manifest["stems"].items()}
+            if not all(path.is_file() for path in stems.values()):
+                return None
+            os.utime(manifest_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return stems
+
+    def get_or_separate(
+        self,
+        audio_path: str,
+        model_name: str = DEFAULT_SEPARATION_MODEL,
+        device: Optional[str] = None,
+        sha256: Optional[str] = None,
+        segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Path]:
+        """
+        Return all stems of the audio, separating only on a cache miss.
+
+        Args:
+            audio_path: Input audio file
+            model_name: Separation model
+            device: Device to separate on
+            sha256: Content hash of the audio if already known
+            segment_seconds: Separation segment length (0 = whole track)
+            overlap_seconds: Crossfade length between segments
+            progress: Called with (segments done, total segments) while separating
+
+        Returns:
+            Mapping of stem name (e.g. 'bass') to cached WAV path
+        """
+        sha256 = sha256 or file_sha256(audio_path)
+        stems = self.get(sha256, model_name)
+        if stems is not None:
+            print(f"Stem cache hit for {sha256[:12]} ({model_name})")
+            return stems
+
+        entry = self.entry_dir(sha256, model_name)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = entry.parent / f".{sha256}.{uuid.uuid4().hex}.tmp"
+        tmp_dir.mkdir()
+        try:
+            separated, sample_rate = separate_to_dir(
+                audio_path, tmp_dir, model_name, device,
+                segment_seconds=segment_seconds,
+                overlap_seconds=overlap_seconds,
+                progress=progress,
+            )
+            manifest = {
+                "sha256": sha256,
+                "model": model_name,
+                "version": separation_model_version(),
+                "sample_rate": sample_rate,
+                "stems": {stem: path.name for stem, path in separated.items()},
+            }
+            with open(tmp_dir / MANIFEST_NAME, "w") as f:
+                json.dump(manifest, f)
+            try:
+                tmp_dir.rename(entry)
+            except OSError:
+                # Another worker cached the same audio first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self.evict(keep=entry)
+        stems = self.get(sha256, model_name)
+        if stems is None:
+            raise RuntimeError(f"Stem cache entry for {sha256} disappeared after writing")
+        return stems
+
+    def entries(self):
+        """(last used, size in bytes, path) for every complete cache entry."""
+        result = []
+        for manifest_path in self.cache_dir.glob(f"*/*/*/{MANIFEST_NAME}"):
+            entry = manifest_path.parent
+            try:
+                size = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+                result.append((manifest_path.stat().st_mtime, size, entry))
+            except OSError:
+                continue
+        return result
+
+    def size_bytes(self) -> int:
+        """Total size of cached stems."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        if not self.max_bytes:
+            return
+        with self._lock:
+            entries = sorted(self.entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in entries:
+                if total <= self.max_bytes:
+                    break
+                if keep is not None and entry == keep:
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+                print(f"Evicted cached stems {entry}")
+
+
+_default_cache = StemCache()
+
+
+def get_stem_cache() -> StemCache:
+    """Return the process-wide stem cache."""
+    return _default_cache
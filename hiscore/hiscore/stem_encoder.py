@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# Compressed encoding of separated stems (Opus via ffmpeg, FLAC via libsndfile)
+# Encodes run in a thread pool; ffmpeg and libsndfile do the work outside the GIL
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+SUPPORTED_FORMATS = ("opus", "flac", "wav")
+
+
+@dataclass
+class EncodedStem:
+    """An encoded stem file and what it actually ended up as."""
+    path: Path
+    format: str
+    size_bytes: int
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link source to target, copying when linking isn't possible."""
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class StemEncoder:
+    """Thread pool that encodes WAV stems to Opus, FLAC or plain WAV.
+
+    Opus needs an ffmpeg binary with libopus; without one, Opus requests fall
+    back to FLAC and the returned EncodedStem reports the format used.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        opus_bitrate_kbps: int = 160,
+        flac_compression_level: int = 5,
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            max_workers: Concurrent encodes
+            opus_bitrate_kbps: Opus target bitrate for a stereo stem
+            flac_compression_level: FLAC compression level (0-8)
+        """
+        self.max_workers = max_workers
+        self.opus_bitrate_kbps = opus_bitrate_kbps
+        self.flac_compression_level = flac_compression_level
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def configure(
+        self,
+        max_workers: Optional[int] = None,
+        opus_bitrate_kbps: Optional[int] = None,
+        flac_compression_level: Optional[int] = None,
+    ) -> None:
+        """Change encoder settings; a new worker count applies to the next pool."""
+        if max_workers is not None and max_workers != self.max_workers:
+            self.max_workers = max_workers
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        if opus_bitrate_kbps is not None:
+            self.opus_bitrate_kbps = opus_bitrate_kbps
+        if flac_compression_level is not None:
+            self.flac_compression_level = flac_compression_level
+
+    def submit(self, wav_path: Path, output_base: Path, format: str = "opus") -> "Future[EncodedStem]":
+        """
+        Queue an encode and return its future.
+
+        Args:
+            wav_path: Source WAV
+            output_base: Output path without extension
+            format: 'opus', 'flac' or 'wav'
+        """
+        if self._executor is None:
+            # Created lazily so forked worker processes get their own threads
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stem-encode")
+        return self._executor.submit(self.encode, Path(wav_path), Path(output_base), format)
+
+    def encode(self, wav_path: Path, output_base: Path, format: str = "opus") -> EncodedStem:
+        """Encode a stem synchronously."""
+        if format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported stem format: {format}")
+
+        if format == "opus" and shutil.which("ffmpeg") is None:
+            print("Warning: ffmpeg not found, encoding stems as FLAC instead of Opus")
+            format = "flac"
+
+        output_path = output_base.with_name(f"{output_base.name}.{format}")
+        if format == "opus":
+            self._encode_opus(wav_path, output_path)
+        elif format == "flac":
+            self._encode_flac(wav_path, output_path)
+        else:
+            link_or_copy(wav_path, output_path)
+
+        return EncodedStem(path=output_path, format=format, size_bytes=output_path.stat().st_size)
+
+    def _encode_opus(self, wav_path: Path, output_path: Path) -> None:
+        subprocess.run(
+            [
+                "ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+                "-i", str(wav_path),
+                "-c:a", "libopus",
+                "-b:a", f"{self.opus_bitrate_kbps}k",
+                "-vbr", "on",
+                "-application", "audio",
+                str(output_path),
+            ],
+            check=True,
+            capture_output=True,
+        )
+
+    def _encode_flac(self, wav_path: Path, output_path: Path, block_frames: int = 1 << 18) -> None:
+        import soundfile as sf
+
+        with sf.SoundFile(str(wav_path)) as source, sf.SoundFile(
+            str(output_path), "w",
+            samplerate=source.samplerate,
+            channels=source.channels,
+            format="FLAC",
+            subtype="PCM_24",
+            compression_level=self.flac_compression_level / 8,
+        ) as target:
+            for block in source.blocks(blocksize=block_frames, dtype="float32"):
+                target.write(block)
+
+
+_default_encoder = StemEncoder()
+
+
+def get_stem_encoder() -> StemEncoder:
+    """Return the process-wide stem encoder."""
+    return _default_encoder
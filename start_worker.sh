@@ -2,4 +2,4 @@
 
 # Start the Celery worker
 echo "Starting Celery worker..."
-celery -A app.celery_app worker --loglevel=info --concurrency=2
+celery -A app.celery_app worker --loglevel=info --concurrency=2 -Q celery,separation,analysis
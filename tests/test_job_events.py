@@ -0,0 +1,40 @@
+"""Tests for job status snapshots and the job progress stream."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.schemas import JobStatus
+
+
+def test_revoked_job_is_failed() -> None:
+    """A revoked task reports a terminal failed status."""
+    response = main.job_status_response('job-1', 'REVOKED')
+    assert response.status == JobStatus.FAILED
+    assert response.error.code == "TASK_REVOKED"
+
+
+def test_event_stream_closes_for_revoked_job(monkeypatch) -> None:
+    """A client connecting after a job was revoked gets one event and the stream ends."""
+    async def subscribe(job_id: str) -> asyncio.Queue:
+        # A later progress event, then the end of the subscription
+        queue = asyncio.Queue()
+        queue.put_nowait({'jobId': job_id, 'state': 'PROGRESS', 'meta': {'percent': 50}})
+        queue.put_nowait(None)
+        return queue
+
+    monkeypatch.setattr(main.progress_broker, 'subscribe', subscribe)
+    monkeypatch.setattr(main.progress_broker, 'unsubscribe', lambda job_id, queue: None)
+    monkeypatch.setattr(
+        main, 'get_job_status_from_celery',
+        lambda job_id: main.job_status_response(job_id, 'REVOKED'),
+    )
+
+    with TestClient(main.app) as client:
+        response = client.get('/tasks/events/job-1')
+
+    assert response.status_code == 200
+    assert response.text.count('event: status') == 1
+    assert '"status":"failed"' in response.text
+    assert '"progressPercent"' not in response.text